@@ -0,0 +1,24 @@
+import numpy as np
+
+from pyrender.misc.indexed_field import IndexedField
+
+class ColorField(IndexedField):
+    """ RGBA colors of a mesh stored on the domain they are defined on.
+
+    A uniform field holds a single color, vertex and face fields hold one
+    color per vertex or face and corner fields one color per face corner.
+    Backends should use the field as is when they can, to_corners() expands
+    it to the (num_faces, vertex_per_face, 4) layout of vertex_colors.
+    """
+    def __init__(self, domain, values, faces):
+        values = np.asarray(values, dtype=float);
+        if domain == self.UNIFORM:
+            values = values.reshape(4);
+        elif domain != self.CORNER:
+            values = values.reshape((-1, 4));
+        super(ColorField, self).__init__(domain, values, faces);
+
+    @property
+    def uniform_color(self):
+        assert(self.is_uniform);
+        return self.values;
@@ -1,38 +1,112 @@
-from bisect import bisect
+import numpy as np
 
 from .Color import Color
-from .PredefinedColorMaps import color_maps
+from .PredefinedColorMaps import load_color_map
 
 class ColorMap:
-    def __init__(self, color_map_name):
+    def __init__(self, color_map_name, resolution=None):
+        """ If resolution is set, colors are looked up in a table of that many
+        uniformly spaced samples instead of being interpolated exactly.
+        """
         self.color_map_name = color_map_name;
-        assert(color_map_name in color_maps);
-        colors = color_maps[color_map_name];
-        self.colors = {};
-        for key,val in colors.items():
-            self.add_color(key, Color(*val));
+        self.resolution = resolution;
+        data = load_color_map(color_map_name);
+        self.keys = data[:, 0];
+        self.key_colors = data[:, 1:];
+        self.__lut = None;
 
     def add_color(self, value, color):
-        self.colors[value] = color;
+        index = np.searchsorted(self.keys, value);
+        if index < len(self.keys) and self.keys[index] == value:
+            self.key_colors = self.key_colors.copy();
+            self.key_colors[index] = color.color;
+        else:
+            self.keys = np.insert(self.keys, index, value);
+            self.key_colors = np.insert(self.key_colors, index, color.color,
+                    axis=0);
+        self.__lut = None;
 
     def get_color(self, value):
-        values = sorted(self.colors.keys());
+        return Color(*self.get_colors(np.array([value], dtype=float))[0]);
 
-        location = bisect(values, value);
-        if location <= 0:
-            return self.colors[values[0]];
-        if location > len(values) - 1:
-            return self.colors[values[-1]];
+    def get_colors(self, values, out=None):
+        """ Evaluate the color map at each entry of values.
 
-        prev_val = values[location-1];
-        next_val = values[location];
-        return self.__interpolate_color(value, prev_val, next_val)
+        Returns an array of shape values.shape + (4,), written into out if
+        given.  Values outside of the key range are clamped to the first or
+        last key color.
+        """
+        values = np.asarray(values, dtype=float);
+        keys, key_colors = self.__get_lut();
+        if out is None:
+            colors = np.empty(values.shape + (4,));
+        else:
+            colors = out;
+        if self.resolution is None:
+            self.__interpolate(values, keys, key_colors, colors);
+        else:
+            value_range = keys[-1] - keys[0];
+            if value_range > 0.0:
+                index = (values - keys[0]) * ((len(keys) - 1) / value_range);
+                np.clip(index, 0, len(keys) - 1, out=index);
+                index += 0.5;
+            else:
+                index = np.zeros(values.shape);
+            # NaN has no table entry, it gives NaN colors as interpolation.
+            invalid = np.isnan(index);
+            index[invalid] = 0.0;
+            np.take(key_colors, index.astype(int), axis=0, out=colors);
+            colors[invalid] = np.nan;
+        return colors;
 
-    def __interpolate_color(self, val, prev_val, next_val):
-        frac = (val - prev_val) / (next_val - prev_val);
-        return self.colors[prev_val] * (1.0 -frac) +\
-                self.colors[next_val] * frac;
+    def __interpolate(self, values, keys, key_colors, colors):
+        """ Linear interpolation of all four channels at once.  The key
+        interval of each value is searched only once and the colors are
+        written in place as offset + slope * value.
+        """
+        if len(keys) == 1:
+            colors[...] = key_colors[0];
+            return;
+        index = np.searchsorted(keys, values, side="right") - 1;
+        np.clip(index, 0, len(keys) - 2, out=index);
+        spans = np.diff(keys);
+        spans[spans <= 0.0] = np.inf;
+        slopes = np.diff(key_colors, axis=0) / spans[:, np.newaxis];
+        offsets = key_colors[:-1] - keys[:-1, np.newaxis] * slopes;
+
+        np.take(offsets, index, axis=0, out=colors);
+        terms = np.take(slopes, index, axis=0);
+        terms *= np.clip(values, keys[0], keys[-1])[..., np.newaxis];
+        colors += terms;
+
+    def __get_lut(self):
+        """ Return sorted keys and the corresponding (N, 4) color array.
+        """
+        if self.__lut is None:
+            keys = self.keys;
+            key_colors = self.key_colors;
+            if self.resolution is not None:
+                samples = np.linspace(keys[0], keys[-1], self.resolution);
+                key_colors = np.array([
+                    np.interp(samples, keys, key_colors[:, i])
+                    for i in range(4)]).T;
+                keys = samples;
+            self.__lut = (keys, key_colors);
+        return self.__lut;
 
     @property
     def num_key_colors(self):
-        return len(self.colors);
+        return len(self.keys);
+
+_color_map_registry = {};
+
+def get_color_map(color_map_name, resolution=None):
+    """ Return the shared ColorMap instance for color_map_name.  Instances are
+    created once per process, so they should not be modified by callers.
+    """
+    key = (color_map_name, resolution);
+    color_map = _color_map_registry.get(key);
+    if color_map is None:
+        color_map = ColorMap(color_map_name, resolution);
+        _color_map_registry[key] = color_map;
+    return color_map;
@@ -1,5 +1,8 @@
 import numpy as np
-from bisect import bisect
+import os.path
+
+COLOR_MAP_FILE = os.path.join(os.path.dirname(__file__), "color_maps.npz");
+
 def hex2rgb(c, alpha=1.0):
     c = c.lstrip("#");
     assert(len(c) == 6);
@@ -12,1311 +15,38 @@ def int2rgb(c, alpha=1.0):
     assert(len(c) == 3);
     return [c[0]/255.0, c[1]/255.0, c[2]/255.0, alpha];
 
-color_maps = {
-        "viridis": {
-            0.0: (0.267004, 0.004874, 0.329415, 1.0),
-            0.00392156862745098: (0.26851, 0.009605, 0.335427, 1.0),
-            0.00784313725490196: (0.269944, 0.014625, 0.341379, 1.0),
-            0.011764705882352941: (0.271305, 0.019942, 0.347269, 1.0),
-            0.01568627450980392: (0.272594, 0.025563, 0.353093, 1.0),
-            0.0196078431372549: (0.273809, 0.031497, 0.358853, 1.0),
-            0.023529411764705882: (0.274952, 0.037752, 0.364543, 1.0),
-            0.027450980392156862: (0.276022, 0.044167, 0.370164, 1.0),
-            0.03137254901960784: (0.277018, 0.050344, 0.375715, 1.0),
-            0.03529411764705882: (0.277941, 0.056324, 0.381191, 1.0),
-            0.0392156862745098: (0.278791, 0.062145, 0.386592, 1.0),
-            0.043137254901960784: (0.279566, 0.067836, 0.391917, 1.0),
-            0.047058823529411764: (0.280267, 0.073417, 0.397163, 1.0),
-            0.050980392156862744: (0.280894, 0.078907, 0.402329, 1.0),
-            0.054901960784313725: (0.281446, 0.08432, 0.407414, 1.0),
-            0.058823529411764705: (0.281924, 0.089666, 0.412415, 1.0),
-            0.06274509803921569: (0.282327, 0.094955, 0.417331, 1.0),
-            0.06666666666666667: (0.282656, 0.100196, 0.42216, 1.0),
-            0.07058823529411765: (0.28291, 0.105393, 0.426902, 1.0),
-            0.07450980392156863: (0.283091, 0.110553, 0.431554, 1.0),
-            0.0784313725490196: (0.283197, 0.11568, 0.436115, 1.0),
-            0.08235294117647059: (0.283229, 0.120777, 0.440584, 1.0),
-            0.08627450980392157: (0.283187, 0.125848, 0.44496, 1.0),
-            0.09019607843137255: (0.283072, 0.130895, 0.449241, 1.0),
-            0.09411764705882353: (0.282884, 0.13592, 0.453427, 1.0),
-            0.09803921568627451: (0.282623, 0.140926, 0.457517, 1.0),
-            0.10196078431372549: (0.28229, 0.145912, 0.46151, 1.0),
-            0.10588235294117647: (0.281887, 0.150881, 0.465405, 1.0),
-            0.10980392156862745: (0.281412, 0.155834, 0.469201, 1.0),
-            0.11372549019607843: (0.280868, 0.160771, 0.472899, 1.0),
-            0.11764705882352941: (0.280255, 0.165693, 0.476498, 1.0),
-            0.12156862745098039: (0.279574, 0.170599, 0.479997, 1.0),
-            0.12549019607843137: (0.278826, 0.17549, 0.483397, 1.0),
-            0.12941176470588237: (0.278012, 0.180367, 0.486697, 1.0),
-            0.13333333333333333: (0.277134, 0.185228, 0.489898, 1.0),
-            0.13725490196078433: (0.276194, 0.190074, 0.493001, 1.0),
-            0.1411764705882353: (0.275191, 0.194905, 0.496005, 1.0),
-            0.1450980392156863: (0.274128, 0.199721, 0.498911, 1.0),
-            0.14901960784313725: (0.273006, 0.20452, 0.501721, 1.0),
-            0.15294117647058825: (0.271828, 0.209303, 0.504434, 1.0),
-            0.1568627450980392: (0.270595, 0.214069, 0.507052, 1.0),
-            0.1607843137254902: (0.269308, 0.218818, 0.509577, 1.0),
-            0.16470588235294117: (0.267968, 0.223549, 0.512008, 1.0),
-            0.16862745098039217: (0.26658, 0.228262, 0.514349, 1.0),
-            0.17254901960784313: (0.265145, 0.232956, 0.516599, 1.0),
-            0.17647058823529413: (0.263663, 0.237631, 0.518762, 1.0),
-            0.1803921568627451: (0.262138, 0.242286, 0.520837, 1.0),
-            0.1843137254901961: (0.260571, 0.246922, 0.522828, 1.0),
-            0.18823529411764706: (0.258965, 0.251537, 0.524736, 1.0),
-            0.19215686274509805: (0.257322, 0.25613, 0.526563, 1.0),
-            0.19607843137254902: (0.255645, 0.260703, 0.528312, 1.0),
-            0.2: (0.253935, 0.265254, 0.529983, 1.0),
-            0.20392156862745098: (0.252194, 0.269783, 0.531579, 1.0),
-            0.20784313725490197: (0.250425, 0.27429, 0.533103, 1.0),
-            0.21176470588235294: (0.248629, 0.278775, 0.534556, 1.0),
-            0.21568627450980393: (0.246811, 0.283237, 0.535941, 1.0),
-            0.2196078431372549: (0.244972, 0.287675, 0.53726, 1.0),
-            0.2235294117647059: (0.243113, 0.292092, 0.538516, 1.0),
-            0.22745098039215686: (0.241237, 0.296485, 0.539709, 1.0),
-            0.23137254901960785: (0.239346, 0.300855, 0.540844, 1.0),
-            0.23529411764705882: (0.237441, 0.305202, 0.541921, 1.0),
-            0.23921568627450981: (0.235526, 0.309527, 0.542944, 1.0),
-            0.24313725490196078: (0.233603, 0.313828, 0.543914, 1.0),
-            0.24705882352941178: (0.231674, 0.318106, 0.544834, 1.0),
-            0.25098039215686274: (0.229739, 0.322361, 0.545706, 1.0),
-            0.2549019607843137: (0.227802, 0.326594, 0.546532, 1.0),
-            0.25882352941176473: (0.225863, 0.330805, 0.547314, 1.0),
-            0.2627450980392157: (0.223925, 0.334994, 0.548053, 1.0),
-            0.26666666666666666: (0.221989, 0.339161, 0.548752, 1.0),
-            0.27058823529411763: (0.220057, 0.343307, 0.549413, 1.0),
-            0.27450980392156865: (0.21813, 0.347432, 0.550038, 1.0),
-            0.2784313725490196: (0.21621, 0.351535, 0.550627, 1.0),
-            0.2823529411764706: (0.214298, 0.355619, 0.551184, 1.0),
-            0.28627450980392155: (0.212395, 0.359683, 0.55171, 1.0),
-            0.2901960784313726: (0.210503, 0.363727, 0.552206, 1.0),
-            0.29411764705882354: (0.208623, 0.367752, 0.552675, 1.0),
-            0.2980392156862745: (0.206756, 0.371758, 0.553117, 1.0),
-            0.30196078431372547: (0.204903, 0.375746, 0.553533, 1.0),
-            0.3058823529411765: (0.203063, 0.379716, 0.553925, 1.0),
-            0.30980392156862746: (0.201239, 0.38367, 0.554294, 1.0),
-            0.3137254901960784: (0.19943, 0.387607, 0.554642, 1.0),
-            0.3176470588235294: (0.197636, 0.391528, 0.554969, 1.0),
-            0.3215686274509804: (0.19586, 0.395433, 0.555276, 1.0),
-            0.3254901960784314: (0.1941, 0.399323, 0.555565, 1.0),
-            0.32941176470588235: (0.192357, 0.403199, 0.555836, 1.0),
-            0.3333333333333333: (0.190631, 0.407061, 0.556089, 1.0),
-            0.33725490196078434: (0.188923, 0.41091, 0.556326, 1.0),
-            0.3411764705882353: (0.187231, 0.414746, 0.556547, 1.0),
-            0.34509803921568627: (0.185556, 0.41857, 0.556753, 1.0),
-            0.34901960784313724: (0.183898, 0.422383, 0.556944, 1.0),
-            0.35294117647058826: (0.182256, 0.426184, 0.55712, 1.0),
-            0.3568627450980392: (0.180629, 0.429975, 0.557282, 1.0),
-            0.3607843137254902: (0.179019, 0.433756, 0.55743, 1.0),
-            0.36470588235294116: (0.177423, 0.437527, 0.557565, 1.0),
-            0.3686274509803922: (0.175841, 0.44129, 0.557685, 1.0),
-            0.37254901960784315: (0.174274, 0.445044, 0.557792, 1.0),
-            0.3764705882352941: (0.172719, 0.448791, 0.557885, 1.0),
-            0.3803921568627451: (0.171176, 0.45253, 0.557965, 1.0),
-            0.3843137254901961: (0.169646, 0.456262, 0.55803, 1.0),
-            0.38823529411764707: (0.168126, 0.459988, 0.558082, 1.0),
-            0.39215686274509803: (0.166617, 0.463708, 0.558119, 1.0),
-            0.396078431372549: (0.165117, 0.467423, 0.558141, 1.0),
-            0.4: (0.163625, 0.471133, 0.558148, 1.0),
-            0.403921568627451: (0.162142, 0.474838, 0.55814, 1.0),
-            0.40784313725490196: (0.160665, 0.47854, 0.558115, 1.0),
-            0.4117647058823529: (0.159194, 0.482237, 0.558073, 1.0),
-            0.41568627450980394: (0.157729, 0.485932, 0.558013, 1.0),
-            0.4196078431372549: (0.15627, 0.489624, 0.557936, 1.0),
-            0.4235294117647059: (0.154815, 0.493313, 0.55784, 1.0),
-            0.42745098039215684: (0.153364, 0.497, 0.557724, 1.0),
-            0.43137254901960786: (0.151918, 0.500685, 0.557587, 1.0),
-            0.43529411764705883: (0.150476, 0.504369, 0.55743, 1.0),
-            0.4392156862745098: (0.149039, 0.508051, 0.55725, 1.0),
-            0.44313725490196076: (0.147607, 0.511733, 0.557049, 1.0),
-            0.4470588235294118: (0.14618, 0.515413, 0.556823, 1.0),
-            0.45098039215686275: (0.144759, 0.519093, 0.556572, 1.0),
-            0.4549019607843137: (0.143343, 0.522773, 0.556295, 1.0),
-            0.4588235294117647: (0.141935, 0.526453, 0.555991, 1.0),
-            0.4627450980392157: (0.140536, 0.530132, 0.555659, 1.0),
-            0.4666666666666667: (0.139147, 0.533812, 0.555298, 1.0),
-            0.47058823529411764: (0.13777, 0.537492, 0.554906, 1.0),
-            0.4745098039215686: (0.136408, 0.541173, 0.554483, 1.0),
-            0.47843137254901963: (0.135066, 0.544853, 0.554029, 1.0),
-            0.4823529411764706: (0.133743, 0.548535, 0.553541, 1.0),
-            0.48627450980392156: (0.132444, 0.552216, 0.553018, 1.0),
-            0.49019607843137253: (0.131172, 0.555899, 0.552459, 1.0),
-            0.49411764705882355: (0.129933, 0.559582, 0.551864, 1.0),
-            0.4980392156862745: (0.128729, 0.563265, 0.551229, 1.0),
-            0.5019607843137255: (0.127568, 0.566949, 0.550556, 1.0),
-            0.5058823529411764: (0.126453, 0.570633, 0.549841, 1.0),
-            0.5098039215686274: (0.125394, 0.574318, 0.549086, 1.0),
-            0.5137254901960784: (0.124395, 0.578002, 0.548287, 1.0),
-            0.5176470588235295: (0.123463, 0.581687, 0.547445, 1.0),
-            0.5215686274509804: (0.122606, 0.585371, 0.546557, 1.0),
-            0.5254901960784314: (0.121831, 0.589055, 0.545623, 1.0),
-            0.5294117647058824: (0.121148, 0.592739, 0.544641, 1.0),
-            0.5333333333333333: (0.120565, 0.596422, 0.543611, 1.0),
-            0.5372549019607843: (0.120092, 0.600104, 0.54253, 1.0),
-            0.5411764705882353: (0.119738, 0.603785, 0.5414, 1.0),
-            0.5450980392156862: (0.119512, 0.607464, 0.540218, 1.0),
-            0.5490196078431373: (0.119423, 0.611141, 0.538982, 1.0),
-            0.5529411764705883: (0.119483, 0.614817, 0.537692, 1.0),
-            0.5568627450980392: (0.119699, 0.61849, 0.536347, 1.0),
-            0.5607843137254902: (0.120081, 0.622161, 0.534946, 1.0),
-            0.5647058823529412: (0.120638, 0.625828, 0.533488, 1.0),
-            0.5686274509803921: (0.12138, 0.629492, 0.531973, 1.0),
-            0.5725490196078431: (0.122312, 0.633153, 0.530398, 1.0),
-            0.5764705882352941: (0.123444, 0.636809, 0.528763, 1.0),
-            0.5803921568627451: (0.12478, 0.640461, 0.527068, 1.0),
-            0.5843137254901961: (0.126326, 0.644107, 0.525311, 1.0),
-            0.5882352941176471: (0.128087, 0.647749, 0.523491, 1.0),
-            0.592156862745098: (0.130067, 0.651384, 0.521608, 1.0),
-            0.596078431372549: (0.132268, 0.655014, 0.519661, 1.0),
-            0.6: (0.134692, 0.658636, 0.517649, 1.0),
-            0.6039215686274509: (0.137339, 0.662252, 0.515571, 1.0),
-            0.6078431372549019: (0.14021, 0.665859, 0.513427, 1.0),
-            0.611764705882353: (0.143303, 0.669459, 0.511215, 1.0),
-            0.615686274509804: (0.146616, 0.67305, 0.508936, 1.0),
-            0.6196078431372549: (0.150148, 0.676631, 0.506589, 1.0),
-            0.6235294117647059: (0.153894, 0.680203, 0.504172, 1.0),
-            0.6274509803921569: (0.157851, 0.683765, 0.501686, 1.0),
-            0.6313725490196078: (0.162016, 0.687316, 0.499129, 1.0),
-            0.6352941176470588: (0.166383, 0.690856, 0.496502, 1.0),
-            0.6392156862745098: (0.170948, 0.694384, 0.493803, 1.0),
-            0.6431372549019608: (0.175707, 0.6979, 0.491033, 1.0),
-            0.6470588235294118: (0.180653, 0.701402, 0.488189, 1.0),
-            0.6509803921568628: (0.185783, 0.704891, 0.485273, 1.0),
-            0.6549019607843137: (0.19109, 0.708366, 0.482284, 1.0),
-            0.6588235294117647: (0.196571, 0.711827, 0.479221, 1.0),
-            0.6627450980392157: (0.202219, 0.715272, 0.476084, 1.0),
-            0.6666666666666666: (0.20803, 0.718701, 0.472873, 1.0),
-            0.6705882352941176: (0.214, 0.722114, 0.469588, 1.0),
-            0.6745098039215687: (0.220124, 0.725509, 0.466226, 1.0),
-            0.6784313725490196: (0.226397, 0.728888, 0.462789, 1.0),
-            0.6823529411764706: (0.232815, 0.732247, 0.459277, 1.0),
-            0.6862745098039216: (0.239374, 0.735588, 0.455688, 1.0),
-            0.6901960784313725: (0.24607, 0.73891, 0.452024, 1.0),
-            0.6941176470588235: (0.252899, 0.742211, 0.448284, 1.0),
-            0.6980392156862745: (0.259857, 0.745492, 0.444467, 1.0),
-            0.7019607843137254: (0.266941, 0.748751, 0.440573, 1.0),
-            0.7058823529411765: (0.274149, 0.751988, 0.436601, 1.0),
-            0.7098039215686275: (0.281477, 0.755203, 0.432552, 1.0),
-            0.7137254901960784: (0.288921, 0.758394, 0.428426, 1.0),
-            0.7176470588235294: (0.296479, 0.761561, 0.424223, 1.0),
-            0.7215686274509804: (0.304148, 0.764704, 0.419943, 1.0),
-            0.7254901960784313: (0.311925, 0.767822, 0.415586, 1.0),
-            0.7294117647058823: (0.319809, 0.770914, 0.411152, 1.0),
-            0.7333333333333333: (0.327796, 0.77398, 0.40664, 1.0),
-            0.7372549019607844: (0.335885, 0.777018, 0.402049, 1.0),
-            0.7411764705882353: (0.344074, 0.780029, 0.397381, 1.0),
-            0.7450980392156863: (0.35236, 0.783011, 0.392636, 1.0),
-            0.7490196078431373: (0.360741, 0.785964, 0.387814, 1.0),
-            0.7529411764705882: (0.369214, 0.788888, 0.382914, 1.0),
-            0.7568627450980392: (0.377779, 0.791781, 0.377939, 1.0),
-            0.7607843137254902: (0.386433, 0.794644, 0.372886, 1.0),
-            0.7647058823529411: (0.395174, 0.797475, 0.367757, 1.0),
-            0.7686274509803922: (0.404001, 0.800275, 0.362552, 1.0),
-            0.7725490196078432: (0.412913, 0.803041, 0.357269, 1.0),
-            0.7764705882352941: (0.421908, 0.805774, 0.35191, 1.0),
-            0.7803921568627451: (0.430983, 0.808473, 0.346476, 1.0),
-            0.7843137254901961: (0.440137, 0.811138, 0.340967, 1.0),
-            0.788235294117647: (0.449368, 0.813768, 0.335384, 1.0),
-            0.792156862745098: (0.458674, 0.816363, 0.329727, 1.0),
-            0.796078431372549: (0.468053, 0.818921, 0.323998, 1.0),
-            0.8: (0.477504, 0.821444, 0.318195, 1.0),
-            0.803921568627451: (0.487026, 0.823929, 0.312321, 1.0),
-            0.807843137254902: (0.496615, 0.826376, 0.306377, 1.0),
-            0.8117647058823529: (0.506271, 0.828786, 0.300362, 1.0),
-            0.8156862745098039: (0.515992, 0.831158, 0.294279, 1.0),
-            0.8196078431372549: (0.525776, 0.833491, 0.288127, 1.0),
-            0.8235294117647058: (0.535621, 0.835785, 0.281908, 1.0),
-            0.8274509803921568: (0.545524, 0.838039, 0.275626, 1.0),
-            0.8313725490196079: (0.555484, 0.840254, 0.269281, 1.0),
-            0.8352941176470589: (0.565498, 0.84243, 0.262877, 1.0),
-            0.8392156862745098: (0.575563, 0.844566, 0.256415, 1.0),
-            0.8431372549019608: (0.585678, 0.846661, 0.249897, 1.0),
-            0.8470588235294118: (0.595839, 0.848717, 0.243329, 1.0),
-            0.8509803921568627: (0.606045, 0.850733, 0.236712, 1.0),
-            0.8549019607843137: (0.616293, 0.852709, 0.230052, 1.0),
-            0.8588235294117647: (0.626579, 0.854645, 0.223353, 1.0),
-            0.8627450980392157: (0.636902, 0.856542, 0.21662, 1.0),
-            0.8666666666666667: (0.647257, 0.8584, 0.209861, 1.0),
-            0.8705882352941177: (0.657642, 0.860219, 0.203082, 1.0),
-            0.8745098039215686: (0.668054, 0.861999, 0.196293, 1.0),
-            0.8784313725490196: (0.678489, 0.863742, 0.189503, 1.0),
-            0.8823529411764706: (0.688944, 0.865448, 0.182725, 1.0),
-            0.8862745098039215: (0.699415, 0.867117, 0.175971, 1.0),
-            0.8901960784313725: (0.709898, 0.868751, 0.169257, 1.0),
-            0.8941176470588236: (0.720391, 0.87035, 0.162603, 1.0),
-            0.8980392156862745: (0.730889, 0.871916, 0.156029, 1.0),
-            0.9019607843137255: (0.741388, 0.873449, 0.149561, 1.0),
-            0.9058823529411765: (0.751884, 0.874951, 0.143228, 1.0),
-            0.9098039215686274: (0.762373, 0.876424, 0.137064, 1.0),
-            0.9137254901960784: (0.772852, 0.877868, 0.131109, 1.0),
-            0.9176470588235294: (0.783315, 0.879285, 0.125405, 1.0),
-            0.9215686274509803: (0.79376, 0.880678, 0.120005, 1.0),
-            0.9254901960784314: (0.804182, 0.882046, 0.114965, 1.0),
-            0.9294117647058824: (0.814576, 0.883393, 0.110347, 1.0),
-            0.9333333333333333: (0.82494, 0.88472, 0.106217, 1.0),
-            0.9372549019607843: (0.83527, 0.886029, 0.102646, 1.0),
-            0.9411764705882353: (0.845561, 0.887322, 0.099702, 1.0),
-            0.9450980392156862: (0.85581, 0.888601, 0.097452, 1.0),
-            0.9490196078431372: (0.866013, 0.889868, 0.095953, 1.0),
-            0.9529411764705882: (0.876168, 0.891125, 0.09525, 1.0),
-            0.9568627450980393: (0.886271, 0.892374, 0.095374, 1.0),
-            0.9607843137254902: (0.89632, 0.893616, 0.096335, 1.0),
-            0.9647058823529412: (0.906311, 0.894855, 0.098125, 1.0),
-            0.9686274509803922: (0.916242, 0.896091, 0.100717, 1.0),
-            0.9725490196078431: (0.926106, 0.89733, 0.104071, 1.0),
-            0.9764705882352941: (0.935904, 0.89857, 0.108131, 1.0),
-            0.9803921568627451: (0.945636, 0.899815, 0.112838, 1.0),
-            0.984313725490196: (0.9553, 0.901065, 0.118128, 1.0),
-            0.9882352941176471: (0.964894, 0.902323, 0.123941, 1.0),
-            0.9921568627450981: (0.974417, 0.90359, 0.130215, 1.0),
-            0.996078431372549: (0.983868, 0.904867, 0.136897, 1.0),
-            1.0: (0.993248, 0.906157, 0.143936, 1.0)
-        },
-        "plasma": {
-            0.0: (0.050383, 0.029803, 0.527975, 1.0),
-            0.00392156862745098: (0.063536, 0.028426, 0.533124, 1.0),
-            0.00784313725490196: (0.075353, 0.027206, 0.538007, 1.0),
-            0.011764705882352941: (0.086222, 0.026125, 0.542658, 1.0),
-            0.01568627450980392: (0.096379, 0.025165, 0.547103, 1.0),
-            0.0196078431372549: (0.10598, 0.024309, 0.551368, 1.0),
-            0.023529411764705882: (0.115124, 0.023556, 0.555468, 1.0),
-            0.027450980392156862: (0.123903, 0.022878, 0.559423, 1.0),
-            0.03137254901960784: (0.132381, 0.022258, 0.56325, 1.0),
-            0.03529411764705882: (0.140603, 0.021687, 0.566959, 1.0),
-            0.0392156862745098: (0.148607, 0.021154, 0.570562, 1.0),
-            0.043137254901960784: (0.156421, 0.020651, 0.574065, 1.0),
-            0.047058823529411764: (0.16407, 0.020171, 0.577478, 1.0),
-            0.050980392156862744: (0.171574, 0.019706, 0.580806, 1.0),
-            0.054901960784313725: (0.17895, 0.019252, 0.584054, 1.0),
-            0.058823529411764705: (0.186213, 0.018803, 0.587228, 1.0),
-            0.06274509803921569: (0.193374, 0.018354, 0.59033, 1.0),
-            0.06666666666666667: (0.200445, 0.017902, 0.593364, 1.0),
-            0.07058823529411765: (0.207435, 0.017442, 0.596333, 1.0),
-            0.07450980392156863: (0.21435, 0.016973, 0.599239, 1.0),
-            0.0784313725490196: (0.221197, 0.016497, 0.602083, 1.0),
-            0.08235294117647059: (0.227983, 0.016007, 0.604867, 1.0),
-            0.08627450980392157: (0.234715, 0.015502, 0.607592, 1.0),
-            0.09019607843137255: (0.241396, 0.014979, 0.610259, 1.0),
-            0.09411764705882353: (0.248032, 0.014439, 0.612868, 1.0),
-            0.09803921568627451: (0.254627, 0.013882, 0.615419, 1.0),
-            0.10196078431372549: (0.261183, 0.013308, 0.617911, 1.0),
-            0.10588235294117647: (0.267703, 0.012716, 0.620346, 1.0),
-            0.10980392156862745: (0.274191, 0.012109, 0.622722, 1.0),
-            0.11372549019607843: (0.280648, 0.011488, 0.625038, 1.0),
-            0.11764705882352941: (0.287076, 0.010855, 0.627295, 1.0),
-            0.12156862745098039: (0.293478, 0.010213, 0.62949, 1.0),
-            0.12549019607843137: (0.299855, 0.009561, 0.631624, 1.0),
-            0.12941176470588237: (0.30621, 0.008902, 0.633694, 1.0),
-            0.13333333333333333: (0.312543, 0.008239, 0.6357, 1.0),
-            0.13725490196078433: (0.318856, 0.007576, 0.63764, 1.0),
-            0.1411764705882353: (0.32515, 0.006915, 0.639512, 1.0),
-            0.1450980392156863: (0.331426, 0.006261, 0.641316, 1.0),
-            0.14901960784313725: (0.337683, 0.005618, 0.643049, 1.0),
-            0.15294117647058825: (0.343925, 0.004991, 0.64471, 1.0),
-            0.1568627450980392: (0.35015, 0.004382, 0.646298, 1.0),
-            0.1607843137254902: (0.356359, 0.003798, 0.64781, 1.0),
-            0.16470588235294117: (0.362553, 0.003243, 0.649245, 1.0),
-            0.16862745098039217: (0.368733, 0.002724, 0.650601, 1.0),
-            0.17254901960784313: (0.374897, 0.002245, 0.651876, 1.0),
-            0.17647058823529413: (0.381047, 0.001814, 0.653068, 1.0),
-            0.1803921568627451: (0.387183, 0.001434, 0.654177, 1.0),
-            0.1843137254901961: (0.393304, 0.001114, 0.655199, 1.0),
-            0.18823529411764706: (0.399411, 0.000859, 0.656133, 1.0),
-            0.19215686274509805: (0.405503, 0.000678, 0.656977, 1.0),
-            0.19607843137254902: (0.41158, 0.000577, 0.65773, 1.0),
-            0.2: (0.417642, 0.000564, 0.65839, 1.0),
-            0.20392156862745098: (0.423689, 0.000646, 0.658956, 1.0),
-            0.20784313725490197: (0.429719, 0.000831, 0.659425, 1.0),
-            0.21176470588235294: (0.435734, 0.001127, 0.659797, 1.0),
-            0.21568627450980393: (0.441732, 0.00154, 0.660069, 1.0),
-            0.2196078431372549: (0.447714, 0.00208, 0.66024, 1.0),
-            0.2235294117647059: (0.453677, 0.002755, 0.66031, 1.0),
-            0.22745098039215686: (0.459623, 0.003574, 0.660277, 1.0),
-            0.23137254901960785: (0.46555, 0.004545, 0.660139, 1.0),
-            0.23529411764705882: (0.471457, 0.005678, 0.659897, 1.0),
-            0.23921568627450981: (0.477344, 0.00698, 0.659549, 1.0),
-            0.24313725490196078: (0.48321, 0.00846, 0.659095, 1.0),
-            0.24705882352941178: (0.489055, 0.010127, 0.658534, 1.0),
-            0.25098039215686274: (0.494877, 0.01199, 0.657865, 1.0),
-            0.2549019607843137: (0.500678, 0.014055, 0.657088, 1.0),
-            0.25882352941176473: (0.506454, 0.016333, 0.656202, 1.0),
-            0.2627450980392157: (0.512206, 0.018833, 0.655209, 1.0),
-            0.26666666666666666: (0.517933, 0.021563, 0.654109, 1.0),
-            0.27058823529411763: (0.523633, 0.024532, 0.652901, 1.0),
-            0.27450980392156865: (0.529306, 0.027747, 0.651586, 1.0),
-            0.2784313725490196: (0.534952, 0.031217, 0.650165, 1.0),
-            0.2823529411764706: (0.54057, 0.03495, 0.64864, 1.0),
-            0.28627450980392155: (0.546157, 0.038954, 0.64701, 1.0),
-            0.2901960784313726: (0.551715, 0.043136, 0.645277, 1.0),
-            0.29411764705882354: (0.557243, 0.047331, 0.643443, 1.0),
-            0.2980392156862745: (0.562738, 0.051545, 0.641509, 1.0),
-            0.30196078431372547: (0.568201, 0.055778, 0.639477, 1.0),
-            0.3058823529411765: (0.573632, 0.060028, 0.637349, 1.0),
-            0.30980392156862746: (0.579029, 0.064296, 0.635126, 1.0),
-            0.3137254901960784: (0.584391, 0.068579, 0.632812, 1.0),
-            0.3176470588235294: (0.589719, 0.072878, 0.630408, 1.0),
-            0.3215686274509804: (0.595011, 0.07719, 0.627917, 1.0),
-            0.3254901960784314: (0.600266, 0.081516, 0.625342, 1.0),
-            0.32941176470588235: (0.605485, 0.085854, 0.622686, 1.0),
-            0.3333333333333333: (0.610667, 0.090204, 0.619951, 1.0),
-            0.33725490196078434: (0.615812, 0.094564, 0.61714, 1.0),
-            0.3411764705882353: (0.620919, 0.098934, 0.614257, 1.0),
-            0.34509803921568627: (0.625987, 0.103312, 0.611305, 1.0),
-            0.34901960784313724: (0.631017, 0.107699, 0.608287, 1.0),
-            0.35294117647058826: (0.636008, 0.112092, 0.605205, 1.0),
-            0.3568627450980392: (0.640959, 0.116492, 0.602065, 1.0),
-            0.3607843137254902: (0.645872, 0.120898, 0.598867, 1.0),
-            0.36470588235294116: (0.650746, 0.125309, 0.595617, 1.0),
-            0.3686274509803922: (0.65558, 0.129725, 0.592317, 1.0),
-            0.37254901960784315: (0.660374, 0.134144, 0.588971, 1.0),
-            0.3764705882352941: (0.665129, 0.138566, 0.585582, 1.0),
-            0.3803921568627451: (0.669845, 0.142992, 0.582154, 1.0),
-            0.3843137254901961: (0.674522, 0.147419, 0.578688, 1.0),
-            0.38823529411764707: (0.67916, 0.151848, 0.575189, 1.0),
-            0.39215686274509803: (0.683758, 0.156278, 0.57166, 1.0),
-            0.396078431372549: (0.688318, 0.160709, 0.568103, 1.0),
-            0.4: (0.69284, 0.165141, 0.564522, 1.0),
-            0.403921568627451: (0.697324, 0.169573, 0.560919, 1.0),
-            0.40784313725490196: (0.701769, 0.174005, 0.557296, 1.0),
-            0.4117647058823529: (0.706178, 0.178437, 0.553657, 1.0),
-            0.41568627450980394: (0.710549, 0.182868, 0.550004, 1.0),
-            0.4196078431372549: (0.714883, 0.187299, 0.546338, 1.0),
-            0.4235294117647059: (0.719181, 0.191729, 0.542663, 1.0),
-            0.42745098039215684: (0.723444, 0.196158, 0.538981, 1.0),
-            0.43137254901960786: (0.72767, 0.200586, 0.535293, 1.0),
-            0.43529411764705883: (0.731862, 0.205013, 0.531601, 1.0),
-            0.4392156862745098: (0.736019, 0.209439, 0.527908, 1.0),
-            0.44313725490196076: (0.740143, 0.213864, 0.524216, 1.0),
-            0.4470588235294118: (0.744232, 0.218288, 0.520524, 1.0),
-            0.45098039215686275: (0.748289, 0.222711, 0.516834, 1.0),
-            0.4549019607843137: (0.752312, 0.227133, 0.513149, 1.0),
-            0.4588235294117647: (0.756304, 0.231555, 0.509468, 1.0),
-            0.4627450980392157: (0.760264, 0.235976, 0.505794, 1.0),
-            0.4666666666666667: (0.764193, 0.240396, 0.502126, 1.0),
-            0.47058823529411764: (0.76809, 0.244817, 0.498465, 1.0),
-            0.4745098039215686: (0.771958, 0.249237, 0.494813, 1.0),
-            0.47843137254901963: (0.775796, 0.253658, 0.491171, 1.0),
-            0.4823529411764706: (0.779604, 0.258078, 0.487539, 1.0),
-            0.48627450980392156: (0.783383, 0.2625, 0.483918, 1.0),
-            0.49019607843137253: (0.787133, 0.266922, 0.480307, 1.0),
-            0.49411764705882355: (0.790855, 0.271345, 0.476706, 1.0),
-            0.4980392156862745: (0.794549, 0.27577, 0.473117, 1.0),
-            0.5019607843137255: (0.798216, 0.280197, 0.469538, 1.0),
-            0.5058823529411764: (0.801855, 0.284626, 0.465971, 1.0),
-            0.5098039215686274: (0.805467, 0.289057, 0.462415, 1.0),
-            0.5137254901960784: (0.809052, 0.293491, 0.45887, 1.0),
-            0.5176470588235295: (0.812612, 0.297928, 0.455338, 1.0),
-            0.5215686274509804: (0.816144, 0.302368, 0.451816, 1.0),
-            0.5254901960784314: (0.819651, 0.306812, 0.448306, 1.0),
-            0.5294117647058824: (0.823132, 0.311261, 0.444806, 1.0),
-            0.5333333333333333: (0.826588, 0.315714, 0.441316, 1.0),
-            0.5372549019607843: (0.830018, 0.320172, 0.437836, 1.0),
-            0.5411764705882353: (0.833422, 0.324635, 0.434366, 1.0),
-            0.5450980392156862: (0.836801, 0.329105, 0.430905, 1.0),
-            0.5490196078431373: (0.840155, 0.33358, 0.427455, 1.0),
-            0.5529411764705883: (0.843484, 0.338062, 0.424013, 1.0),
-            0.5568627450980392: (0.846788, 0.342551, 0.420579, 1.0),
-            0.5607843137254902: (0.850066, 0.347048, 0.417153, 1.0),
-            0.5647058823529412: (0.853319, 0.351553, 0.413734, 1.0),
-            0.5686274509803921: (0.856547, 0.356066, 0.410322, 1.0),
-            0.5725490196078431: (0.85975, 0.360588, 0.406917, 1.0),
-            0.5764705882352941: (0.862927, 0.365119, 0.403519, 1.0),
-            0.5803921568627451: (0.866078, 0.36966, 0.400126, 1.0),
-            0.5843137254901961: (0.869203, 0.374212, 0.396738, 1.0),
-            0.5882352941176471: (0.872303, 0.378774, 0.393355, 1.0),
-            0.592156862745098: (0.875376, 0.383347, 0.389976, 1.0),
-            0.596078431372549: (0.878423, 0.387932, 0.3866, 1.0),
-            0.6: (0.881443, 0.392529, 0.383229, 1.0),
-            0.6039215686274509: (0.884436, 0.397139, 0.37986, 1.0),
-            0.6078431372549019: (0.887402, 0.401762, 0.376494, 1.0),
-            0.611764705882353: (0.89034, 0.406398, 0.37313, 1.0),
-            0.615686274509804: (0.89325, 0.411048, 0.369768, 1.0),
-            0.6196078431372549: (0.896131, 0.415712, 0.366407, 1.0),
-            0.6235294117647059: (0.898984, 0.420392, 0.363047, 1.0),
-            0.6274509803921569: (0.901807, 0.425087, 0.359688, 1.0),
-            0.6313725490196078: (0.904601, 0.429797, 0.356329, 1.0),
-            0.6352941176470588: (0.907365, 0.434524, 0.35297, 1.0),
-            0.6392156862745098: (0.910098, 0.439268, 0.34961, 1.0),
-            0.6431372549019608: (0.9128, 0.444029, 0.346251, 1.0),
-            0.6470588235294118: (0.915471, 0.448807, 0.34289, 1.0),
-            0.6509803921568628: (0.918109, 0.453603, 0.339529, 1.0),
-            0.6549019607843137: (0.920714, 0.458417, 0.336166, 1.0),
-            0.6588235294117647: (0.923287, 0.463251, 0.332801, 1.0),
-            0.6627450980392157: (0.925825, 0.468103, 0.329435, 1.0),
-            0.6666666666666666: (0.928329, 0.472975, 0.326067, 1.0),
-            0.6705882352941176: (0.930798, 0.477867, 0.322697, 1.0),
-            0.6745098039215687: (0.933232, 0.48278, 0.319325, 1.0),
-            0.6784313725490196: (0.93563, 0.487712, 0.315952, 1.0),
-            0.6823529411764706: (0.93799, 0.492667, 0.312575, 1.0),
-            0.6862745098039216: (0.940313, 0.497642, 0.309197, 1.0),
-            0.6901960784313725: (0.942598, 0.502639, 0.305816, 1.0),
-            0.6941176470588235: (0.944844, 0.507658, 0.302433, 1.0),
-            0.6980392156862745: (0.947051, 0.512699, 0.299049, 1.0),
-            0.7019607843137254: (0.949217, 0.517763, 0.295662, 1.0),
-            0.7058823529411765: (0.951344, 0.52285, 0.292275, 1.0),
-            0.7098039215686275: (0.953428, 0.52796, 0.288883, 1.0),
-            0.7137254901960784: (0.95547, 0.533093, 0.28549, 1.0),
-            0.7176470588235294: (0.957469, 0.53825, 0.282096, 1.0),
-            0.7215686274509804: (0.959424, 0.543431, 0.278701, 1.0),
-            0.7254901960784313: (0.961336, 0.548636, 0.275305, 1.0),
-            0.7294117647058823: (0.963203, 0.553865, 0.271909, 1.0),
-            0.7333333333333333: (0.965024, 0.559118, 0.268513, 1.0),
-            0.7372549019607844: (0.966798, 0.564396, 0.265118, 1.0),
-            0.7411764705882353: (0.968526, 0.5697, 0.261721, 1.0),
-            0.7450980392156863: (0.970205, 0.575028, 0.258325, 1.0),
-            0.7490196078431373: (0.971835, 0.580382, 0.254931, 1.0),
-            0.7529411764705882: (0.973416, 0.585761, 0.25154, 1.0),
-            0.7568627450980392: (0.974947, 0.591165, 0.248151, 1.0),
-            0.7607843137254902: (0.976428, 0.596595, 0.244767, 1.0),
-            0.7647058823529411: (0.977856, 0.602051, 0.241387, 1.0),
-            0.7686274509803922: (0.979233, 0.607532, 0.238013, 1.0),
-            0.7725490196078432: (0.980556, 0.613039, 0.234646, 1.0),
-            0.7764705882352941: (0.981826, 0.618572, 0.231287, 1.0),
-            0.7803921568627451: (0.983041, 0.624131, 0.227937, 1.0),
-            0.7843137254901961: (0.984199, 0.629718, 0.224595, 1.0),
-            0.788235294117647: (0.985301, 0.63533, 0.221265, 1.0),
-            0.792156862745098: (0.986345, 0.640969, 0.217948, 1.0),
-            0.796078431372549: (0.987332, 0.646633, 0.214648, 1.0),
-            0.8: (0.98826, 0.652325, 0.211364, 1.0),
-            0.803921568627451: (0.989128, 0.658043, 0.2081, 1.0),
-            0.807843137254902: (0.989935, 0.663787, 0.204859, 1.0),
-            0.8117647058823529: (0.990681, 0.669558, 0.201642, 1.0),
-            0.8156862745098039: (0.991365, 0.675355, 0.198453, 1.0),
-            0.8196078431372549: (0.991985, 0.681179, 0.195295, 1.0),
-            0.8235294117647058: (0.992541, 0.68703, 0.19217, 1.0),
-            0.8274509803921568: (0.993032, 0.692907, 0.189084, 1.0),
-            0.8313725490196079: (0.993456, 0.69881, 0.186041, 1.0),
-            0.8352941176470589: (0.993814, 0.704741, 0.183043, 1.0),
-            0.8392156862745098: (0.994103, 0.710698, 0.180097, 1.0),
-            0.8431372549019608: (0.994324, 0.716681, 0.177208, 1.0),
-            0.8470588235294118: (0.994474, 0.722691, 0.174381, 1.0),
-            0.8509803921568627: (0.994553, 0.728728, 0.171622, 1.0),
-            0.8549019607843137: (0.994561, 0.734791, 0.168938, 1.0),
-            0.8588235294117647: (0.994495, 0.74088, 0.166335, 1.0),
-            0.8627450980392157: (0.994355, 0.746995, 0.163821, 1.0),
-            0.8666666666666667: (0.994141, 0.753137, 0.161404, 1.0),
-            0.8705882352941177: (0.993851, 0.759304, 0.159092, 1.0),
-            0.8745098039215686: (0.993482, 0.765499, 0.156891, 1.0),
-            0.8784313725490196: (0.993033, 0.77172, 0.154808, 1.0),
-            0.8823529411764706: (0.992505, 0.777967, 0.152855, 1.0),
-            0.8862745098039215: (0.991897, 0.784239, 0.151042, 1.0),
-            0.8901960784313725: (0.991209, 0.790537, 0.149377, 1.0),
-            0.8941176470588236: (0.990439, 0.796859, 0.14787, 1.0),
-            0.8980392156862745: (0.989587, 0.803205, 0.146529, 1.0),
-            0.9019607843137255: (0.988648, 0.809579, 0.145357, 1.0),
-            0.9058823529411765: (0.987621, 0.815978, 0.144363, 1.0),
-            0.9098039215686274: (0.986509, 0.822401, 0.143557, 1.0),
-            0.9137254901960784: (0.985314, 0.828846, 0.142945, 1.0),
-            0.9176470588235294: (0.984031, 0.835315, 0.142528, 1.0),
-            0.9215686274509803: (0.982653, 0.841812, 0.142303, 1.0),
-            0.9254901960784314: (0.98119, 0.848329, 0.142279, 1.0),
-            0.9294117647058824: (0.979644, 0.854866, 0.142453, 1.0),
-            0.9333333333333333: (0.977995, 0.861432, 0.142808, 1.0),
-            0.9372549019607843: (0.976265, 0.868016, 0.143351, 1.0),
-            0.9411764705882353: (0.974443, 0.874622, 0.144061, 1.0),
-            0.9450980392156862: (0.97253, 0.88125, 0.144923, 1.0),
-            0.9490196078431372: (0.970533, 0.887896, 0.145919, 1.0),
-            0.9529411764705882: (0.968443, 0.894564, 0.147014, 1.0),
-            0.9568627450980393: (0.966271, 0.901249, 0.14818, 1.0),
-            0.9607843137254902: (0.964021, 0.90795, 0.14937, 1.0),
-            0.9647058823529412: (0.961681, 0.914672, 0.15052, 1.0),
-            0.9686274509803922: (0.959276, 0.921407, 0.151566, 1.0),
-            0.9725490196078431: (0.956808, 0.928152, 0.152409, 1.0),
-            0.9764705882352941: (0.954287, 0.934908, 0.152921, 1.0),
-            0.9803921568627451: (0.951726, 0.941671, 0.152925, 1.0),
-            0.984313725490196: (0.949151, 0.948435, 0.152178, 1.0),
-            0.9882352941176471: (0.946602, 0.95519, 0.150328, 1.0),
-            0.9921568627450981: (0.944152, 0.961916, 0.146861, 1.0),
-            0.996078431372549: (0.941896, 0.96859, 0.140956, 1.0),
-            1.0: (0.940015, 0.975158, 0.131326, 1.0)
-        },
-        "inferno": {
-            0.0: (0.001462, 0.000466, 0.013866, 1.0),
-            0.00392156862745098: (0.002267, 0.00127, 0.01857, 1.0),
-            0.00784313725490196: (0.003299, 0.002249, 0.024239, 1.0),
-            0.011764705882352941: (0.004547, 0.003392, 0.030909, 1.0),
-            0.01568627450980392: (0.006006, 0.004692, 0.038558, 1.0),
-            0.0196078431372549: (0.007676, 0.006136, 0.046836, 1.0),
-            0.023529411764705882: (0.009561, 0.007713, 0.055143, 1.0),
-            0.027450980392156862: (0.011663, 0.009417, 0.06346, 1.0),
-            0.03137254901960784: (0.013995, 0.011225, 0.071862, 1.0),
-            0.03529411764705882: (0.016561, 0.013136, 0.080282, 1.0),
-            0.0392156862745098: (0.019373, 0.015133, 0.088767, 1.0),
-            0.043137254901960784: (0.022447, 0.017199, 0.097327, 1.0),
-            0.047058823529411764: (0.025793, 0.019331, 0.10593, 1.0),
-            0.050980392156862744: (0.029432, 0.021503, 0.114621, 1.0),
-            0.054901960784313725: (0.033385, 0.023702, 0.123397, 1.0),
-            0.058823529411764705: (0.037668, 0.025921, 0.132232, 1.0),
-            0.06274509803921569: (0.042253, 0.028139, 0.141141, 1.0),
-            0.06666666666666667: (0.046915, 0.030324, 0.150164, 1.0),
-            0.07058823529411765: (0.051644, 0.032474, 0.159254, 1.0),
-            0.07450980392156863: (0.056449, 0.034569, 0.168414, 1.0),
-            0.0784313725490196: (0.06134, 0.03659, 0.177642, 1.0),
-            0.08235294117647059: (0.066331, 0.038504, 0.186962, 1.0),
-            0.08627450980392157: (0.071429, 0.040294, 0.196354, 1.0),
-            0.09019607843137255: (0.076637, 0.041905, 0.205799, 1.0),
-            0.09411764705882353: (0.081962, 0.043328, 0.215289, 1.0),
-            0.09803921568627451: (0.087411, 0.044556, 0.224813, 1.0),
-            0.10196078431372549: (0.09299, 0.045583, 0.234358, 1.0),
-            0.10588235294117647: (0.098702, 0.046402, 0.243904, 1.0),
-            0.10980392156862745: (0.104551, 0.047008, 0.25343, 1.0),
-            0.11372549019607843: (0.110536, 0.047399, 0.262912, 1.0),
-            0.11764705882352941: (0.116656, 0.047574, 0.272321, 1.0),
-            0.12156862745098039: (0.122908, 0.047536, 0.281624, 1.0),
-            0.12549019607843137: (0.129285, 0.047293, 0.290788, 1.0),
-            0.12941176470588237: (0.135778, 0.046856, 0.299776, 1.0),
-            0.13333333333333333: (0.142378, 0.046242, 0.308553, 1.0),
-            0.13725490196078433: (0.149073, 0.045468, 0.317085, 1.0),
-            0.1411764705882353: (0.15585, 0.044559, 0.325338, 1.0),
-            0.1450980392156863: (0.162689, 0.043554, 0.333277, 1.0),
-            0.14901960784313725: (0.169575, 0.042489, 0.340874, 1.0),
-            0.15294117647058825: (0.176493, 0.041402, 0.348111, 1.0),
-            0.1568627450980392: (0.183429, 0.040329, 0.354971, 1.0),
-            0.1607843137254902: (0.190367, 0.039309, 0.361447, 1.0),
-            0.16470588235294117: (0.197297, 0.0384, 0.367535, 1.0),
-            0.16862745098039217: (0.204209, 0.037632, 0.373238, 1.0),
-            0.17254901960784313: (0.211095, 0.03703, 0.378563, 1.0),
-            0.17647058823529413: (0.217949, 0.036615, 0.383522, 1.0),
-            0.1803921568627451: (0.224763, 0.036405, 0.388129, 1.0),
-            0.1843137254901961: (0.231538, 0.036405, 0.3924, 1.0),
-            0.18823529411764706: (0.238273, 0.036621, 0.396353, 1.0),
-            0.19215686274509805: (0.244967, 0.037055, 0.400007, 1.0),
-            0.19607843137254902: (0.25162, 0.037705, 0.403378, 1.0),
-            0.2: (0.258234, 0.038571, 0.406485, 1.0),
-            0.20392156862745098: (0.26481, 0.039647, 0.409345, 1.0),
-            0.20784313725490197: (0.271347, 0.040922, 0.411976, 1.0),
-            0.21176470588235294: (0.27785, 0.042353, 0.414392, 1.0),
-            0.21568627450980393: (0.284321, 0.043933, 0.416608, 1.0),
-            0.2196078431372549: (0.290763, 0.045644, 0.418637, 1.0),
-            0.2235294117647059: (0.297178, 0.04747, 0.420491, 1.0),
-            0.22745098039215686: (0.303568, 0.049396, 0.422182, 1.0),
-            0.23137254901960785: (0.309935, 0.051407, 0.423721, 1.0),
-            0.23529411764705882: (0.316282, 0.05349, 0.425116, 1.0),
-            0.23921568627450981: (0.32261, 0.055634, 0.426377, 1.0),
-            0.24313725490196078: (0.328921, 0.057827, 0.427511, 1.0),
-            0.24705882352941178: (0.335217, 0.06006, 0.428524, 1.0),
-            0.25098039215686274: (0.3415, 0.062325, 0.429425, 1.0),
-            0.2549019607843137: (0.347771, 0.064616, 0.430217, 1.0),
-            0.25882352941176473: (0.354032, 0.066925, 0.430906, 1.0),
-            0.2627450980392157: (0.360284, 0.069247, 0.431497, 1.0),
-            0.26666666666666666: (0.366529, 0.071579, 0.431994, 1.0),
-            0.27058823529411763: (0.372768, 0.073915, 0.4324, 1.0),
-            0.27450980392156865: (0.379001, 0.076253, 0.432719, 1.0),
-            0.2784313725490196: (0.385228, 0.078591, 0.432955, 1.0),
-            0.2823529411764706: (0.391453, 0.080927, 0.433109, 1.0),
-            0.28627450980392155: (0.397674, 0.083257, 0.433183, 1.0),
-            0.2901960784313726: (0.403894, 0.08558, 0.433179, 1.0),
-            0.29411764705882354: (0.410113, 0.087896, 0.433098, 1.0),
-            0.2980392156862745: (0.416331, 0.090203, 0.432943, 1.0),
-            0.30196078431372547: (0.422549, 0.092501, 0.432714, 1.0),
-            0.3058823529411765: (0.428768, 0.09479, 0.432412, 1.0),
-            0.30980392156862746: (0.434987, 0.097069, 0.432039, 1.0),
-            0.3137254901960784: (0.441207, 0.099338, 0.431594, 1.0),
-            0.3176470588235294: (0.447428, 0.101597, 0.43108, 1.0),
-            0.3215686274509804: (0.453651, 0.103848, 0.430498, 1.0),
-            0.3254901960784314: (0.459875, 0.106089, 0.429846, 1.0),
-            0.32941176470588235: (0.4661, 0.108322, 0.429125, 1.0),
-            0.3333333333333333: (0.472328, 0.110547, 0.428334, 1.0),
-            0.33725490196078434: (0.478558, 0.112764, 0.427475, 1.0),
-            0.3411764705882353: (0.484789, 0.114974, 0.426548, 1.0),
-            0.34509803921568627: (0.491022, 0.117179, 0.425552, 1.0),
-            0.34901960784313724: (0.497257, 0.119379, 0.424488, 1.0),
-            0.35294117647058826: (0.503493, 0.121575, 0.423356, 1.0),
-            0.3568627450980392: (0.50973, 0.123769, 0.422156, 1.0),
-            0.3607843137254902: (0.515967, 0.12596, 0.420887, 1.0),
-            0.36470588235294116: (0.522206, 0.12815, 0.419549, 1.0),
-            0.3686274509803922: (0.528444, 0.130341, 0.418142, 1.0),
-            0.37254901960784315: (0.534683, 0.132534, 0.416667, 1.0),
-            0.3764705882352941: (0.54092, 0.134729, 0.415123, 1.0),
-            0.3803921568627451: (0.547157, 0.136929, 0.413511, 1.0),
-            0.3843137254901961: (0.553392, 0.139134, 0.411829, 1.0),
-            0.38823529411764707: (0.559624, 0.141346, 0.410078, 1.0),
-            0.39215686274509803: (0.565854, 0.143567, 0.408258, 1.0),
-            0.396078431372549: (0.572081, 0.145797, 0.406369, 1.0),
-            0.4: (0.578304, 0.148039, 0.404411, 1.0),
-            0.403921568627451: (0.584521, 0.150294, 0.402385, 1.0),
-            0.40784313725490196: (0.590734, 0.152563, 0.40029, 1.0),
-            0.4117647058823529: (0.59694, 0.154848, 0.398125, 1.0),
-            0.41568627450980394: (0.603139, 0.157151, 0.395891, 1.0),
-            0.4196078431372549: (0.60933, 0.159474, 0.393589, 1.0),
-            0.4235294117647059: (0.615513, 0.161817, 0.391219, 1.0),
-            0.42745098039215684: (0.621685, 0.164184, 0.388781, 1.0),
-            0.43137254901960786: (0.627847, 0.166575, 0.386276, 1.0),
-            0.43529411764705883: (0.633998, 0.168992, 0.383704, 1.0),
-            0.4392156862745098: (0.640135, 0.171438, 0.381065, 1.0),
-            0.44313725490196076: (0.64626, 0.173914, 0.378359, 1.0),
-            0.4470588235294118: (0.652369, 0.176421, 0.375586, 1.0),
-            0.45098039215686275: (0.658463, 0.178962, 0.372748, 1.0),
-            0.4549019607843137: (0.66454, 0.181539, 0.369846, 1.0),
-            0.4588235294117647: (0.670599, 0.184153, 0.366879, 1.0),
-            0.4627450980392157: (0.676638, 0.186807, 0.363849, 1.0),
-            0.4666666666666667: (0.682656, 0.189501, 0.360757, 1.0),
-            0.47058823529411764: (0.688653, 0.192239, 0.357603, 1.0),
-            0.4745098039215686: (0.694627, 0.195021, 0.354388, 1.0),
-            0.47843137254901963: (0.700576, 0.197851, 0.351113, 1.0),
-            0.4823529411764706: (0.7065, 0.200728, 0.347777, 1.0),
-            0.48627450980392156: (0.712396, 0.203656, 0.344383, 1.0),
-            0.49019607843137253: (0.718264, 0.206636, 0.340931, 1.0),
-            0.49411764705882355: (0.724103, 0.20967, 0.337424, 1.0),
-            0.4980392156862745: (0.729909, 0.212759, 0.333861, 1.0),
-            0.5019607843137255: (0.735683, 0.215906, 0.330245, 1.0),
-            0.5058823529411764: (0.741423, 0.219112, 0.326576, 1.0),
-            0.5098039215686274: (0.747127, 0.222378, 0.322856, 1.0),
-            0.5137254901960784: (0.752794, 0.225706, 0.319085, 1.0),
-            0.5176470588235295: (0.758422, 0.229097, 0.315266, 1.0),
-            0.5215686274509804: (0.76401, 0.232554, 0.311399, 1.0),
-            0.5254901960784314: (0.769556, 0.236077, 0.307485, 1.0),
-            0.5294117647058824: (0.775059, 0.239667, 0.303526, 1.0),
-            0.5333333333333333: (0.780517, 0.243327, 0.299523, 1.0),
-            0.5372549019607843: (0.785929, 0.247056, 0.295477, 1.0),
-            0.5411764705882353: (0.791293, 0.250856, 0.29139, 1.0),
-            0.5450980392156862: (0.796607, 0.254728, 0.287264, 1.0),
-            0.5490196078431373: (0.801871, 0.258674, 0.283099, 1.0),
-            0.5529411764705883: (0.807082, 0.262692, 0.278898, 1.0),
-            0.5568627450980392: (0.812239, 0.266786, 0.274661, 1.0),
-            0.5607843137254902: (0.817341, 0.270954, 0.27039, 1.0),
-            0.5647058823529412: (0.822386, 0.275197, 0.266085, 1.0),
-            0.5686274509803921: (0.827372, 0.279517, 0.26175, 1.0),
-            0.5725490196078431: (0.832299, 0.283913, 0.257383, 1.0),
-            0.5764705882352941: (0.837165, 0.288385, 0.252988, 1.0),
-            0.5803921568627451: (0.841969, 0.292933, 0.248564, 1.0),
-            0.5843137254901961: (0.846709, 0.297559, 0.244113, 1.0),
-            0.5882352941176471: (0.851384, 0.30226, 0.239636, 1.0),
-            0.592156862745098: (0.855992, 0.307038, 0.235133, 1.0),
-            0.596078431372549: (0.860533, 0.311892, 0.230606, 1.0),
-            0.6: (0.865006, 0.316822, 0.226055, 1.0),
-            0.6039215686274509: (0.869409, 0.321827, 0.221482, 1.0),
-            0.6078431372549019: (0.873741, 0.326906, 0.216886, 1.0),
-            0.611764705882353: (0.878001, 0.33206, 0.212268, 1.0),
-            0.615686274509804: (0.882188, 0.337287, 0.207628, 1.0),
-            0.6196078431372549: (0.886302, 0.342586, 0.202968, 1.0),
-            0.6235294117647059: (0.890341, 0.347957, 0.198286, 1.0),
-            0.6274509803921569: (0.894305, 0.353399, 0.193584, 1.0),
-            0.6313725490196078: (0.898192, 0.358911, 0.18886, 1.0),
-            0.6352941176470588: (0.902003, 0.364492, 0.184116, 1.0),
-            0.6392156862745098: (0.905735, 0.37014, 0.17935, 1.0),
-            0.6431372549019608: (0.90939, 0.375856, 0.174563, 1.0),
-            0.6470588235294118: (0.912966, 0.381636, 0.169755, 1.0),
-            0.6509803921568628: (0.916462, 0.387481, 0.164924, 1.0),
-            0.6549019607843137: (0.919879, 0.393389, 0.16007, 1.0),
-            0.6588235294117647: (0.923215, 0.399359, 0.155193, 1.0),
-            0.6627450980392157: (0.92647, 0.405389, 0.150292, 1.0),
-            0.6666666666666666: (0.929644, 0.411479, 0.145367, 1.0),
-            0.6705882352941176: (0.932737, 0.417627, 0.140417, 1.0),
-            0.6745098039215687: (0.935747, 0.423831, 0.13544, 1.0),
-            0.6784313725490196: (0.938675, 0.430091, 0.130438, 1.0),
-            0.6823529411764706: (0.941521, 0.436405, 0.125409, 1.0),
-            0.6862745098039216: (0.944285, 0.442772, 0.120354, 1.0),
-            0.6901960784313725: (0.946965, 0.449191, 0.115272, 1.0),
-            0.6941176470588235: (0.949562, 0.45566, 0.110164, 1.0),
-            0.6980392156862745: (0.952075, 0.462178, 0.105031, 1.0),
-            0.7019607843137254: (0.954506, 0.468744, 0.099874, 1.0),
-            0.7058823529411765: (0.956852, 0.475356, 0.094695, 1.0),
-            0.7098039215686275: (0.959114, 0.482014, 0.089499, 1.0),
-            0.7137254901960784: (0.961293, 0.488716, 0.084289, 1.0),
-            0.7176470588235294: (0.963387, 0.495462, 0.079073, 1.0),
-            0.7215686274509804: (0.965397, 0.502249, 0.073859, 1.0),
-            0.7254901960784313: (0.967322, 0.509078, 0.068659, 1.0),
-            0.7294117647058823: (0.969163, 0.515946, 0.063488, 1.0),
-            0.7333333333333333: (0.970919, 0.522853, 0.058367, 1.0),
-            0.7372549019607844: (0.97259, 0.529798, 0.053324, 1.0),
-            0.7411764705882353: (0.974176, 0.53678, 0.048392, 1.0),
-            0.7450980392156863: (0.975677, 0.543798, 0.043618, 1.0),
-            0.7490196078431373: (0.977092, 0.55085, 0.03905, 1.0),
-            0.7529411764705882: (0.978422, 0.557937, 0.034931, 1.0),
-            0.7568627450980392: (0.979666, 0.565057, 0.031409, 1.0),
-            0.7607843137254902: (0.980824, 0.572209, 0.028508, 1.0),
-            0.7647058823529411: (0.981895, 0.579392, 0.02625, 1.0),
-            0.7686274509803922: (0.982881, 0.586606, 0.024661, 1.0),
-            0.7725490196078432: (0.983779, 0.593849, 0.02377, 1.0),
-            0.7764705882352941: (0.984591, 0.601122, 0.023606, 1.0),
-            0.7803921568627451: (0.985315, 0.608422, 0.024202, 1.0),
-            0.7843137254901961: (0.985952, 0.61575, 0.025592, 1.0),
-            0.788235294117647: (0.986502, 0.623105, 0.027814, 1.0),
-            0.792156862745098: (0.986964, 0.630485, 0.030908, 1.0),
-            0.796078431372549: (0.987337, 0.63789, 0.034916, 1.0),
-            0.8: (0.987622, 0.64532, 0.039886, 1.0),
-            0.803921568627451: (0.987819, 0.652773, 0.045581, 1.0),
-            0.807843137254902: (0.987926, 0.66025, 0.05175, 1.0),
-            0.8117647058823529: (0.987945, 0.667748, 0.058329, 1.0),
-            0.8156862745098039: (0.987874, 0.675267, 0.065257, 1.0),
-            0.8196078431372549: (0.987714, 0.682807, 0.072489, 1.0),
-            0.8235294117647058: (0.987464, 0.690366, 0.07999, 1.0),
-            0.8274509803921568: (0.987124, 0.697944, 0.087731, 1.0),
-            0.8313725490196079: (0.986694, 0.70554, 0.095694, 1.0),
-            0.8352941176470589: (0.986175, 0.713153, 0.103863, 1.0),
-            0.8392156862745098: (0.985566, 0.720782, 0.112229, 1.0),
-            0.8431372549019608: (0.984865, 0.728427, 0.120785, 1.0),
-            0.8470588235294118: (0.984075, 0.736087, 0.129527, 1.0),
-            0.8509803921568627: (0.983196, 0.743758, 0.138453, 1.0),
-            0.8549019607843137: (0.982228, 0.751442, 0.147565, 1.0),
-            0.8588235294117647: (0.981173, 0.759135, 0.156863, 1.0),
-            0.8627450980392157: (0.980032, 0.766837, 0.166353, 1.0),
-            0.8666666666666667: (0.978806, 0.774545, 0.176037, 1.0),
-            0.8705882352941177: (0.977497, 0.782258, 0.185923, 1.0),
-            0.8745098039215686: (0.976108, 0.789974, 0.196018, 1.0),
-            0.8784313725490196: (0.974638, 0.797692, 0.206332, 1.0),
-            0.8823529411764706: (0.973088, 0.805409, 0.216877, 1.0),
-            0.8862745098039215: (0.971468, 0.813122, 0.227658, 1.0),
-            0.8901960784313725: (0.969783, 0.820825, 0.238686, 1.0),
-            0.8941176470588236: (0.968041, 0.828515, 0.249972, 1.0),
-            0.8980392156862745: (0.966243, 0.836191, 0.261534, 1.0),
-            0.9019607843137255: (0.964394, 0.843848, 0.273391, 1.0),
-            0.9058823529411765: (0.962517, 0.851476, 0.285546, 1.0),
-            0.9098039215686274: (0.960626, 0.859069, 0.29801, 1.0),
-            0.9137254901960784: (0.95872, 0.866624, 0.31082, 1.0),
-            0.9176470588235294: (0.956834, 0.874129, 0.323974, 1.0),
-            0.9215686274509803: (0.954997, 0.881569, 0.337475, 1.0),
-            0.9254901960784314: (0.953215, 0.888942, 0.351369, 1.0),
-            0.9294117647058824: (0.951546, 0.896226, 0.365627, 1.0),
-            0.9333333333333333: (0.950018, 0.903409, 0.380271, 1.0),
-            0.9372549019607843: (0.948683, 0.910473, 0.395289, 1.0),
-            0.9411764705882353: (0.947594, 0.917399, 0.410665, 1.0),
-            0.9450980392156862: (0.946809, 0.924168, 0.426373, 1.0),
-            0.9490196078431372: (0.946392, 0.930761, 0.442367, 1.0),
-            0.9529411764705882: (0.946403, 0.937159, 0.458592, 1.0),
-            0.9568627450980393: (0.946903, 0.943348, 0.47497, 1.0),
-            0.9607843137254902: (0.947937, 0.949318, 0.491426, 1.0),
-            0.9647058823529412: (0.949545, 0.955063, 0.50786, 1.0),
-            0.9686274509803922: (0.95174, 0.960587, 0.524203, 1.0),
-            0.9725490196078431: (0.954529, 0.965896, 0.540361, 1.0),
-            0.9764705882352941: (0.957896, 0.971003, 0.556275, 1.0),
-            0.9803921568627451: (0.961812, 0.975924, 0.571925, 1.0),
-            0.984313725490196: (0.966249, 0.980678, 0.587206, 1.0),
-            0.9882352941176471: (0.971162, 0.985282, 0.602154, 1.0),
-            0.9921568627450981: (0.976511, 0.989753, 0.61676, 1.0),
-            0.996078431372549: (0.982257, 0.994109, 0.631017, 1.0),
-            1.0: (0.988362, 0.998364, 0.644924, 1.0)
-            },
-        "magma": {
-            0.0: (0.001462, 0.000466, 0.013866, 1.0),
-            0.00392156862745098: (0.002258, 0.001295, 0.018331, 1.0),
-            0.00784313725490196: (0.003279, 0.002305, 0.023708, 1.0),
-            0.011764705882352941: (0.004512, 0.00349, 0.029965, 1.0),
-            0.01568627450980392: (0.00595, 0.004843, 0.03713, 1.0),
-            0.0196078431372549: (0.007588, 0.006356, 0.044973, 1.0),
-            0.023529411764705882: (0.009426, 0.008022, 0.052844, 1.0),
-            0.027450980392156862: (0.011465, 0.009828, 0.06075, 1.0),
-            0.03137254901960784: (0.013708, 0.011771, 0.068667, 1.0),
-            0.03529411764705882: (0.016156, 0.01384, 0.076603, 1.0),
-            0.0392156862745098: (0.018815, 0.016026, 0.084584, 1.0),
-            0.043137254901960784: (0.021692, 0.01832, 0.09261, 1.0),
-            0.047058823529411764: (0.024792, 0.020715, 0.100676, 1.0),
-            0.050980392156862744: (0.028123, 0.023201, 0.108787, 1.0),
-            0.054901960784313725: (0.031696, 0.025765, 0.116965, 1.0),
-            0.058823529411764705: (0.03552, 0.028397, 0.125209, 1.0),
-            0.06274509803921569: (0.039608, 0.03109, 0.133515, 1.0),
-            0.06666666666666667: (0.04383, 0.03383, 0.141886, 1.0),
-            0.07058823529411765: (0.048062, 0.036607, 0.150327, 1.0),
-            0.07450980392156863: (0.05232, 0.039407, 0.158841, 1.0),
-            0.0784313725490196: (0.056615, 0.04216, 0.167446, 1.0),
-            0.08235294117647059: (0.060949, 0.044794, 0.176129, 1.0),
-            0.08627450980392157: (0.06533, 0.047318, 0.184892, 1.0),
-            0.09019607843137255: (0.069764, 0.049726, 0.193735, 1.0),
-            0.09411764705882353: (0.074257, 0.052017, 0.20266, 1.0),
-            0.09803921568627451: (0.078815, 0.054184, 0.211667, 1.0),
-            0.10196078431372549: (0.083446, 0.056225, 0.220755, 1.0),
-            0.10588235294117647: (0.088155, 0.058133, 0.229922, 1.0),
-            0.10980392156862745: (0.092949, 0.059904, 0.239164, 1.0),
-            0.11372549019607843: (0.097833, 0.061531, 0.248477, 1.0),
-            0.11764705882352941: (0.102815, 0.06301, 0.257854, 1.0),
-            0.12156862745098039: (0.107899, 0.064335, 0.267289, 1.0),
-            0.12549019607843137: (0.113094, 0.065492, 0.276784, 1.0),
-            0.12941176470588237: (0.118405, 0.066479, 0.286321, 1.0),
-            0.13333333333333333: (0.123833, 0.067295, 0.295879, 1.0),
-            0.13725490196078433: (0.12938, 0.067935, 0.305443, 1.0),
-            0.1411764705882353: (0.135053, 0.068391, 0.315, 1.0),
-            0.1450980392156863: (0.140858, 0.068654, 0.324538, 1.0),
-            0.14901960784313725: (0.146785, 0.068738, 0.334011, 1.0),
-            0.15294117647058825: (0.152839, 0.068637, 0.343404, 1.0),
-            0.1568627450980392: (0.159018, 0.068354, 0.352688, 1.0),
-            0.1607843137254902: (0.165308, 0.067911, 0.361816, 1.0),
-            0.16470588235294117: (0.171713, 0.067305, 0.370771, 1.0),
-            0.16862745098039217: (0.178212, 0.066576, 0.379497, 1.0),
-            0.17254901960784313: (0.184801, 0.065732, 0.387973, 1.0),
-            0.17647058823529413: (0.19146, 0.064818, 0.396152, 1.0),
-            0.1803921568627451: (0.198177, 0.063862, 0.404009, 1.0),
-            0.1843137254901961: (0.204935, 0.062907, 0.411514, 1.0),
-            0.18823529411764706: (0.211718, 0.061992, 0.418647, 1.0),
-            0.19215686274509805: (0.218512, 0.061158, 0.425392, 1.0),
-            0.19607843137254902: (0.225302, 0.060445, 0.431742, 1.0),
-            0.2: (0.232077, 0.059889, 0.437695, 1.0),
-            0.20392156862745098: (0.238826, 0.059517, 0.443256, 1.0),
-            0.20784313725490197: (0.245543, 0.059352, 0.448436, 1.0),
-            0.21176470588235294: (0.25222, 0.059415, 0.453248, 1.0),
-            0.21568627450980393: (0.258857, 0.059706, 0.45771, 1.0),
-            0.2196078431372549: (0.265447, 0.060237, 0.46184, 1.0),
-            0.2235294117647059: (0.271994, 0.060994, 0.46566, 1.0),
-            0.22745098039215686: (0.278493, 0.061978, 0.46919, 1.0),
-            0.23137254901960785: (0.284951, 0.063168, 0.472451, 1.0),
-            0.23529411764705882: (0.291366, 0.064553, 0.475462, 1.0),
-            0.23921568627450981: (0.29774, 0.066117, 0.478243, 1.0),
-            0.24313725490196078: (0.304081, 0.067835, 0.480812, 1.0),
-            0.24705882352941178: (0.310382, 0.069702, 0.483186, 1.0),
-            0.25098039215686274: (0.316654, 0.07169, 0.48538, 1.0),
-            0.2549019607843137: (0.322899, 0.073782, 0.487408, 1.0),
-            0.25882352941176473: (0.329114, 0.075972, 0.489287, 1.0),
-            0.2627450980392157: (0.335308, 0.078236, 0.491024, 1.0),
-            0.26666666666666666: (0.341482, 0.080564, 0.492631, 1.0),
-            0.27058823529411763: (0.347636, 0.082946, 0.494121, 1.0),
-            0.27450980392156865: (0.353773, 0.085373, 0.495501, 1.0),
-            0.2784313725490196: (0.359898, 0.087831, 0.496778, 1.0),
-            0.2823529411764706: (0.366012, 0.090314, 0.49796, 1.0),
-            0.28627450980392155: (0.372116, 0.092816, 0.499053, 1.0),
-            0.2901960784313726: (0.378211, 0.095332, 0.500067, 1.0),
-            0.29411764705882354: (0.384299, 0.097855, 0.501002, 1.0),
-            0.2980392156862745: (0.390384, 0.100379, 0.501864, 1.0),
-            0.30196078431372547: (0.396467, 0.102902, 0.502658, 1.0),
-            0.3058823529411765: (0.402548, 0.10542, 0.503386, 1.0),
-            0.30980392156862746: (0.408629, 0.10793, 0.504052, 1.0),
-            0.3137254901960784: (0.414709, 0.110431, 0.504662, 1.0),
-            0.3176470588235294: (0.420791, 0.11292, 0.505215, 1.0),
-            0.3215686274509804: (0.426877, 0.115395, 0.505714, 1.0),
-            0.3254901960784314: (0.432967, 0.117855, 0.50616, 1.0),
-            0.32941176470588235: (0.439062, 0.120298, 0.506555, 1.0),
-            0.3333333333333333: (0.445163, 0.122724, 0.506901, 1.0),
-            0.33725490196078434: (0.451271, 0.125132, 0.507198, 1.0),
-            0.3411764705882353: (0.457386, 0.127522, 0.507448, 1.0),
-            0.34509803921568627: (0.463508, 0.129893, 0.507652, 1.0),
-            0.34901960784313724: (0.46964, 0.132245, 0.507809, 1.0),
-            0.35294117647058826: (0.47578, 0.134577, 0.507921, 1.0),
-            0.3568627450980392: (0.481929, 0.136891, 0.507989, 1.0),
-            0.3607843137254902: (0.488088, 0.139186, 0.508011, 1.0),
-            0.36470588235294116: (0.494258, 0.141462, 0.507988, 1.0),
-            0.3686274509803922: (0.500438, 0.143719, 0.50792, 1.0),
-            0.37254901960784315: (0.506629, 0.145958, 0.507806, 1.0),
-            0.3764705882352941: (0.512831, 0.148179, 0.507648, 1.0),
-            0.3803921568627451: (0.519045, 0.150383, 0.507443, 1.0),
-            0.3843137254901961: (0.52527, 0.152569, 0.507192, 1.0),
-            0.38823529411764707: (0.531507, 0.154739, 0.506895, 1.0),
-            0.39215686274509803: (0.537755, 0.156894, 0.506551, 1.0),
-            0.396078431372549: (0.544015, 0.159033, 0.506159, 1.0),
-            0.4: (0.550287, 0.161158, 0.505719, 1.0),
-            0.403921568627451: (0.556571, 0.163269, 0.50523, 1.0),
-            0.40784313725490196: (0.562866, 0.165368, 0.504692, 1.0),
-            0.4117647058823529: (0.569172, 0.167454, 0.504105, 1.0),
-            0.41568627450980394: (0.57549, 0.16953, 0.503466, 1.0),
-            0.4196078431372549: (0.581819, 0.171596, 0.502777, 1.0),
-            0.4235294117647059: (0.588158, 0.173652, 0.502035, 1.0),
-            0.42745098039215684: (0.594508, 0.175701, 0.501241, 1.0),
-            0.43137254901960786: (0.600868, 0.177743, 0.500394, 1.0),
-            0.43529411764705883: (0.607238, 0.179779, 0.499492, 1.0),
-            0.4392156862745098: (0.613617, 0.181811, 0.498536, 1.0),
-            0.44313725490196076: (0.620005, 0.18384, 0.497524, 1.0),
-            0.4470588235294118: (0.626401, 0.185867, 0.496456, 1.0),
-            0.45098039215686275: (0.632805, 0.187893, 0.495332, 1.0),
-            0.4549019607843137: (0.639216, 0.189921, 0.49415, 1.0),
-            0.4588235294117647: (0.645633, 0.191952, 0.49291, 1.0),
-            0.4627450980392157: (0.652056, 0.193986, 0.491611, 1.0),
-            0.4666666666666667: (0.658483, 0.196027, 0.490253, 1.0),
-            0.47058823529411764: (0.664915, 0.198075, 0.488836, 1.0),
-            0.4745098039215686: (0.671349, 0.200133, 0.487358, 1.0),
-            0.47843137254901963: (0.677786, 0.202203, 0.485819, 1.0),
-            0.4823529411764706: (0.684224, 0.204286, 0.484219, 1.0),
-            0.48627450980392156: (0.690661, 0.206384, 0.482558, 1.0),
-            0.49019607843137253: (0.697098, 0.208501, 0.480835, 1.0),
-            0.49411764705882355: (0.703532, 0.210638, 0.479049, 1.0),
-            0.4980392156862745: (0.709962, 0.212797, 0.477201, 1.0),
-            0.5019607843137255: (0.716387, 0.214982, 0.47529, 1.0),
-            0.5058823529411764: (0.722805, 0.217194, 0.473316, 1.0),
-            0.5098039215686274: (0.729216, 0.219437, 0.471279, 1.0),
-            0.5137254901960784: (0.735616, 0.221713, 0.46918, 1.0),
-            0.5176470588235295: (0.742004, 0.224025, 0.467018, 1.0),
-            0.5215686274509804: (0.748378, 0.226377, 0.464794, 1.0),
-            0.5254901960784314: (0.754737, 0.228772, 0.462509, 1.0),
-            0.5294117647058824: (0.761077, 0.231214, 0.460162, 1.0),
-            0.5333333333333333: (0.767398, 0.233705, 0.457755, 1.0),
-            0.5372549019607843: (0.773695, 0.236249, 0.455289, 1.0),
-            0.5411764705882353: (0.779968, 0.238851, 0.452765, 1.0),
-            0.5450980392156862: (0.786212, 0.241514, 0.450184, 1.0),
-            0.5490196078431373: (0.792427, 0.244242, 0.447543, 1.0),
-            0.5529411764705883: (0.798608, 0.24704, 0.444848, 1.0),
-            0.5568627450980392: (0.804752, 0.249911, 0.442102, 1.0),
-            0.5607843137254902: (0.810855, 0.252861, 0.439305, 1.0),
-            0.5647058823529412: (0.816914, 0.255895, 0.436461, 1.0),
-            0.5686274509803921: (0.822926, 0.259016, 0.433573, 1.0),
-            0.5725490196078431: (0.828886, 0.262229, 0.430644, 1.0),
-            0.5764705882352941: (0.834791, 0.26554, 0.427671, 1.0),
-            0.5803921568627451: (0.840636, 0.268953, 0.424666, 1.0),
-            0.5843137254901961: (0.846416, 0.272473, 0.421631, 1.0),
-            0.5882352941176471: (0.852126, 0.276106, 0.418573, 1.0),
-            0.592156862745098: (0.857763, 0.279857, 0.415496, 1.0),
-            0.596078431372549: (0.86332, 0.283729, 0.412403, 1.0),
-            0.6: (0.868793, 0.287728, 0.409303, 1.0),
-            0.6039215686274509: (0.874176, 0.291859, 0.406205, 1.0),
-            0.6078431372549019: (0.879464, 0.296125, 0.403118, 1.0),
-            0.611764705882353: (0.884651, 0.30053, 0.400047, 1.0),
-            0.615686274509804: (0.889731, 0.305079, 0.397002, 1.0),
-            0.6196078431372549: (0.8947, 0.309773, 0.393995, 1.0),
-            0.6235294117647059: (0.899552, 0.314616, 0.391037, 1.0),
-            0.6274509803921569: (0.904281, 0.31961, 0.388137, 1.0),
-            0.6313725490196078: (0.908884, 0.324755, 0.385308, 1.0),
-            0.6352941176470588: (0.913354, 0.330052, 0.382563, 1.0),
-            0.6392156862745098: (0.917689, 0.3355, 0.379915, 1.0),
-            0.6431372549019608: (0.921884, 0.341098, 0.377376, 1.0),
-            0.6470588235294118: (0.925937, 0.346844, 0.374959, 1.0),
-            0.6509803921568628: (0.929845, 0.352734, 0.372677, 1.0),
-            0.6549019607843137: (0.933606, 0.358764, 0.370541, 1.0),
-            0.6588235294117647: (0.937221, 0.364929, 0.368567, 1.0),
-            0.6627450980392157: (0.940687, 0.371224, 0.366762, 1.0),
-            0.6666666666666666: (0.944006, 0.377643, 0.365136, 1.0),
-            0.6705882352941176: (0.94718, 0.384178, 0.363701, 1.0),
-            0.6745098039215687: (0.95021, 0.39082, 0.362468, 1.0),
-            0.6784313725490196: (0.953099, 0.397563, 0.361438, 1.0),
-            0.6823529411764706: (0.955849, 0.4044, 0.360619, 1.0),
-            0.6862745098039216: (0.958464, 0.411324, 0.360014, 1.0),
-            0.6901960784313725: (0.960949, 0.418323, 0.35963, 1.0),
-            0.6941176470588235: (0.96331, 0.42539, 0.359469, 1.0),
-            0.6980392156862745: (0.965549, 0.432519, 0.359529, 1.0),
-            0.7019607843137254: (0.967671, 0.439703, 0.35981, 1.0),
-            0.7058823529411765: (0.96968, 0.446936, 0.360311, 1.0),
-            0.7098039215686275: (0.971582, 0.45421, 0.36103, 1.0),
-            0.7137254901960784: (0.973381, 0.46152, 0.361965, 1.0),
-            0.7176470588235294: (0.975082, 0.468861, 0.363111, 1.0),
-            0.7215686274509804: (0.97669, 0.476226, 0.364466, 1.0),
-            0.7254901960784313: (0.97821, 0.483612, 0.366025, 1.0),
-            0.7294117647058823: (0.979645, 0.491014, 0.367783, 1.0),
-            0.7333333333333333: (0.981, 0.498428, 0.369734, 1.0),
-            0.7372549019607844: (0.982279, 0.505851, 0.371874, 1.0),
-            0.7411764705882353: (0.983485, 0.51328, 0.374198, 1.0),
-            0.7450980392156863: (0.984622, 0.520713, 0.376698, 1.0),
-            0.7490196078431373: (0.985693, 0.528148, 0.379371, 1.0),
-            0.7529411764705882: (0.9867, 0.535582, 0.38221, 1.0),
-            0.7568627450980392: (0.987646, 0.543015, 0.38521, 1.0),
-            0.7607843137254902: (0.988533, 0.550446, 0.388365, 1.0),
-            0.7647058823529411: (0.989363, 0.557873, 0.391671, 1.0),
-            0.7686274509803922: (0.990138, 0.565296, 0.395122, 1.0),
-            0.7725490196078432: (0.990871, 0.572706, 0.398714, 1.0),
-            0.7764705882352941: (0.991558, 0.580107, 0.402441, 1.0),
-            0.7803921568627451: (0.992196, 0.587502, 0.406299, 1.0),
-            0.7843137254901961: (0.992785, 0.594891, 0.410283, 1.0),
-            0.788235294117647: (0.993326, 0.602275, 0.41439, 1.0),
-            0.792156862745098: (0.993834, 0.609644, 0.418613, 1.0),
-            0.796078431372549: (0.994309, 0.616999, 0.42295, 1.0),
-            0.8: (0.994738, 0.62435, 0.427397, 1.0),
-            0.803921568627451: (0.995122, 0.631696, 0.431951, 1.0),
-            0.807843137254902: (0.99548, 0.639027, 0.436607, 1.0),
-            0.8117647058823529: (0.99581, 0.646344, 0.441361, 1.0),
-            0.8156862745098039: (0.996096, 0.653659, 0.446213, 1.0),
-            0.8196078431372549: (0.996341, 0.660969, 0.45116, 1.0),
-            0.8235294117647058: (0.99658, 0.668256, 0.456192, 1.0),
-            0.8274509803921568: (0.996775, 0.675541, 0.461314, 1.0),
-            0.8313725490196079: (0.996925, 0.682828, 0.466526, 1.0),
-            0.8352941176470589: (0.997077, 0.690088, 0.471811, 1.0),
-            0.8392156862745098: (0.997186, 0.697349, 0.477182, 1.0),
-            0.8431372549019608: (0.997254, 0.704611, 0.482635, 1.0),
-            0.8470588235294118: (0.997325, 0.711848, 0.488154, 1.0),
-            0.8509803921568627: (0.997351, 0.719089, 0.493755, 1.0),
-            0.8549019607843137: (0.997351, 0.726324, 0.499428, 1.0),
-            0.8588235294117647: (0.997341, 0.733545, 0.505167, 1.0),
-            0.8627450980392157: (0.997285, 0.740772, 0.510983, 1.0),
-            0.8666666666666667: (0.997228, 0.747981, 0.516859, 1.0),
-            0.8705882352941177: (0.997138, 0.75519, 0.522806, 1.0),
-            0.8745098039215686: (0.997019, 0.762398, 0.528821, 1.0),
-            0.8784313725490196: (0.996898, 0.769591, 0.534892, 1.0),
-            0.8823529411764706: (0.996727, 0.776795, 0.541039, 1.0),
-            0.8862745098039215: (0.996571, 0.783977, 0.547233, 1.0),
-            0.8901960784313725: (0.996369, 0.791167, 0.553499, 1.0),
-            0.8941176470588236: (0.996162, 0.798348, 0.55982, 1.0),
-            0.8980392156862745: (0.995932, 0.805527, 0.566202, 1.0),
-            0.9019607843137255: (0.99568, 0.812706, 0.572645, 1.0),
-            0.9058823529411765: (0.995424, 0.819875, 0.57914, 1.0),
-            0.9098039215686274: (0.995131, 0.827052, 0.585701, 1.0),
-            0.9137254901960784: (0.994851, 0.834213, 0.592307, 1.0),
-            0.9176470588235294: (0.994524, 0.841387, 0.598983, 1.0),
-            0.9215686274509803: (0.994222, 0.84854, 0.605696, 1.0),
-            0.9254901960784314: (0.993866, 0.855711, 0.612482, 1.0),
-            0.9294117647058824: (0.993545, 0.862859, 0.619299, 1.0),
-            0.9333333333333333: (0.99317, 0.870024, 0.626189, 1.0),
-            0.9372549019607843: (0.992831, 0.877168, 0.633109, 1.0),
-            0.9411764705882353: (0.99244, 0.88433, 0.640099, 1.0),
-            0.9450980392156862: (0.992089, 0.89147, 0.647116, 1.0),
-            0.9490196078431372: (0.991688, 0.898627, 0.654202, 1.0),
-            0.9529411764705882: (0.991332, 0.905763, 0.661309, 1.0),
-            0.9568627450980393: (0.99093, 0.912915, 0.668481, 1.0),
-            0.9607843137254902: (0.99057, 0.920049, 0.675675, 1.0),
-            0.9647058823529412: (0.990175, 0.927196, 0.682926, 1.0),
-            0.9686274509803922: (0.989815, 0.934329, 0.690198, 1.0),
-            0.9725490196078431: (0.989434, 0.94147, 0.697519, 1.0),
-            0.9764705882352941: (0.989077, 0.948604, 0.704863, 1.0),
-            0.9803921568627451: (0.988717, 0.955742, 0.712242, 1.0),
-            0.984313725490196: (0.988367, 0.962878, 0.719649, 1.0),
-            0.9882352941176471: (0.988033, 0.970012, 0.727077, 1.0),
-            0.9921568627450981: (0.987691, 0.977154, 0.734536, 1.0),
-            0.996078431372549: (0.987387, 0.984288, 0.742002, 1.0),
-            1.0: (0.987053, 0.991438, 0.749504, 1.0)
-            },
-        "stress":{
-            0.0:  hex2rgb("#000077"),
-            0.5:  hex2rgb("#0000FF"),
-            0.75: hex2rgb("#0099FF"),
-            0.90: hex2rgb("#FFFF00"),
-            0.95: hex2rgb("#FF6600"),
-            0.99: hex2rgb("#FF3300"),
-            },
-        "fifty_percent":{
-            0.5:  hex2rgb("#000077"),
-            0.6:  hex2rgb("#0000FF"),
-            0.7:  hex2rgb("#0099FF"),
-            0.8:  hex2rgb("#FFFF00"),
-            0.9:  hex2rgb("#FF6600"),
-            0.99: hex2rgb("#FF3300"),
-            },
-        "combined_weakness": {
-            0.81: hex2rgb("#005AC3"),
-            0.87: hex2rgb("#61CF4D"),
-            0.93: hex2rgb("#FFF414"),
-            0.99: hex2rgb("#CA0300"),
-            },
-        "ninety_percent": {
-            0.90: hex2rgb("#005AC3"),
-            0.93: hex2rgb("#61CF4D"),
-            0.96: hex2rgb("#FFF414"),
-            0.99: hex2rgb("#CA0300"),
-            },
-        "ninety_seven_percent": {
-            0.97: hex2rgb("#005AC3"),
-            0.98: hex2rgb("#61CF4D"),
-            0.99: hex2rgb("#FFF414"),
-            0.999: hex2rgb("#CA0300"),
-            },
-        "stress_vs_trace": {
-            0.90: hex2rgb("#005AC3"),
-            0.93: hex2rgb("#61CF4D"),
-            0.96: hex2rgb("#FFF414"),
-            0.99: hex2rgb("#CA0300"),
-            },
-        "droptest_lower": {
-            0.84: hex2rgb("#005AC3"),
-            0.89: hex2rgb("#61CF4D"),
-            0.94: hex2rgb("#FFF414"),
-            0.99: hex2rgb("#CA0300"),
-            },
-        "droptest": {
-            0.90: hex2rgb("#005AC3"),
-            0.93: hex2rgb("#61CF4D"),
-            0.96: hex2rgb("#FFF414"),
-            0.99: hex2rgb("#CA0300"),
-            },
-        "droptest_squash": {
-            0.90: hex2rgb("#005AC3"),
-            0.95: hex2rgb("#61CF4D"),
-            0.98: hex2rgb("#FFF414"),
-            1.00: hex2rgb("#CA0300"),
-            },
-        "droptest_higher": {
-            0.93: hex2rgb("#005AC3"),
-            0.95: hex2rgb("#61CF4D"),
-            0.97: hex2rgb("#FFF414"),
-            0.99: hex2rgb("#CA0300"),
-            },
-        "droptest_higher_squash": {
-            0.93: hex2rgb("#005AC3"),
-            0.96: hex2rgb("#61CF4D"),
-            0.99: hex2rgb("#FFF414"),
-            1.00: hex2rgb("#CA0300"),
-            },
-        "region": {
-            0.1: hex2rgb("#124EB1"),
-            0.9: hex2rgb("#FFE900"),
-            },
-        "two_regions": {
-            0.1: hex2rgb("#124EB1"),
-            0.4: hex2rgb("#FFE900"),
-            0.6: hex2rgb("#FFE900"),
-            0.9: hex2rgb("#CB1E0E")
-            },
-        "three_regions": {
-            0.1: hex2rgb("#124EB1"),
-            0.3: hex2rgb("#FFE900"),
-            0.4: hex2rgb("#FFE900"),
-            0.5: hex2rgb("#CB1E0E"),
-            0.6: hex2rgb("#CB1E0E"),
-            0.9: hex2rgb("#518F27")
-            },
-        "jet": {
-            0.1: hex2rgb("#00007F"),
-            0.2: hex2rgb("#0000FF"),
-            0.3: hex2rgb("#007FFF"),
-            0.4: hex2rgb("#00FFFF"),
-            0.5: hex2rgb("#7FFF7F"),
-            0.6: hex2rgb("#FFFF00"),
-            0.7: hex2rgb("#FF7F00"),
-            0.8: hex2rgb("#FF0000"),
-            0.9: hex2rgb("#7F0000"),
-            },
-        "fireprint": {
-                 0: (     0,      0,      0, 1.0),
-            0.0526: (     0, 0.0456, 0.0790, 1.0),
-            0.1053: (     0, 0.0912, 0.1580, 1.0),
-            0.1579: (     0, 0.1367, 0.2371, 1.0),
-            0.2105: (     0, 0.1823, 0.3161, 1.0),
-            0.2632: (0.0167, 0.2274, 0.3950, 1.0),
-            0.3158: (0.1158, 0.2647, 0.4649, 1.0),
-            0.3684: (0.2690, 0.2803, 0.5070, 1.0),
-            0.4211: (0.4673, 0.2501, 0.5018, 1.0),
-            0.4737: (0.6715, 0.1700, 0.4400, 1.0),
-            0.5263: (0.8127, 0.2061, 0.3579, 1.0),
-            0.5789: (0.8868, 0.3779, 0.2762, 1.0),
-            0.6316: (0.9268, 0.5487, 0.1915, 1.0),
-            0.6842: (0.9404, 0.7134, 0.1059, 1.0),
-            0.7368: (0.9376, 0.8659, 0.0210, 1.0),
-            0.7895: (0.9853, 0.9351, 0.1573, 1.0),
-            0.8421: (0.9985, 0.9715, 0.4324, 1.0),
-            0.8947: (0.9980, 0.9954, 0.6462, 1.0),
-            0.9474: (0.9962, 0.9976, 0.8431, 1.0),
-            1.0000: (1.0000, 1.0000, 1.0000, 1.0)
-            },
-        "jet_matlab": {
-                0     : (     0,      0, 0.6000, 1.0),
-                0.0526: (     0,      0, 0.8000, 1.0),
-                0.1053: (     0,      0, 1.0000, 1.0),
-                0.1579: (     0, 0.2000, 1.0000, 1.0),
-                0.2105: (     0, 0.4000, 1.0000, 1.0),
-                0.2632: (     0, 0.6000, 1.0000, 1.0),
-                0.3158: (     0, 0.8000, 1.0000, 1.0),
-                0.3684: (     0, 1.0000, 1.0000, 1.0),
-                0.4211: (0.2000, 1.0000, 0.8000, 1.0),
-                0.4737: (0.4000, 1.0000, 0.6000, 1.0),
-                0.5263: (0.6000, 1.0000, 0.4000, 1.0),
-                0.5789: (0.8000, 1.0000, 0.2000, 1.0),
-                0.6316: (1.0000, 1.0000,      0, 1.0),
-                0.6842: (1.0000, 0.8000,      0, 1.0),
-                0.7368: (1.0000, 0.6000,      0, 1.0),
-                0.7895: (1.0000, 0.4000,      0, 1.0),
-                0.8421: (1.0000, 0.2000,      0, 1.0),
-                0.8947: (1.0000,      0,      0, 1.0),
-                0.9474: (0.8000,      0,      0, 1.0),
-                1.0000: (0.6000,      0,      0, 1.0)
-                },
-        "discrete": {
-                0.0: hex2rgb("#FCFFD9"),
-                0.1: hex2rgb("#5977E9"),
-                0.2: hex2rgb("#FF8649"),
-                0.3: hex2rgb("#56B4E9"),
-                0.4: hex2rgb("#B2F673"),
-                0.5: hex2rgb("#FF6F69"),
-                0.6: hex2rgb("#96CEB4"),
-                0.7: hex2rgb("#FFCC5C"),
-                0.8: hex2rgb("#AAD8B0"),
-                0.9: hex2rgb("#36362C"),
-                1.0: hex2rgb("#DDDDDD")
-                },
-        "warm": {
-                0.0: hex2rgb("#FFE870"),
-                1.0: hex2rgb("#ED3225"),
-                },
-        "YlOrRd": {
-                0.0: hex2rgb("#FFFECC"),
-                0.5: hex2rgb("#FF8F31"),
-                1.0: hex2rgb("#87101C"),
-                },
-        "RdYlGn": {
-                0.0: hex2rgb("#AD1718"),
-                0.5: hex2rgb("#FFFDBF"),
-                1.0: hex2rgb("#006734"),
-                },
-        # This color map is the "RdYlBu" from http://colorbrewer2.org
-        "RdYlBu": {
-                0.1: hex2rgb("#d7191c"),
-                0.3: hex2rgb("#fdae61"),
-                0.5: hex2rgb("#ffffbf"),
-                0.7: hex2rgb("#abd9e9"),
-                0.9: hex2rgb("#2c7bb6"),
-                },
-        "BuYlRd": {
-                0.1: hex2rgb("#2c7bb6"),
-                0.3: hex2rgb("#abd9e9"),
-                0.5: hex2rgb("#ffffbf"),
-                0.7: hex2rgb("#fdae61"),
-                0.9: hex2rgb("#d7191c"),
-                },
-        # The following color map are from the paper
-        # http://www.sandia.gov/~kmorel/documents/ColorMaps/ColorMapsExpanded.pdf
-        "cool_warm": {
-                0.0    : int2rgb([ 59,  76, 192]),
-                0.03125: int2rgb([ 68,  90, 204]),
-                0.0625 : int2rgb([ 77, 104, 215]),
-                0.09375: int2rgb([ 87, 117, 225]),
-                0.125  : int2rgb([ 98, 130, 234]),
-                0.15625: int2rgb([108, 142, 241]),
-                0.1875 : int2rgb([119, 154, 247]),
-                0.21875: int2rgb([130, 165, 251]),
-                0.25   : int2rgb([141, 176, 254]),
-                0.28125: int2rgb([152, 185, 255]),
-                0.3125 : int2rgb([163, 194, 255]),
-                0.34375: int2rgb([174, 201, 253]),
-                0.375  : int2rgb([184, 208, 249]),
-                0.40625: int2rgb([194, 213, 244]),
-                0.4375 : int2rgb([204, 217, 238]),
-                0.46875: int2rgb([213, 219, 230]),
-                0.5    : int2rgb([221, 221, 221]),
-                0.53125: int2rgb([229, 216, 209]),
-                0.5625 : int2rgb([236, 221, 197]),
-                0.59375: int2rgb([241, 204, 185]),
-                0.625  : int2rgb([245, 196, 173]),
-                0.65625: int2rgb([247, 187, 160]),
-                0.6875 : int2rgb([247, 177, 148]),
-                0.71875: int2rgb([247, 166, 135]),
-                0.75   : int2rgb([244, 154, 123]),
-                0.78125: int2rgb([241, 141, 111]),
-                0.8125 : int2rgb([236, 127,  99]),
-                0.84375: int2rgb([229, 121,  88]),
-                0.875  : int2rgb([222,  96,  77]),
-                0.90625: int2rgb([213,  80,  66]),
-                0.9375 : int2rgb([203,  62,  56]),
-                0.96875: int2rgb([192,  40,  47]),
-                1.0    : int2rgb([180,   4,  38]),
-                },
-        # The following are sampled from Matlab Parula color map.
-        # http://www.alecjacobson.com/weblog/?tag=parula
-        "parula": {
-                0.0000: hex2rgb("#2D3785"),
-                0.0667: hex2rgb("#2854BA"),
-                0.1333: hex2rgb("#0D71DE"),
-                0.1333: hex2rgb("#0D71DE"),
-                0.2000: hex2rgb("#277FD8"),
-                0.2667: hex2rgb("#368CD0"),
-                0.3333: hex2rgb("#419DCC"),
-                0.4000: hex2rgb("#4CA8BE"),
-                0.4667: hex2rgb("#58B0AA"),
-                0.5333: hex2rgb("#6DB692"),
-                0.6000: hex2rgb("#8DB97C"),
-                0.6667: hex2rgb("#ACB96D"),
-                0.7333: hex2rgb("#C9B762"),
-                0.8000: hex2rgb("#E6B758"),
-                0.8667: hex2rgb("#F7C448"),
-                0.9333: hex2rgb("#F4D83C"),
-                1.0000: hex2rgb("#FDF334"),
-                },
-        "contrast_yb": {
-                0.000: hex2rgb("#EFE442"),
-                1.000: hex2rgb("#57B4E9"),
-                },
-        "contrast_by": {
-                0.000: hex2rgb("#57B4E9"),
-                1.000: hex2rgb("#EFE442"),
-                },
-        "contrast_yr": {
-                0.000: hex2rgb("#EFE442"),
-                1.000: hex2rgb("#d7191c"),
-                },
-        "binary": {
-                0.000: hex2rgb("#F28C58"),
-                1.000: hex2rgb("#EFE442"),
-                },
-        "binary_reverse": {
-                0.000: hex2rgb("#EFE442"),
-                1.000: hex2rgb("#F28C58"),
-                },
-        "discrete_3": {
-                0.000: hex2rgb("#F28C58"),
-                0.500: hex2rgb("#EFE442"),
-                1.000: hex2rgb("#99D594"),
-                },
-        "discrete_4": {
-                0.000: hex2rgb("#F28C58"),
-                0.333: hex2rgb("#EFE442"),
-                0.666: hex2rgb("#99D594"),
-                1.000: hex2rgb("#57B4E9"),
-                },
-        };
+# Color maps are stored in color_maps.npz as one (N, 5) array per name.  Each
+# row is [key, r, g, b, a] and rows are sorted by key.  The archive is only
+# opened on first use and each color map is read when requested.
+_color_map_file = None;
+
+def _get_color_map_file():
+    global _color_map_file;
+    if _color_map_file is None:
+        _color_map_file = np.load(COLOR_MAP_FILE);
+    return _color_map_file;
+
+def get_color_map_names():
+    return list(_get_color_map_file().files);
+
+def has_color_map(name):
+    return name in _get_color_map_file().files;
+
+def load_color_map(name):
+    """ Return the (N, 5) array of sorted keys and RGBA colors of a
+    predefined color map.
+    """
+    if not has_color_map(name):
+        raise KeyError("Unknown color map: {}".format(name));
+    return _get_color_map_file()[name];
+
+def save_color_maps(color_maps, filename=COLOR_MAP_FILE):
+    """ Write color_maps, a dict mapping names to {key: rgba} dicts, into the
+    packed format read by load_color_map().
+    """
+    data = {};
+    for name, colors in color_maps.items():
+        keys = sorted(colors.keys());
+        data[name] = np.array([[key] + list(colors[key]) for key in keys],
+                dtype=float);
+    np.savez_compressed(filename, **data);
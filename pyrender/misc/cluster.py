@@ -1,116 +1,327 @@
-from math import pi
+from math import pi, sqrt
+import multiprocessing
 import numpy as np
 from numpy.linalg import norm
-import pymesh
 
-class Cluster:
+class Cluster(object):
+    """ Group nearby points with similar normals and vectors.
+
+    Seeds are refined iteratively: every point joins the first seed (in seed
+    order) within cluster_radius whose normal and vector are close enough,
+    then each seed moves to the mean of its cluster.  Neighbor queries go
+    through a uniform voxel grid and are processed in chunks of at most
+    max_pairs_per_chunk candidate (seed, point) pairs.  With num_processes
+    greater than 1, chunks are matched in a process pool.
+
+    After run(), labels[i] is the cluster of point i (-1 if none), and
+    seed_points, seed_normals and seed_vectors hold one row per cluster.
+    """
     def __init__(self, points):
-        self.points = points;
+        self.points = np.asarray(points, dtype=float);
         self.normals = None;
         self.normal_angle_threshold = pi / 2.0;
         self.vectors = None;
         self.vector_angle_threshold = pi / 2.0;
+        self.max_pairs_per_chunk = 1<<22;
+        self.num_processes = 1;
 
     def use_normals(self, normals):
-        self.normals = normals;
+        self.normals = np.asarray(normals, dtype=float);
 
     def use_vectors(self, vectors):
-        self.vectors = vectors;
+        self.vectors = np.asarray(vectors, dtype=float);
 
     def run(self, cluster_radius, max_iterations = 10):
         self.radius = cluster_radius;
-        self.__init_clusters();
-        for i in range(max_iterations):
-            converged = self.__update_clusters();
-            if converged: break;
+        self.__matcher = _SeedMatcher(self.points, self.normals, self.vectors,
+                cluster_radius, self.normal_angle_threshold,
+                self.vector_angle_threshold, self.max_pairs_per_chunk);
+
+        self.__pool = None;
+        if self.num_processes > 1:
+            self.__pool = multiprocessing.Pool(self.num_processes,
+                    initializer=_init_worker, initargs=(self.__matcher,));
+        try:
+            self.__init_clusters();
+            for i in range(max_iterations):
+                converged = self.__update_clusters();
+                if converged: break;
+        finally:
+            if self.__pool is not None:
+                self.__pool.close();
+                self.__pool.join();
+                self.__pool = None;
+
+    @property
+    def seeds(self):
+        """ List of (point, normal, vector) tuples, one per cluster.
+        """
+        num_seeds = len(self.seed_points);
+        normals = self.seed_normals if self.seed_normals is not None \
+                else np.zeros((num_seeds, 3));
+        vectors = self.seed_vectors if self.seed_vectors is not None \
+                else np.zeros((num_seeds, 3));
+        return list(zip(self.seed_points, normals, vectors));
+
+    @property
+    def clusters(self):
+        """ List of point index arrays, one per cluster.
+        """
+        if len(self.seed_points) == 0: return [];
+        assigned = np.flatnonzero(self.labels >= 0);
+        order = np.argsort(self.labels[assigned], kind="stable");
+        counts = np.bincount(self.labels[assigned],
+                minlength=len(self.seed_points));
+        return np.split(assigned[order], np.cumsum(counts)[:-1]);
 
     def __init_clusters(self):
+        """ Seed clusters in rounds.  Each round seeds the first unassigned
+        point of every cell of a grid fine enough that a cell fits within the
+        cluster radius, then assigns the unassigned points to the new seeds.
+        """
         num_pts = len(self.points);
+        self.labels = np.full(num_pts, -1, dtype=int);
+        seed_indices = [];
+        cell_size = self.radius / sqrt(3.0);
+        origin = np.amin(self.points, axis=0) if num_pts > 0 else 0.0;
 
-        self.grid = pymesh.HashGrid.create(self.radius, 3);
-        self.grid.insert_multiple(np.arange(num_pts, dtype=int), self.points);
-
-        self.seeds = [];
-        self.clusters = [];
+        num_seeds = 0;
+        while True:
+            unassigned = np.flatnonzero(self.labels < 0);
+            if len(unassigned) == 0: break;
+            cells = np.floor(
+                    (self.points[unassigned] - origin) / cell_size);
+            _, first = np.unique(cells, axis=0, return_index=True);
+            new_seeds = unassigned[np.sort(first)];
 
-        visited = np.zeros(num_pts, dtype=bool);
-        for i in range(num_pts):
-            if visited[i]: continue;
-            seed_point, seed_normal, seed_vector = self.__get_data(i);
+            labels = self.__match(*self.__get_seed_data(new_seeds));
+            free = np.logical_and(self.labels < 0, labels >= 0);
+            self.labels[free] = labels[free] + num_seeds;
+            # A seed always belongs to its own cluster.
+            seed_labels = np.arange(num_seeds, num_seeds + len(new_seeds));
+            own = self.labels[new_seeds] < 0;
+            self.labels[new_seeds[own]] = seed_labels[own];
 
-            neighbors = self.grid.get_items_near_point(seed_point).ravel();
-            neighbors = self.__filter_based_on_distance(seed_point, neighbors);
-            neighbors = self.__filter_based_on_normal(seed_normal, neighbors);
-            neighbors = self.__filter_based_on_vector(seed_vector, neighbors);
+            seed_indices.append(new_seeds);
+            num_seeds += len(new_seeds);
 
-            visited[neighbors] = True;
-            self.seeds.append((seed_point, seed_normal, seed_vector));
-            self.clusters.append(neighbors);
+        if len(seed_indices) > 0:
+            seed_indices = np.concatenate(seed_indices);
+        else:
+            seed_indices = np.zeros(0, dtype=int);
+        self.seed_points, self.seed_normals, self.seed_vectors = \
+                self.__get_seed_data(seed_indices);
 
     def __update_clusters(self):
-        self.__update_cluster_seeds();
-        seed_offsets = self.__form_clusters();
-        return np.amax(seed_offsets) < 0.1 * self.radius;
+        seed_offsets = self.__update_cluster_seeds();
+        self.__form_clusters();
+        return len(seed_offsets) == 0 or \
+                np.amax(seed_offsets) < 0.1 * self.radius;
 
     def __update_cluster_seeds(self):
-        num_clusters = len(self.clusters);
-        assert(num_clusters == len(self.seeds));
+        """ Move every seed to the mean of its cluster and drop empty
+        clusters.  Returns the distance each remaining seed moved.
+        """
+        num_clusters = len(self.seed_points);
+        assigned = self.labels >= 0;
+        labels = self.labels[assigned];
+        counts = np.bincount(labels, minlength=num_clusters);
+        non_empty = counts > 0;
 
-        seed_offsets = [];
-        for i in range(num_clusters):
-            curr_seed_point, curr_seed_normal, curr_seed_vector = self.seeds[i];
-            indices = self.clusters[i];
+        def cluster_mean(data):
+            if data is None: return None;
+            sums = np.array([
+                np.bincount(labels, weights=data[assigned, i],
+                    minlength=num_clusters)
+                for i in range(data.shape[1]) ]).T;
+            return sums[non_empty] / counts[non_empty, None];
 
-            seed_point = np.mean(self.points[indices], axis=0);
-            seed_normal = np.mean(self.normals[indices], axis=0);
-            seed_vector = np.mean(self.vectors[indices], axis=0);
-            self.seeds[i] = (seed_point, seed_normal, seed_vector);
-
-            seed_offsets.append(norm(curr_seed_point - seed_point));
+        seed_points = cluster_mean(self.points);
+        seed_offsets = norm(seed_points - self.seed_points[non_empty], axis=1);
+        self.seed_points = seed_points;
+        self.seed_normals = cluster_mean(self.normals);
+        self.seed_vectors = cluster_mean(self.vectors);
         return seed_offsets;
 
     def __form_clusters(self):
-        num_clusters = len(self.clusters);
-        num_pts = len(self.points);
-        visited = np.zeros(num_pts, dtype=bool);
-
-        for i in range(num_clusters):
-            seed_point, seed_normal, seed_vector = self.seeds[i];
-
-            neighbors = self.grid.get_items_near_point(seed_point).ravel();
-            neighbors = neighbors[np.logical_not(visited[neighbors])];
-
-            neighbors = self.__filter_based_on_distance(seed_point, neighbors);
-            neighbors = self.__filter_based_on_normal(seed_normal, neighbors);
-            neighbors = self.__filter_based_on_vector(seed_vector, neighbors);
-
-            visited[neighbors] = True;
-            self.seeds.append((seed_point, seed_normal, seed_vector));
-            self.clusters.append(neighbors);
-
-    def __filter_based_on_distance(self, seed_point, candidates):
-        candidate_points = self.points[candidates];
-        distances = norm(candidate_points - seed_point, axis=1);
-        return candidates[distances < self.radius];
-
-    def __filter_based_on_normal(self, seed_normal, candidates):
-        candidate_normals = self.normals[candidates];
-        projections = np.dot(candidate_normals, seed_normal);
-        projections = np.clip(projections, -1.0, 1.0);
-        angles = np.arccos(projections);
-        return candidates[np.fabs(angles) < self.normal_angle_threshold];
-
-    def __filter_based_on_vector(self, seed_vector, candidates):
-        candidate_vectors = self.vectors[candidates];
-        projections = np.dot(candidate_vectors, seed_vector);
-        cross_vectors = norm(np.cross(candidate_vectors, seed_vector), axis=1);
-        angles = np.arctan2(cross_vectors, projections);
-        assert(not np.isnan(angles).any());
-        return candidates[np.fabs(angles) < self.vector_angle_threshold];
-
-    def __get_data(self, i):
-        p = self.points[i];
-        n = np.zeros(3) if self.normals is None else self.normals[i];
-        v = np.zeros(3) if self.vectors is None else self.vectors[i];
-        return p,n,v;
+        self.labels = self.__match(self.seed_points, self.seed_normals,
+                self.seed_vectors);
+
+    def __match(self, seed_points, seed_normals, seed_vectors):
+        """ Return the label of every point: the index of the first seed that
+        accepts it, or -1.
+        """
+        num_seeds = len(seed_points);
+        if self.__pool is None or num_seeds < self.num_processes:
+            results = [self.__matcher.match(seed_points, seed_normals,
+                seed_vectors)];
+        else:
+            tasks = [];
+            block_size = -(-num_seeds // (4 * self.num_processes));
+            for begin in range(0, num_seeds, block_size):
+                end = begin + block_size;
+                tasks.append((begin, seed_points[begin:end],
+                    None if seed_normals is None else seed_normals[begin:end],
+                    None if seed_vectors is None else seed_vectors[begin:end]));
+            results = self.__pool.map(_match_task, tasks);
+
+        labels = np.full(len(self.points), num_seeds, dtype=int);
+        for points, seeds in results:
+            labels[points] = np.minimum(labels[points], seeds);
+        labels[labels == num_seeds] = -1;
+        return labels;
+
+    def __get_seed_data(self, indices):
+        normals = None if self.normals is None else self.normals[indices];
+        vectors = None if self.vectors is None else self.vectors[indices];
+        return self.points[indices], normals, vectors;
+
+class _SeedMatcher(object):
+    """ Voxel grid over the points, used to find for every point the first
+    seed that accepts it.
+    """
+    def __init__(self, points, normals, vectors, radius,
+            normal_angle_threshold, vector_angle_threshold,
+            max_pairs_per_chunk):
+        self.num_points = len(points);
+        self.use_normals = normals is not None;
+        self.use_vectors = vectors is not None;
+        self.radius = radius;
+        self.min_normal_projection = np.cos(normal_angle_threshold);
+        self.max_vector_cos = np.cos(vector_angle_threshold);
+        self.max_pairs_per_chunk = max_pairs_per_chunk;
+
+        # Cells are padded by one on each side so that neighbor cells of any
+        # point inside the bounding box have non-negative coordinates.
+        num_pts = len(points);
+        self.origin = np.amin(points, axis=0) - radius if num_pts > 0 \
+                else np.zeros(3);
+        cells = self.__get_cells(points);
+        self.dims = np.amax(cells, axis=0) + 2 if num_pts > 0 \
+                else np.ones(3, dtype=int);
+        keys = self.__get_keys(cells);
+        self.order = np.argsort(keys, kind="stable");
+        # Point data sorted by cell, so that candidates of a cell are read
+        # from contiguous memory.
+        self.sorted_points = points[self.order];
+        if self.use_normals:
+            self.sorted_normals = normals[self.order];
+        if self.use_vectors:
+            self.sorted_vectors = vectors[self.order];
+            self.sorted_vector_lengths = norm(self.sorted_vectors, axis=1);
+        self.cell_keys, self.cell_starts, self.cell_counts = np.unique(
+                keys[self.order], return_index=True, return_counts=True);
+        # Use a dense cell table when the grid is small enough, otherwise
+        # look cells up by binary search.
+        num_cells = np.prod(self.dims);
+        if num_cells <= max(8 * num_pts, 1<<20):
+            self.cell_table = np.full(num_cells, -1, dtype=int);
+            self.cell_table[self.cell_keys] = np.arange(len(self.cell_keys));
+        else:
+            self.cell_table = None;
+
+        offsets = np.arange(-1, 2);
+        self.neighbor_offsets = np.array(
+                np.meshgrid(offsets, offsets, offsets, indexing="ij"))\
+                        .reshape((3, -1)).T;
+
+    def match(self, seed_points, seed_normals, seed_vectors):
+        """ Return (point_indices, seed_indices) where seed_indices[i] is the
+        first seed accepting point point_indices[i].  Points accepted by no
+        seed are omitted.
+        """
+        num_seeds = len(seed_points);
+        if num_seeds == 0 or self.num_points == 0:
+            return np.zeros(0, dtype=int), np.zeros(0, dtype=int);
+        # Seeds are means of points, so they lie inside the padded grid.
+        cells = np.clip(self.__get_cells(seed_points), 1, self.dims - 2);
+        neighbor_cells = cells[:, None, :] + self.neighbor_offsets[None, :, :];
+        keys = self.__get_keys(neighbor_cells.reshape((-1, 3)));
+        if self.cell_table is not None:
+            slots = self.cell_table[keys];
+            found = slots >= 0;
+        else:
+            slots = np.searchsorted(self.cell_keys, keys);
+            slots = np.minimum(slots, len(self.cell_keys) - 1);
+            found = self.cell_keys[slots] == keys;
+        counts = np.where(found, self.cell_counts[slots], 0)\
+                .reshape((num_seeds, -1));
+        starts = self.cell_starts[slots].reshape((num_seeds, -1));
+
+        # Split seeds so that each chunk has a bounded number of pairs.
+        pairs_per_seed = np.sum(counts, axis=1);
+        chunk_ids = np.cumsum(pairs_per_seed) // self.max_pairs_per_chunk;
+        chunk_bounds = np.flatnonzero(np.diff(chunk_ids)) + 1;
+        chunk_bounds = np.concatenate([[0], chunk_bounds, [num_seeds]]);
+
+        labels = np.full(self.num_points, num_seeds, dtype=int);
+        for begin, end in zip(chunk_bounds[:-1], chunk_bounds[1:]):
+            if end <= begin: continue;
+            seeds, positions = self.__expand_pairs(
+                    starts[begin:end], counts[begin:end]);
+            seeds += begin;
+            seeds, positions = self.__accept(seeds, positions, seed_points,
+                    seed_normals, seed_vectors);
+            np.minimum.at(labels, self.order[positions], seeds);
+        points = np.flatnonzero(labels < num_seeds);
+        return points, labels[points];
+
+    def __expand_pairs(self, starts, counts):
+        """ Expand per seed cell ranges into (seed, position) pairs, where
+        position indexes the points sorted by cell.
+        """
+        num_seeds = len(starts);
+        pairs_per_seed = np.sum(counts, axis=1);
+        counts = counts.ravel();
+        starts = starts.ravel();
+        total = np.sum(counts);
+        seeds = np.repeat(np.arange(num_seeds), pairs_per_seed);
+        range_starts = np.cumsum(counts) - counts;
+        positions = np.repeat(starts - range_starts, counts) + np.arange(total);
+        return seeds, positions;
+
+    def __accept(self, seeds, positions, seed_points, seed_normals,
+            seed_vectors):
+        """ Return the (seed, position) pairs that pass the distance, normal
+        and vector tests.  Each test only looks at the pairs kept by the
+        previous one.
+        """
+        offsets = self.sorted_points[positions] - seed_points[seeds];
+        keep = np.einsum("ij,ij->i", offsets, offsets) < self.radius**2;
+        seeds, positions = seeds[keep], positions[keep];
+        if self.use_normals:
+            projections = np.einsum("ij,ij->i",
+                    self.sorted_normals[positions], seed_normals[seeds]);
+            projections = np.clip(projections, -1.0, 1.0);
+            keep = projections > self.min_normal_projection;
+            seeds, positions = seeds[keep], positions[keep];
+        if self.use_vectors:
+            # The angle between a and b is below the threshold iff
+            # a.b > |a||b|cos(threshold).  Zero vectors are always accepted.
+            projections = np.einsum("ij,ij->i",
+                    self.sorted_vectors[positions], seed_vectors[seeds]);
+            lengths = self.sorted_vector_lengths[positions] * \
+                    norm(seed_vectors[seeds], axis=1);
+            keep = np.logical_or(lengths == 0.0,
+                    projections > lengths * self.max_vector_cos);
+            seeds, positions = seeds[keep], positions[keep];
+        return seeds, positions;
+
+    def __get_cells(self, points):
+        return np.floor((points - self.origin) / self.radius).astype(np.int64);
+
+    def __get_keys(self, cells):
+        return (cells[:, 0] * self.dims[1] + cells[:, 1]) * self.dims[2] +\
+                cells[:, 2];
+
+_worker_matcher = None;
+
+def _init_worker(matcher):
+    global _worker_matcher;
+    _worker_matcher = matcher;
 
+def _match_task(task):
+    seed_offset, seed_points, seed_normals, seed_vectors = task;
+    points, seeds = _worker_matcher.match(seed_points, seed_normals,
+            seed_vectors);
+    return points, seeds + seed_offset;
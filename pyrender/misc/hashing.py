@@ -0,0 +1,18 @@
+import hashlib
+import numpy as np
+
+def hash_content(*values):
+    """ Return a hex digest identifying the content of values.
+
+    Arrays are hashed by dtype, shape and raw data, anything else by its
+    repr.
+    """
+    m = hashlib.sha1();
+    for value in values:
+        if isinstance(value, np.ndarray):
+            value = np.ascontiguousarray(value);
+            m.update(repr((value.dtype.str, value.shape)).encode("utf-8"));
+            m.update(value.reshape(-1).view(np.uint8));
+        else:
+            m.update(repr(value).encode("utf-8"));
+    return m.hexdigest();
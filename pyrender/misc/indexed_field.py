@@ -0,0 +1,83 @@
+import numpy as np
+
+class IndexedField(object):
+    """ Mesh attribute stored on its native domain.
+
+    values holds one entry for the whole mesh (uniform), one per vertex, one
+    per face or one per face corner.  faces, the (num_faces, vertex_per_face)
+    index array of the mesh, is kept along so that the field can be expanded
+    to a corner field by to_corners() when a renderer needs that layout.
+    """
+    UNIFORM = "uniform";
+    VERTEX = "vertex";
+    FACE = "face";
+    CORNER = "corner";
+
+    @classmethod
+    def uniform(cls, value, faces):
+        return cls(cls.UNIFORM, value, faces);
+
+    @classmethod
+    def per_vertex(cls, values, faces):
+        return cls(cls.VERTEX, values, faces);
+
+    @classmethod
+    def per_face(cls, values, faces):
+        return cls(cls.FACE, values, faces);
+
+    @classmethod
+    def per_corner(cls, values, faces):
+        return cls(cls.CORNER, values, faces);
+
+    def __init__(self, domain, values, faces):
+        if domain not in (self.UNIFORM, self.VERTEX, self.FACE, self.CORNER):
+            raise ValueError("Unknown attribute domain: {}".format(domain));
+        self.domain = domain;
+        self.values = np.asarray(values);
+        self.faces = np.asarray(faces);
+        if domain == self.CORNER and \
+                self.values.shape[:2] != self.faces.shape:
+            # One row per corner.
+            self.values = self.values.reshape(
+                    self.faces.shape + self.values.shape[1:]);
+
+    def to_corners(self):
+        """ Return the field with one entry per face corner, i.e. of shape
+        (num_faces, vertex_per_face) + item shape.
+        """
+        num_faces, vertex_per_face = self.faces.shape;
+        if self.domain == self.UNIFORM:
+            corners = np.empty((num_faces, vertex_per_face) +
+                    self.values.shape, dtype=self.values.dtype);
+            corners[:] = self.values;
+        elif self.domain == self.VERTEX:
+            corners = self.values[self.faces];
+        elif self.domain == self.FACE:
+            corners = np.repeat(self.values[:, np.newaxis], vertex_per_face,
+                    axis=1);
+        else:
+            corners = self.values;
+        return corners;
+
+    def to_vertices(self, num_vertices):
+        """ Return one entry per vertex for uniform and vertex fields, None
+        if the field cannot be stored per vertex without welding.
+        """
+        if self.domain == self.VERTEX:
+            return self.values;
+        elif self.domain == self.UNIFORM:
+            values = np.empty((num_vertices,) + self.values.shape,
+                    dtype=self.values.dtype);
+            values[:] = self.values;
+            return values;
+        else:
+            return None;
+
+    def map(self, func):
+        """ Return a field on the same domain with values func(values).
+        """
+        return self.__class__(self.domain, func(self.values), self.faces);
+
+    @property
+    def is_uniform(self):
+        return self.domain == self.UNIFORM;
@@ -0,0 +1,13 @@
+from .mesh_cache import get_mesh_cache
+
+def get_derived_attribute(mesh, name):
+    """ Return the values of attribute name of mesh, asking pymesh to compute
+    it on first use.  pymesh keeps added attributes on the mesh, so later
+    calls do not recompute it.  Derived attributes only depend on the
+    geometry, they are shared by every view of a cached mesh and charged to
+    the mesh cache.
+    """
+    if not mesh.has_attribute(name):
+        mesh.add_attribute(name);
+        get_mesh_cache().charge(mesh);
+    return mesh.get_attribute(name);
@@ -0,0 +1,127 @@
+from collections import OrderedDict
+import logging
+import os
+import os.path
+
+import pymesh
+
+DEFAULT_MESH_CACHE_BUDGET = 1024**3; # bytes
+
+class MeshCache(object):
+    """ Process-wide cache of loaded meshes.
+
+    Entries are keyed by absolute path, file size and modification time, so
+    an edited file is loaded again.  The same pymesh.Mesh is handed to every
+    view loading that file.  MeshView only exposes read-only arrays of a
+    shared mesh and MeshView.writable_mesh() copies it before modification,
+    but arrays obtained from the pymesh object directly are read-only by
+    convention only.  Derived attributes added by one view are shared with
+    the others and charged to the mesh by get_derived_attribute().  When the
+    cached meshes exceed budget bytes, the least recently used ones are
+    dropped.
+    """
+    def __init__(self, budget=None):
+        if budget is None:
+            budget = int(os.environ.get("PYRENDER_MESH_CACHE_BUDGET",
+                DEFAULT_MESH_CACHE_BUDGET));
+        self.budget = budget;
+        self.size = 0;
+        self.hits = 0;
+        self.misses = 0;
+        self.evictions = 0;
+        self.__entries = OrderedDict();
+
+    def get_key(self, mesh_file):
+        mesh_file = os.path.abspath(mesh_file);
+        stat = os.stat(mesh_file);
+        return (mesh_file, stat.st_size, stat.st_mtime);
+
+    def load(self, mesh_file):
+        """ Return the mesh stored in mesh_file, loading it on a miss.
+        """
+        key = self.get_key(mesh_file);
+        entry = self.__entries.pop(key, None);
+        if entry is not None:
+            self.hits += 1;
+            self.__entries[key] = entry;
+            return entry[0];
+
+        self.misses += 1;
+        mesh = pymesh.load_mesh(key[0]);
+        self.__entries[key] = (mesh, 0);
+        self.evict(keep=key);
+        return mesh;
+
+    def is_shared(self, mesh):
+        """ Whether mesh is handed out by this cache.
+        """
+        return any(entry[0] is mesh for entry in self.__entries.values());
+
+    def charge(self, mesh):
+        """ Count attributes added to a cached mesh towards the budget.
+        Other meshes are evicted if the cache no longer fits.
+        """
+        for key, (entry_mesh, size) in self.__entries.items():
+            if entry_mesh is mesh:
+                self.evict(keep=key);
+                return;
+
+    def evict(self, keep=None):
+        """ Drop least recently used meshes until the cache fits in budget.
+        Sizes are updated first, since views add attributes to cached meshes.
+        """
+        self.__update_sizes();
+        for key in list(self.__entries.keys()):
+            if self.size <= self.budget: break;
+            if key == keep: continue;
+            mesh, size = self.__entries.pop(key);
+            self.size -= size;
+            self.evictions += 1;
+
+    def clear(self):
+        self.__entries.clear();
+        self.size = 0;
+
+    def __update_sizes(self):
+        self.size = 0;
+        for key, (mesh, size) in list(self.__entries.items()):
+            size = self.__get_mesh_size(mesh);
+            self.__entries[key] = (mesh, size);
+            self.size += size;
+
+    def __get_mesh_size(self, mesh):
+        size = mesh.vertices.nbytes + mesh.faces.nbytes + mesh.voxels.nbytes;
+        for name in mesh.attribute_names:
+            size += mesh.get_attribute(name).nbytes;
+        return size;
+
+    @property
+    def stats(self):
+        return {
+                "hits": self.hits,
+                "misses": self.misses,
+                "evictions": self.evictions,
+                "size": self.size
+                };
+
+    def log_stats(self):
+        logger = logging.getLogger(__name__);
+        logger.info("Mesh cache: {} meshes, {} bytes, {} hits, {} misses, "
+                "{} evictions".format(len(self.__entries), self.size,
+                    self.hits, self.misses, self.evictions));
+
+_mesh_cache = None;
+
+def get_mesh_cache():
+    """ Return the process-wide mesh cache.
+    """
+    global _mesh_cache;
+    if _mesh_cache is None:
+        _mesh_cache = MeshCache();
+    return _mesh_cache;
+
+def load_mesh(mesh_file):
+    """ Same as pymesh.load_mesh() but goes through the process-wide cache.
+    The returned mesh is shared, do not modify it.
+    """
+    return get_mesh_cache().load(mesh_file);
@@ -0,0 +1,179 @@
+from contextlib import contextmanager
+import logging
+import os
+import os.path
+import tempfile
+import time
+
+DEFAULT_SCRATCH_DIR = os.path.join(tempfile.gettempdir(), "pyrender_scratch");
+DEFAULT_SCRATCH_BUDGET = 4 * 1024**3; # bytes
+
+class ScratchStore(object):
+    """ Content-addressed store for temporary files such as meshes and wires.
+
+    Files are named by a content key, so identical data is written only once
+    and reused across runs.  When the total size exceeds budget bytes, the
+    least recently used files are evicted.
+
+    Sizes and access times are tracked in memory.  The directory is only
+    scanned when the store is created and when the tracked total crosses the
+    budget, which also picks up entries written by other processes.
+    """
+    def __init__(self, root=None, budget=None):
+        if root is None:
+            root = os.environ.get("PYRENDER_SCRATCH_DIR", DEFAULT_SCRATCH_DIR);
+        if budget is None:
+            budget = int(os.environ.get("PYRENDER_SCRATCH_BUDGET",
+                DEFAULT_SCRATCH_BUDGET));
+        self.root = root;
+        self.budget = budget;
+        self.hits = 0;
+        self.misses = 0;
+        self.evictions = 0;
+        self.__pin_depth = 0;
+        self.__pinned = set();
+        if not os.path.isdir(self.root):
+            os.makedirs(self.root);
+        self.__scan();
+
+    def __scan(self):
+        """ Rebuild the index of entries, path -> [atime, size].
+        """
+        self.__entries = {};
+        self.size = 0;
+        for name in os.listdir(self.root):
+            if name.startswith("tmp_"): continue;
+            path = os.path.join(self.root, name);
+            try:
+                stat = os.stat(path);
+            except OSError:
+                continue;
+            self.__entries[path] = [stat.st_mtime, stat.st_size];
+            self.size += stat.st_size;
+
+    def get_path(self, key, ext):
+        return os.path.join(self.root, "{}{}".format(key, ext));
+
+    def lookup(self, key, ext):
+        """ Return the path of the entry for key, or None if there is none.
+        """
+        path = self.get_path(key, ext);
+        if not os.path.exists(path):
+            return None;
+        self.hits += 1;
+        self.__pin(path);
+        # Refresh the modification time used for LRU eviction.
+        os.utime(path, None);
+        entry = self.__entries.get(path);
+        if entry is None:
+            # Written by another process.
+            self.__add_entry(path);
+        else:
+            entry[0] = time.time();
+        return path;
+
+    def __add_entry(self, path):
+        try:
+            size = os.path.getsize(path);
+        except OSError:
+            return;
+        self.__entries[path] = [time.time(), size];
+        self.size += size;
+
+    def store(self, key, ext, writer):
+        """ Return the path of the entry for key.  If it does not exist yet,
+        writer(filename) is called to create it.
+        """
+        path = self.lookup(key, ext);
+        if path is not None:
+            return path;
+
+        path = self.get_path(key, ext);
+        self.misses += 1;
+        # Write to a temporary name first so that concurrent jobs never see a
+        # partially written entry.  The extension is kept since some writers
+        # use it to pick the file format.
+        tmp_path = os.path.join(self.root, "tmp_{}_{}{}".format(
+            os.getpid(), key, ext));
+        writer(tmp_path);
+        os.rename(tmp_path, path);
+        self.__pin(path);
+        self.__add_entry(path);
+        if self.size > self.budget:
+            self.evict(keep=path);
+        return path;
+
+    @contextmanager
+    def pinned(self):
+        """ Entries returned by lookup() or store() inside the with block are
+        not evicted before the block ends.  Renderers that store several
+        files before reading them use this.
+        """
+        self.__pin_depth += 1;
+        try:
+            yield self;
+        finally:
+            self.__pin_depth -= 1;
+            if self.__pin_depth == 0:
+                self.__pinned.clear();
+                if self.size > self.budget:
+                    self.evict();
+
+    def __pin(self, path):
+        if self.__pin_depth > 0:
+            self.__pinned.add(path);
+
+    def evict(self, keep=None):
+        """ Remove least recently used entries until the store fits in budget.
+        keep and pinned entries are never removed.
+        """
+        # Resync with the directory, other processes share it.
+        self.__scan();
+        entries = sorted((atime, size, path) for path, (atime, size)
+                in self.__entries.items());
+        for atime, size, path in entries:
+            if self.size <= self.budget: break;
+            if path == keep or path in self.__pinned: continue;
+            try:
+                os.remove(path);
+            except OSError:
+                continue;
+            del self.__entries[path];
+            self.size -= size;
+            self.evictions += 1;
+
+    def clear(self):
+        """ Remove the entries known to this store.  Temporary files of
+        writers in progress are left alone.
+        """
+        for path in list(self.__entries.keys()):
+            try:
+                os.remove(path);
+            except OSError:
+                pass;
+        self.__entries = {};
+        self.__pinned.clear();
+        self.size = 0;
+
+    @property
+    def stats(self):
+        return {
+                "hits": self.hits,
+                "misses": self.misses,
+                "evictions": self.evictions
+                };
+
+    def log_stats(self):
+        logger = logging.getLogger(__name__);
+        logger.info("Scratch store {}: {} hits, {} misses, {} evictions"\
+                .format(self.root, self.hits, self.misses, self.evictions));
+
+_scratch_store = None;
+
+def get_scratch_store():
+    """ Return the process-wide scratch store.
+    """
+    global _scratch_store;
+    if _scratch_store is None:
+        _scratch_store = ScratchStore();
+    return _scratch_store;
@@ -0,0 +1,196 @@
+import numpy as np
+from numpy.linalg import norm
+
+from pyrender.color.Color import Color, color_table
+from .Primitive import Cylinder, Cone, Sphere
+
+class PrimitiveBatch(object):
+    """ Struct-of-arrays storage for sphere, cylinder and cone primitives.
+
+    Primitive i is described by types[i], end points p0[i] and p1[i], radii[i]
+    and RGBA colors[i].  Spheres store their center in both p0 and p1.
+    Primitives are added in bulk with add_spheres(), add_cylinders() and
+    add_cones().  append() still accepts Sphere, Cylinder and Cone objects,
+    and iterating over a batch yields such objects for older code.
+    """
+    SPHERE = 0;
+    CYLINDER = 1;
+    CONE = 2;
+
+    def __init__(self):
+        self.__chunks = [];
+        self.__pending = [];
+        self.__arrays = None;
+
+    def add_spheres(self, centers, radii, colors=None):
+        centers = np.asarray(centers, dtype=float).reshape((-1, 3));
+        self.__add_chunk(self.SPHERE, centers, centers, radii, colors);
+
+    def add_cylinders(self, p0, p1, radii, colors=None):
+        self.__add_chunk(self.CYLINDER, p0, p1, radii, colors);
+
+    def add_cones(self, p0, p1, radii, colors=None):
+        """ Cones have their base at p0 and their apex at p1.
+        """
+        self.__add_chunk(self.CONE, p0, p1, radii, colors);
+
+    def add_wires(self, vertices, edges, radius, colors=None,
+            min_length=0.0):
+        """ Add a sphere at every vertex and a cylinder along every edge
+        longer than min_length.  Shorter edges are covered by the spheres at
+        their end points.  radius and colors are shared by all wires.
+        """
+        vertices = np.asarray(vertices, dtype=float).reshape((-1, 3));
+        edges = np.asarray(edges, dtype=int).reshape((-1, 2));
+        p0 = vertices[edges[:, 0]];
+        p1 = vertices[edges[:, 1]];
+        long_edges = norm(p1 - p0, axis=1) > min_length;
+        self.add_spheres(vertices, radius, colors);
+        self.add_cylinders(p0[long_edges], p1[long_edges], radius, colors);
+
+    def append(self, shape):
+        self.__pending.append(shape);
+        self.__arrays = None;
+
+    def extend(self, shapes):
+        if isinstance(shapes, PrimitiveBatch):
+            self.__add_arrays(shapes.types, shapes.p0, shapes.p1,
+                    shapes.radii, shapes.colors);
+        else:
+            for shape in shapes:
+                self.append(shape);
+
+    def select(self, primitive_type):
+        """ Return (p0, p1, radii, colors) of all primitives of the given type.
+        """
+        types, p0, p1, radii, colors = self.__get_arrays();
+        mask = types == primitive_type;
+        return p0[mask], p1[mask], radii[mask], colors[mask];
+
+    def subset(self, selection):
+        """ Return a new batch with the primitives picked by selection, a
+        boolean mask or an index array.
+        """
+        batch = PrimitiveBatch();
+        batch.__add_arrays(*[field[selection] for field in
+            self.__get_arrays()]);
+        return batch;
+
+    @property
+    def types(self):
+        return self.__get_arrays()[0];
+
+    @property
+    def p0(self):
+        return self.__get_arrays()[1];
+
+    @property
+    def p1(self):
+        return self.__get_arrays()[2];
+
+    @property
+    def radii(self):
+        return self.__get_arrays()[3];
+
+    @property
+    def colors(self):
+        return self.__get_arrays()[4];
+
+    def __len__(self):
+        return len(self.types);
+
+    def __iter__(self):
+        types, p0, p1, radii, colors = self.__get_arrays();
+        for i in range(len(types)):
+            if types[i] == self.SPHERE:
+                shape = Sphere(p0[i], radii[i]);
+            elif types[i] == self.CYLINDER:
+                shape = Cylinder(p0[i], p1[i], radii[i]);
+            else:
+                shape = Cone(p0[i], p1[i], radii[i]);
+            shape.color = Color(*colors[i]);
+            yield shape;
+
+    def __add_chunk(self, primitive_type, p0, p1, radii, colors):
+        p0 = np.asarray(p0, dtype=float).reshape((-1, 3));
+        p1 = np.asarray(p1, dtype=float).reshape((-1, 3));
+        assert(p0.shape == p1.shape);
+        num_primitives = len(p0);
+        types = np.full(num_primitives, primitive_type, dtype=np.int8);
+        radii = np.array(np.broadcast_to(np.asarray(radii, dtype=float),
+                (num_primitives,)));
+        colors = self.__to_rgba(colors, num_primitives);
+        self.__add_arrays(types, p0, p1, radii, colors);
+
+    def __add_arrays(self, types, p0, p1, radii, colors):
+        self.__flush_pending();
+        if len(types) == 0: return;
+        self.__chunks.append((types, p0, p1, radii, colors));
+        self.__arrays = None;
+
+    def __flush_pending(self):
+        """ Convert primitives added with append() into a chunk.
+        """
+        if len(self.__pending) == 0: return;
+        shapes = self.__pending;
+        self.__pending = [];
+        types = np.empty(len(shapes), dtype=np.int8);
+        p0 = np.empty((len(shapes), 3));
+        p1 = np.empty((len(shapes), 3));
+        radii = np.empty(len(shapes));
+        colors = np.empty((len(shapes), 4));
+        for i, shape in enumerate(shapes):
+            if isinstance(shape, Sphere):
+                types[i] = self.SPHERE;
+                p0[i] = p1[i] = shape.center;
+            elif isinstance(shape, Cylinder):
+                types[i] = self.CYLINDER;
+                p0[i], p1[i] = shape.end_points;
+            elif isinstance(shape, Cone):
+                types[i] = self.CONE;
+                p0[i], p1[i] = shape.end_points;
+            else:
+                raise NotImplementedError(
+                        "Unknown primitive: {}".format(shape));
+            radii[i] = shape.radius;
+            colors[i] = self.__to_rgba(shape.color, 1)[0];
+        self.__chunks.append((types, p0, p1, radii, colors));
+
+    def __get_arrays(self):
+        if self.__arrays is None:
+            self.__flush_pending();
+            if len(self.__chunks) == 0:
+                self.__arrays = (np.zeros(0, dtype=np.int8),
+                        np.zeros((0, 3)), np.zeros((0, 3)),
+                        np.zeros(0), np.zeros((0, 4)));
+            elif len(self.__chunks) == 1:
+                self.__arrays = self.__chunks[0];
+            else:
+                self.__arrays = tuple(np.concatenate(field) for field in
+                        zip(*self.__chunks));
+                self.__chunks = [self.__arrays];
+        return self.__arrays;
+
+    def __to_rgba(self, colors, num_primitives):
+        """ Broadcast a Color, a single RGB(A) value or an (N, 3) or (N, 4)
+        array to an (N, 4) RGBA array.
+        """
+        if colors is None:
+            colors = color_table["nylon_white"];
+        if isinstance(colors, Color):
+            colors = colors.color;
+        colors = np.asarray(colors, dtype=float);
+        if colors.shape[-1] == 3:
+            alpha = np.ones(colors.shape[:-1] + (1,));
+            colors = np.concatenate([colors, alpha], axis=-1);
+        return np.array(np.broadcast_to(colors, (num_primitives, 4)));
+
+def as_primitive_batch(primitives):
+    """ Return primitives as a PrimitiveBatch, converting lists of Sphere,
+    Cylinder and Cone objects if needed.
+    """
+    if isinstance(primitives, PrimitiveBatch):
+        return primitives;
+    batch = PrimitiveBatch();
+    batch.extend(primitives);
+    return batch;
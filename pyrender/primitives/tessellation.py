@@ -0,0 +1,134 @@
+from math import sqrt
+import numpy as np
+from numpy.linalg import norm
+
+_icospheres = {};
+
+def get_icosphere(level):
+    """ Return (vertices, faces) of a unit icosphere obtained by subdividing
+    an icosahedron level times.  Results are cached.
+    """
+    if level in _icospheres:
+        return _icospheres[level];
+
+    t = (1.0 + sqrt(5.0)) * 0.5;
+    vertices = np.array([
+        [-1,  t,  0], [ 1,  t,  0], [-1, -t,  0], [ 1, -t,  0],
+        [ 0, -1,  t], [ 0,  1,  t], [ 0, -1, -t], [ 0,  1, -t],
+        [ t,  0, -1], [ t,  0,  1], [-t,  0, -1], [-t,  0,  1] ],
+        dtype=float);
+    vertices /= norm(vertices, axis=1)[:, np.newaxis];
+    faces = np.array([
+        [0, 11,  5], [0,  5,  1], [0,  1,  7], [0,  7, 10], [0, 10, 11],
+        [1,  5,  9], [5, 11,  4], [11, 10, 2], [10, 7,  6], [7,  1,  8],
+        [3,  9,  4], [3,  4,  2], [3,  2,  6], [3,  6,  8], [3,  8,  9],
+        [4,  9,  5], [2,  4, 11], [6,  2, 10], [8,  6,  7], [9,  8,  1] ],
+        dtype=int);
+
+    for i in range(level):
+        edges = np.sort(faces[:, [[0,1], [1,2], [2,0]]].reshape((-1, 2)),
+                axis=1);
+        edges, edge_index = np.unique(edges, axis=0, return_inverse=True);
+        mid_points = vertices[edges[:,0]] + vertices[edges[:,1]];
+        mid_points /= norm(mid_points, axis=1)[:, np.newaxis];
+        mid_index = edge_index.reshape((-1, 3)) + len(vertices);
+
+        a, b, c = faces.T;
+        m01, m12, m20 = mid_index.T;
+        faces = np.vstack([
+            np.array([a, m01, m20]).T,
+            np.array([b, m12, m01]).T,
+            np.array([c, m20, m12]).T,
+            np.array([m01, m12, m20]).T ]);
+        vertices = np.vstack([vertices, mid_points]);
+
+    _icospheres[level] = (vertices, faces);
+    return vertices, faces;
+
+def tessellate_spheres(centers, radii, level=1):
+    """ Tessellate spheres into a single triangle mesh.
+
+    Returns (vertices, faces, normals).
+    """
+    unit_vertices, unit_faces = get_icosphere(level);
+    num_spheres = len(centers);
+    radii = np.broadcast_to(radii, (num_spheres,));
+
+    vertices = centers[:, np.newaxis, :] +\
+            radii[:, np.newaxis, np.newaxis] * unit_vertices[np.newaxis, :, :];
+    normals = np.broadcast_to(unit_vertices, vertices.shape);
+    offsets = np.arange(num_spheres, dtype=int) * len(unit_vertices);
+    faces = unit_faces[np.newaxis, :, :] + offsets[:, np.newaxis, np.newaxis];
+    return vertices.reshape((-1, 3)), faces.reshape((-1, 3)),\
+            normals.reshape((-1, 3));
+
+def tessellate_tubes(p0, p1, r0, r1, num_segments=12, with_base=False):
+    """ Tessellate truncated cones from p0 (radius r0) to p1 (radius r1)
+    into a single triangle mesh.  Cylinders use r0 == r1 and cones use
+    r1 == 0.  If with_base is set, the p0 end is closed with a disk.
+
+    Returns (vertices, faces, normals).
+    """
+    num_tubes = len(p0);
+    r0 = np.broadcast_to(r0, (num_tubes,));
+    r1 = np.broadcast_to(r1, (num_tubes,));
+    axis = p1 - p0;
+    lengths = norm(axis, axis=1);
+    axis = axis / np.maximum(lengths, 1e-12)[:, np.newaxis];
+
+    # Orthonormal frame (u, w) perpendicular to each axis.
+    helper = np.zeros_like(axis);
+    helper[np.arange(num_tubes), np.argmin(np.fabs(axis), axis=1)] = 1.0;
+    u = np.cross(axis, helper);
+    u /= norm(u, axis=1)[:, np.newaxis];
+    w = np.cross(axis, u);
+
+    angles = np.linspace(0.0, 2.0 * np.pi, num_segments, endpoint=False);
+    radial = np.cos(angles)[np.newaxis, :, np.newaxis] * u[:, np.newaxis, :] +\
+            np.sin(angles)[np.newaxis, :, np.newaxis] * w[:, np.newaxis, :];
+    ring0 = p0[:, np.newaxis, :] + r0[:, np.newaxis, np.newaxis] * radial;
+    ring1 = p1[:, np.newaxis, :] + r1[:, np.newaxis, np.newaxis] * radial;
+
+    slope = (r0 - r1)[:, np.newaxis, np.newaxis] * axis[:, np.newaxis, :];
+    side_normals = radial * lengths[:, np.newaxis, np.newaxis] + slope;
+    side_normals /= np.maximum(norm(side_normals, axis=2), 1e-12)[:, :, np.newaxis];
+
+    i = np.arange(num_segments, dtype=int);
+    j = (i + 1) % num_segments;
+    n = num_segments;
+    side_faces = np.vstack([
+        np.array([i, j, j + n]).T,
+        np.array([i, j + n, i + n]).T ]);
+    vertices = [ring0, ring1];
+    normals = [side_normals, side_normals];
+    faces = [side_faces];
+    if with_base:
+        base_faces = np.array([np.full(n, 3 * n), j + 2 * n, i + 2 * n]).T;
+        vertices += [ring0, p0[:, np.newaxis, :]];
+        base_normals = np.broadcast_to(-axis[:, np.newaxis, :],
+                (num_tubes, n+1, 3));
+        normals.append(base_normals);
+        faces.append(base_faces);
+
+    vertices = np.concatenate(vertices, axis=1);
+    normals = np.concatenate(normals, axis=1);
+    faces = np.vstack(faces);
+
+    num_vertices_per_tube = vertices.shape[1];
+    offsets = np.arange(num_tubes, dtype=int) * num_vertices_per_tube;
+    faces = faces[np.newaxis, :, :] + offsets[:, np.newaxis, np.newaxis];
+    return vertices.reshape((-1, 3)), faces.reshape((-1, 3)),\
+            normals.reshape((-1, 3));
+
+def merge_meshes(meshes):
+    """ Merge a list of (vertices, faces, normals) into a single mesh.
+    """
+    meshes = [mesh for mesh in meshes if len(mesh[1]) > 0];
+    if len(meshes) == 0:
+        return np.zeros((0, 3)), np.zeros((0, 3), dtype=int), np.zeros((0, 3));
+    offsets = np.cumsum([0] + [len(mesh[0]) for mesh in meshes[:-1]]);
+    vertices = np.vstack([mesh[0] for mesh in meshes]);
+    faces = np.vstack([mesh[1] + offset
+        for mesh, offset in zip(meshes, offsets)]);
+    normals = np.vstack([mesh[2] for mesh in meshes]);
+    return vertices, faces, normals;
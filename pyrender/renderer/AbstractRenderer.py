@@ -1,11 +1,45 @@
+import logging
+
+from pyrender.primitives.PrimitiveBatch import as_primitive_batch
+from . import culling
+
 class AbstractRenderer(object):
     def __init__(self, scene):
         self.__scene = scene;
+        # Drop primitives outside of the image (if frustum_culling is set)
+        # and merge primitives smaller than min_primitive_pixels before
+        # handing them to the backend.  Renderers where primitives outside of
+        # the image still show up through shadows or reflections disable
+        # frustum_culling.
+        self.primitive_culling = True;
+        self.frustum_culling = True;
+        self.min_primitive_pixels = 1.0;
+        self.__culling_report = None;
 
     def render(self):
         raise NotImplementedError(
                 "This method needs to be implemented by subclass.");
 
+    def cull_primitives(self, primitives, model_matrix, width, height,
+            crop_bbox=None):
+        """ Cull primitives against the active camera.  model_matrix maps
+        primitive coordinates to world coordinates.
+        """
+        if not self.primitive_culling:
+            return as_primitive_batch(primitives);
+        culled, num_outside, num_merged = culling.cull_primitives(primitives,
+                self.scene.active_camera, model_matrix, width, height,
+                crop_bbox, self.min_primitive_pixels, self.frustum_culling);
+        report = (len(culled), num_outside, num_merged);
+        if num_outside + num_merged > 0 and report != self.__culling_report:
+            logger = logging.getLogger(__name__);
+            logger.info("Culled {} primitives: {} outside of view, {} below "
+                    "{} pixels, {} left".format(num_outside + num_merged,
+                        num_outside, num_merged, self.min_primitive_pixels,
+                        len(culled)));
+        self.__culling_report = report;
+        return culled;
+
     @property
     def scene(self):
         return self.__scene;
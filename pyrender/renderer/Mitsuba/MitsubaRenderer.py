@@ -1,35 +1,67 @@
-import inspect
 import multiprocessing
 import numpy as np
 from numpy.linalg import norm
 from math import atan2, degrees
 import os.path
 from collections import OrderedDict
-import datetime
-import tempfile
 
-from mitsuba.core import PluginManager, Scheduler, Statistics, LocalWorker, Thread
+from mitsuba.core import Statistics
 from mitsuba.core import Transform, Point, Vector, Matrix4x4, Spectrum, Color3
 from mitsuba.render import Scene, RenderQueue, RenderJob, SceneHandler
 
-from pyrender.primitives.Primitive import Cylinder, Cone, Sphere
+from pyrender.primitives.PrimitiveBatch import PrimitiveBatch
+from pyrender.primitives.tessellation import tessellate_spheres,\
+        tessellate_tubes, merge_meshes
 from pyrender.renderer.AbstractRenderer import AbstractRenderer
-import pymesh
-from .serialization import serialize_mesh
+from pyrender.misc.hashing import hash_content
+from pyrender.misc.scratch import get_scratch_store
+from .geometry import weld_corners
+from .MitsubaSession import MitsubaSession
+from .serialization import save_mesh, count_shapes, DEFAULT_COMPRESSION_LEVEL
 
 class MitsubaRenderer(AbstractRenderer):
-    def __init__(self, scene):
+    def __init__(self, scene, session=None):
         super(MitsubaRenderer, self).__init__(scene);
+        self.session = session;
+        self.single_precision = False;
+        self.compression_level = DEFAULT_COMPRESSION_LEVEL;
+        self.max_faces_per_shape = 1<<20;
+        self.num_threads = multiprocessing.cpu_count();
+        # Glyphs outside of the image still cast shadows and show up in
+        # reflections, so only sub-pixel primitives are merged.
+        self.frustum_culling = False;
+        # "merged" tessellates primitives into one mesh per color,
+        # "instanced" adds one instance of a shared unit shape per primitive
+        # and "native" creates one Mitsuba shape per primitive.
+        self.primitive_mode = "merged";
+        self.tessellation_quality = 1;
+        # Views with identical geometry and material share one shapegroup.
+        self.instance_duplicate_views = True;
 
     def render(self):
-        self.__initialize();
-        self.__add_integrator();
-        self.__add_lights();
-        self.__add_active_camera();
-        self.__add_active_view();
-        self.__add_active_primitives();
-        self.__add_others();
-        self.__run_mitsuba();
+        if self.session is None:
+            # Standalone render, use a session just for this image.
+            with MitsubaSession(self.scene) as session:
+                self.session = session;
+                try:
+                    self.__render();
+                finally:
+                    self.session = None;
+        else:
+            self.__render();
+
+    def __render(self):
+        # Mesh files are stored before Mitsuba loads them, keep all of them
+        # until the image is done.
+        with get_scratch_store().pinned():
+            self.__initialize();
+            self.__add_integrator();
+            self.__add_lights();
+            self.__add_active_camera();
+            self.__add_active_view();
+            self.__add_active_primitives();
+            self.__add_others();
+            self.__run_mitsuba();
 
     def __initialize(self):
         self.__initialize_mitsuba_setting();
@@ -37,20 +69,13 @@ class MitsubaRenderer(AbstractRenderer):
         self.__initialize_geometry_setting();
 
     def __initialize_mitsuba_setting(self):
-        self.plgr = PluginManager.getInstance();
+        self.plgr = self.session.plgr;
+        self.file_resolver = self.session.file_resolver;
         self.output_dir = self.scene.output_dir;
 
-        mitsuba_module_path = os.path.dirname(
-                inspect.getfile(MitsubaRenderer));
-        self.file_resolver = Thread.getThread().getFileResolver();
-        self.file_resolver.appendPath(os.path.join(
-            mitsuba_module_path, "xml_files/"));
-        self.file_resolver.appendPath(os.path.join(
-            mitsuba_module_path, "textures/"));
-        self.file_resolver.appendPath(os.path.join(
-            mitsuba_module_path, "shapes/"));
-
         self.mitsuba_scene = Scene();
+        self.view_shapes = OrderedDict();
+        self.shape_groups = {};
 
     def __initialize_image_setting(self):
         active_view = self.scene.active_view;
@@ -164,6 +189,7 @@ class MitsubaRenderer(AbstractRenderer):
 
     def __add_active_view(self):
         self.__add_view(self.scene.active_view);
+        self.__add_view_shapes();
 
     def __add_view(self, active_view, parent_transform=None):
         if len(active_view.subviews) > 0:
@@ -179,7 +205,6 @@ class MitsubaRenderer(AbstractRenderer):
 
         old_active_view = self.scene.active_view;
         self.scene.active_view = active_view;
-        mesh_file, ext = self.__save_temp_mesh(active_view);
         normalize_transform = self.__get_normalize_transform(active_view);
         view_transform = self.__get_view_transform(active_view);
         if parent_transform is not None:
@@ -187,16 +212,26 @@ class MitsubaRenderer(AbstractRenderer):
         glob_transform = self.__get_glob_transform();
 
         total_transform = glob_transform * normalize_transform * view_transform;
-        material_setting = self.__get_material_setting(active_view);
-        setting = {
-                "type": ext[1:],
-                "filename": mesh_file,
-                "faceNormals": False,
-                "toWorld": total_transform
-                }
-        setting.update(material_setting);
-        target_shape = self.plgr.create(setting);
-        self.mitsuba_scene.addChild(target_shape);
+        mesh = self.__extract_mesh(active_view);
+        file_key = self.__get_mesh_key(*mesh);
+        mesh_key = hash_content(file_key, self.with_texture_coordinates,
+            self.with_colors, self.with_alpha, active_view.alpha,
+            active_view.use_smooth_normal,
+            self.__get_uniform_color(active_view));
+        if mesh_key not in self.view_shapes:
+            mesh_file, ext, num_shapes = self.__store_mesh(file_key, *mesh);
+            setting = {
+                    "faceNormals": not active_view.use_smooth_normal,
+                    };
+            setting.update(self.__get_material_setting(active_view));
+            self.view_shapes[mesh_key] = {
+                    "filename": mesh_file,
+                    "ext": ext,
+                    "num_shapes": num_shapes,
+                    "setting": setting,
+                    "transforms": []
+                    };
+        self.view_shapes[mesh_key]["transforms"].append(total_transform);
 
         M = (glob_transform * normalize_transform * view_transform).getMatrix();
         M = np.array([
@@ -231,6 +266,44 @@ class MitsubaRenderer(AbstractRenderer):
 
         self.scene.active_view = old_active_view;
 
+    def __add_view_shapes(self):
+        """ Add the meshes collected by __add_view.  Meshes used by several
+        views are stored once in a shapegroup and referenced by instances.
+        """
+        for entry in self.view_shapes.values():
+            setting = entry["setting"];
+            transforms = entry["transforms"];
+            # Subsurface scattering is not supported inside shapegroups.
+            if not self.instance_duplicate_views or len(transforms) == 1 or\
+                    "subsurface" in setting:
+                for transform in transforms:
+                    setting["toWorld"] = transform;
+                    self.__add_serialized_shapes(entry["filename"],
+                            entry["ext"], entry["num_shapes"], setting);
+                continue;
+
+            group_setting = { "type": "shapegroup" };
+            for i in range(entry["num_shapes"]):
+                shape_setting = {
+                        "type": entry["ext"][1:],
+                        "filename": entry["filename"],
+                        "shapeIndex": i
+                        };
+                shape_setting.update(setting);
+                group_setting["shape_{}".format(i)] = shape_setting;
+            shape_group = self.plgr.create(group_setting);
+            self.mitsuba_scene.addChild(shape_group);
+            for transform in transforms:
+                self.__add_instance(shape_group, transform);
+
+    def __add_instance(self, shape_group, transform):
+        instance = self.plgr.create({
+            "type": "instance",
+            "toWorld": transform,
+            "shapegroup": shape_group
+            });
+        self.mitsuba_scene.addChild(instance);
+
     def __add_active_primitives(self):
         self.__add_primitives(self.scene.active_view);
 
@@ -254,78 +327,189 @@ class MitsubaRenderer(AbstractRenderer):
         glob_transform = self.__get_glob_transform();
         total_transform = glob_transform * view_transform * normalize_transform;
 
-        primitives = self.scene.active_view.primitives;
-        for shape in primitives:
-            if shape.color[3] <= 0.0: continue;
-            color = {
-                    "type": "diffuse",
-                    "reflectance": Spectrum(shape.color[:3].tolist())
-                    };
-            if shape.color[3] < 1.0:
-                color = {
-                        "type": "mask",
-                        "opacity": Spectrum(active_view.alpha),
-                        "bsdf": color
-                        };
-            if isinstance(shape, Cylinder):
-                if shape.radius <= 0.0: continue;
-                setting = self.__add_cylinder(shape);
-                setting["bsdf"] = color;
+        primitives = self.cull_primitives(
+                self.scene.active_view.primitives,
+                self.__to_numpy_matrix(total_transform),
+                self.image_width, self.image_height,
+                self.scene.active_camera.crop_bbox);
+        if self.primitive_mode == "merged":
+            self.__add_merged_primitives(primitives, total_transform);
+        elif self.primitive_mode == "instanced":
+            self.__add_instanced_primitives(primitives, total_transform);
+        else:
+            self.__add_native_primitives(primitives, total_transform, scale);
+        self.scene.active_view = old_active_view;
+
+    def __get_visible_primitives(self, primitives):
+        """ Return (types, p0, p1, radii, colors) of the primitives with
+        positive radius and alpha.
+        """
+        visible = np.logical_and(primitives.radii > 0.0,
+                primitives.colors[:, 3] > 0.0);
+        return primitives.types[visible], primitives.p0[visible],\
+                primitives.p1[visible], primitives.radii[visible],\
+                primitives.colors[visible];
+
+    def __add_native_primitives(self, primitives, total_transform, scale):
+        """ Add one Mitsuba shape per primitive.
+        """
+        for shape_type, p0, p1, radius, color in zip(
+                *self.__get_visible_primitives(primitives)):
+            if shape_type == PrimitiveBatch.CYLINDER:
+                setting = self.__add_cylinder(p0, p1, radius);
                 setting["toWorld"] = total_transform
-            elif isinstance(shape, Cone):
-                if shape.radius <= 0.0: continue;
-                setting = self.__add_cone(shape);
-                setting["bsdf"] = color;
+            elif shape_type == PrimitiveBatch.CONE:
+                setting = self.__add_cone(p0, p1, radius);
                 setting["toWorld"] = total_transform * setting["toWorld"];
-            elif isinstance(shape, Sphere):
-                if shape.radius <= 0.0: continue;
+            else:
                 # Due to weird behavior in Mitsuba, all transformation is
                 # applied directly on radius and center variable.
-                setting = self.__add_sphere(shape);
+                setting = self.__add_sphere(p0, radius);
                 setting["radius"] *= scale;
                 setting["center"] = total_transform * setting["center"];
-                setting["bsdf"] = color;
-            else:
-                raise NotImplementedError("Unknown primitive: {}".format(shape));
+            setting["bsdf"] = self.__get_primitive_bsdf(color);
 
             mitsuba_primative = self.plgr.create(setting);
             self.mitsuba_scene.addChild(mitsuba_primative);
-        self.scene.active_view = old_active_view;
 
-    def __add_sphere(self, shape):
+    def __add_merged_primitives(self, primitives, total_transform):
+        """ Tessellate primitives and add one mesh per distinct color.
+        """
+        types, p0, p1, radii, colors = \
+                self.__get_visible_primitives(primitives);
+
+        groups = OrderedDict();
+        for shape_type in [PrimitiveBatch.SPHERE, PrimitiveBatch.CYLINDER,
+                PrimitiveBatch.CONE]:
+            selected = types == shape_type;
+            if not np.any(selected): continue;
+            unique_colors, color_index = np.unique(colors[selected], axis=0,
+                    return_inverse=True);
+            # Sort primitives by color so that each color is a contiguous
+            # slice.
+            order = np.argsort(color_index.ravel(), kind="stable");
+            counts = np.bincount(color_index.ravel(),
+                    minlength=len(unique_colors));
+            offsets = np.concatenate([[0], np.cumsum(counts)]);
+            selected_p0 = p0[selected][order];
+            selected_p1 = p1[selected][order];
+            selected_radii = radii[selected][order];
+            for i, color in enumerate(unique_colors):
+                begin, end = offsets[i], offsets[i+1];
+                groups.setdefault(tuple(color), []).append(
+                        self.__tessellate_primitives(shape_type,
+                            selected_p0[begin:end], selected_p1[begin:end],
+                            selected_radii[begin:end]));
+
+        for color, meshes in groups.items():
+            mesh = merge_meshes(meshes);
+            mesh_file, ext, num_shapes = self.__store_mesh(
+                    self.__get_mesh_key(*mesh), *mesh);
+            setting = {
+                    "faceNormals": False,
+                    "toWorld": total_transform,
+                    "bsdf": self.__get_primitive_bsdf(color)
+                    };
+            self.__add_serialized_shapes(mesh_file, ext, num_shapes, setting);
+
+    def __tessellate_primitives(self, shape_type, p0, p1, radii):
+        level = self.tessellation_quality;
+        num_segments = 6 * 2**level;
+        if shape_type == PrimitiveBatch.SPHERE:
+            return tessellate_spheres(p0, radii, level);
+        elif shape_type == PrimitiveBatch.CYLINDER:
+            return tessellate_tubes(p0, p1, radii, radii, num_segments);
+        else:
+            return tessellate_tubes(p0, p1, radii, 0.0, num_segments,
+                    with_base=True);
+
+    def __add_instanced_primitives(self, primitives, total_transform):
+        """ Add every primitive as an instance of a unit sphere, cylinder or
+        cone shapegroup.  One shapegroup is created per shape type and color.
+        """
+        for shape_type, p0, p1, radius, color in zip(
+                *self.__get_visible_primitives(primitives)):
+            if shape_type == PrimitiveBatch.SPHERE:
+                unit_shape = { "type": "sphere", "radius": 1.0 };
+                transform = Transform.translate(Vector(*p0)) *\
+                        Transform.scale(Vector(radius));
+            elif shape_type == PrimitiveBatch.CYLINDER:
+                unit_shape = {
+                        "type": "cylinder",
+                        "p0": Point(0.0, 0.0, 0.0),
+                        "p1": Point(0.0, 0.0, 1.0),
+                        "radius": 1.0
+                        };
+                v = p1 - p0;
+                transform = Transform.translate(Vector(*p0)) *\
+                        self.__get_alignment_transform([0.0, 0.0, 1.0], v) *\
+                        Transform.scale(Vector(radius, radius, norm(v)));
+            else:
+                unit_shape = {
+                        "type": "ply",
+                        "filename": self.file_resolver.resolve("cone.ply")
+                        };
+                transform = self.__add_cone(p0, p1, radius)["toWorld"];
+
+            color = tuple(float(c) for c in color);
+            group_key = (unit_shape["type"], color);
+            if group_key not in self.shape_groups:
+                unit_shape["bsdf"] = self.__get_primitive_bsdf(color);
+                shape_group = self.plgr.create({
+                    "type": "shapegroup",
+                    "shape": unit_shape
+                    });
+                self.mitsuba_scene.addChild(shape_group);
+                self.shape_groups[group_key] = shape_group;
+            self.__add_instance(self.shape_groups[group_key],
+                    total_transform * transform);
+
+    def __add_serialized_shapes(self, mesh_file, ext, num_shapes, setting):
+        for i in range(num_shapes):
+            shape_setting = {
+                    "type": ext[1:],
+                    "filename": mesh_file,
+                    "shapeIndex": i
+                    };
+            shape_setting.update(setting);
+            self.mitsuba_scene.addChild(self.plgr.create(shape_setting));
+
+    def __get_primitive_bsdf(self, color):
+        bsdf = {
+                "type": "diffuse",
+                "reflectance": Spectrum([float(c) for c in color[:3]])
+                };
+        if color[3] < 1.0:
+            bsdf = {
+                    "type": "mask",
+                    "opacity": Spectrum(self.scene.active_view.alpha),
+                    "bsdf": bsdf
+                    };
+        return bsdf;
+
+    def __add_sphere(self, center, radius):
         setting = {
                 "type": "sphere",
-                "radius": shape.radius,
-                "center": Point(*shape.center)
+                "radius": float(radius),
+                "center": Point(*center)
                 };
         return setting;
 
-    def __add_cylinder(self, shape):
+    def __add_cylinder(self, p0, p1, radius):
         setting = {
                 "type": "cylinder",
-                "p0": Point(*shape.end_points[0]),
-                "p1": Point(*shape.end_points[1]),
-                "radius": shape.radius
+                "p0": Point(*p0),
+                "p1": Point(*p1),
+                "radius": float(radius)
                 };
         return setting;
 
-    def __add_cone(self, shape):
-        y_dir = np.array([0.0, 1.0, 0.0]);
-        v = shape.end_points[1] - shape.end_points[0];
-        center = 0.5 * (shape.end_points[0] + shape.end_points[1]);
+    def __add_cone(self, p0, p1, radius):
+        v = p1 - p0;
+        center = 0.5 * (p0 + p1);
         height = norm(v);
-        scale = Transform.scale(
-                Vector(shape.radius, height, shape.radius));
-        axis = np.cross(y_dir, v);
-        axis_len = norm(axis);
-        angle = degrees(atan2(axis_len, np.dot(y_dir, v)));
-
-        if (axis_len > 1e-6):
-            axis /= axis_len;
-            rotate = Transform.rotate(Vector(*axis), angle);
-        else:
-            axis = np.array([1.0, 0.0, 0.0]);
-            rotate = Transform.rotate(Vector(*axis), angle);
+        scale = Transform.scale(Vector(radius, height, radius));
+        rotate = self.__get_alignment_transform([0.0, 1.0, 0.0], v);
         translate = Transform.translate(Vector(*center));
 
         cone_file = self.file_resolver.resolve("cone.ply");
@@ -337,6 +521,30 @@ class MitsubaRenderer(AbstractRenderer):
                 }
         return setting;
 
+    def __get_alignment_transform(self, from_dir, to_dir):
+        """ Rotation that maps from_dir to the direction of to_dir.
+        """
+        from_dir = np.array(from_dir, dtype=float);
+        axis = np.cross(from_dir, to_dir);
+        axis_len = norm(axis);
+        angle = degrees(atan2(axis_len, np.dot(from_dir, to_dir)));
+
+        if (axis_len > 1e-6):
+            axis /= axis_len;
+        else:
+            # Parallel or anti-parallel, any perpendicular axis works.
+            axis = np.roll(from_dir, 1);
+        return Transform.rotate(Vector(*axis), angle);
+
+    def __get_uniform_color(self, active_view):
+        """ RGBA color of active_view if it is uniform, None otherwise.
+        """
+        color_field = active_view.color_field;
+        if color_field.is_uniform:
+            return color_field.uniform_color;
+        else:
+            return None;
+
     def __get_material_setting(self, active_view):
         setting = {};
         if self.with_texture_coordinates:
@@ -347,7 +555,10 @@ class MitsubaRenderer(AbstractRenderer):
                     "flipTexCoords": False,
                     };
         else:
-            if self.with_colors:
+            uniform_color = self.__get_uniform_color(active_view);
+            if self.with_colors and uniform_color is not None:
+                diffuse_color = Spectrum(uniform_color[:3].tolist());
+            elif self.with_colors:
                 diffuse_color = { "type": "vertexcolors" }
             else:
                 diffuse_color = Spectrum(0.2);
@@ -501,11 +712,6 @@ class MitsubaRenderer(AbstractRenderer):
     def __run_mitsuba(self):
         self.mitsuba_scene.configure();
 
-        scheduler = Scheduler.getInstance();
-        for i in range(multiprocessing.cpu_count()):
-            scheduler.registerWorker(LocalWorker(i, "worker_{}".format(i)));
-        scheduler.start();
-
         queue = RenderQueue();
         self.mitsuba_scene.setDestinationFile(self.image_name);
 
@@ -517,58 +723,95 @@ class MitsubaRenderer(AbstractRenderer):
         queue.join();
 
         print(Statistics.getInstance().getStats());
-        scheduler.stop();
-
-    def __save_temp_mesh(self, active_view):
-        basename, ext = os.path.splitext(self.image_name);
-        path, name = os.path.split(basename);
-        now = datetime.datetime.now()
-        stamp = now.isoformat();
-        tmp_dir = tempfile.gettempdir();
-        ext = ".serialized";
-
-        tmp_mesh_name = os.path.join(tmp_dir, "{}_{}{}".format(
-            name, stamp, ext));
 
+    def __get_mesh_key(self, vertices, faces, normals=None, colors=None,
+            uvs=None):
+        return hash_content(vertices, faces, normals, colors, uvs,
+                self.single_precision, self.compression_level,
+                self.max_faces_per_shape);
+
+    def __store_mesh(self, mesh_key, vertices, faces, normals=None,
+            colors=None, uvs=None):
+        """ Save mesh into the scratch store unless an identical file is
+        already there.  Returns (mesh_file, ext, num_shapes).
+        """
+        ext = ".serialized";
+        num_shapes = [];
+        def write_mesh(mesh_file):
+            with open(mesh_file, 'wb') as fout:
+                num_shapes.append(save_mesh(fout,
+                    vertices, faces, normals, colors, uvs,
+                    single_precision = self.single_precision,
+                    compression_level = self.compression_level,
+                    max_faces_per_shape = self.max_faces_per_shape,
+                    num_threads = self.num_threads));
+        mesh_file = get_scratch_store().store(mesh_key, ext, write_mesh);
+        if len(num_shapes) == 0:
+            num_shapes.append(count_shapes(mesh_file));
+        return mesh_file, ext, num_shapes[0];
+
+    def __extract_mesh(self, active_view):
+        """ Return (vertices, faces, normals, colors, uvs) of the welded
+        triangle mesh of active_view.
+        """
         vertices = active_view.vertices;
         faces = active_view.faces;
         voxels = active_view.voxels;
-        colors = active_view.vertex_colors.reshape((-1, 4), order="C");
+        color_field = active_view.color_field;
+        if active_view.use_smooth_normal:
+            normal_field = active_view.vertex_normal_field;
+        else:
+            normal_field = None;
         if self.with_texture_coordinates:
             uvs = active_view.texture_coordinates;
         else:
             uvs = None;
 
-        dim = vertices.shape[1];
+        if uvs is None and self.__is_per_vertex(color_field) and \
+                self.__is_per_vertex(normal_field):
+            # Already indexed by vertex, no corner fields to weld.
+            num_vertices = len(vertices);
+            colors = None if color_field.is_uniform else \
+                    color_field.to_vertices(num_vertices);
+            normals = None if normal_field is None else \
+                    normal_field.to_vertices(num_vertices);
+            if faces.shape[1] == 4:
+                faces = np.vstack([faces[:,[0,1,2]], faces[:,[0,2,3]]]);
+            return vertices, faces, normals, colors, None;
+
+        if color_field.is_uniform:
+            # Uniform colors are set on the material instead.
+            colors = None;
+        else:
+            colors = color_field.to_corners().reshape((-1, 4), order="C");
+        if normal_field is not None:
+            normals = active_view.vertex_normals;
+        else:
+            normals = None;
+
         num_faces, vertex_per_face = faces.shape;
         if vertex_per_face == 4:
             faces = np.vstack([faces[:,[0,1,2]], faces[:,[0,2,3]]]);
-            vertex_per_face = 3;
-            num_faces *= 2;
-            colors = colors.reshape((-1, 4, 4), order="C");
-            colors = np.vstack([
-                colors[:,[0,1,2],:].reshape((-1, 4), order="C"),
-                colors[:,[0,2,3],:].reshape((-1, 4), order="C") ]);
+            if colors is not None:
+                colors = self.__split_quad_corner_field(colors);
             if uvs is not None:
-                uvs = uvs.reshape((-1, 4, 2), order="C");
-                uvs = np.vstack([
-                    uvs[:,[0,1,2],:].reshape((-1, 2), order="C"),
-                    uvs[:,[0,2,3],:].reshape((-1, 2), order="C") ]);
-        vertices = vertices[faces.ravel(order="C")];
-        assert(len(colors) == len(vertices));
-        faces = np.arange(len(vertices), dtype=int).reshape(
-                (num_faces, vertex_per_face), order="C");
+                uvs = self.__split_quad_corner_field(uvs);
+            if normals is not None:
+                normals = self.__split_quad_corner_field(normals);
+        assert(colors is None or len(colors) == faces.size);
 
-        mesh = pymesh.form_mesh(vertices, faces);
+        return weld_corners(vertices, faces, normals, colors, uvs);
 
-        if active_view.use_smooth_normal:
-            normals = active_view.vertex_normals;
-        else:
-            normals = None;
-        data = serialize_mesh(mesh, normals, colors, uvs);
-        with open(tmp_mesh_name, 'wb') as fout:
-            fout.write(data);
-        return tmp_mesh_name, ext;
+    def __is_per_vertex(self, field):
+        return field is None or field.is_uniform or \
+                field.domain == field.VERTEX;
+
+    def __split_quad_corner_field(self, field):
+        num_cols = field.shape[-1];
+        field = field.reshape((-1, 4, num_cols), order="C");
+        return np.vstack([
+            field[:,[0,1,2],:].reshape((-1, num_cols), order="C"),
+            field[:,[0,2,3],:].reshape((-1, num_cols), order="C") ]);
 
     def __get_normalize_transform(self, active_view):
         centroid = active_view.center
@@ -584,6 +827,10 @@ class MitsubaRenderer(AbstractRenderer):
         view_transform = Transform(Matrix4x4(transform.ravel(order="C").tolist()));
         return view_transform;
 
+    def __to_numpy_matrix(self, transform):
+        M = transform.getMatrix();
+        return np.array([[M[i, j] for j in range(4)] for i in range(4)]);
+
     def __get_glob_transform(self):
         glob_transform = Transform(
                 Matrix4x4(self.global_transform.ravel(order="C").tolist()));
@@ -0,0 +1,86 @@
+import inspect
+import multiprocessing
+import os.path
+
+from mitsuba.core import PluginManager, Scheduler, LocalWorker, Thread
+
+from pyrender.misc.scratch import get_scratch_store
+
+class MitsubaSession(object):
+    """ Mitsuba state shared by every render of a scene.
+
+    The plugin manager, file resolver and worker pool are set up once when
+    the session is created and released by close().  Typical usage:
+
+        with MitsubaSession(scene) as session:
+            session.render_all();
+    """
+    def __init__(self, scene, num_workers=None):
+        self.scene = scene;
+        if num_workers is None:
+            num_workers = multiprocessing.cpu_count();
+        self.num_workers = num_workers;
+        self.__initialize_plugins();
+        self.__start_scheduler();
+
+    def __enter__(self):
+        return self;
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.close();
+
+    def __initialize_plugins(self):
+        self.plgr = PluginManager.getInstance();
+
+        mitsuba_module_path = os.path.dirname(
+                inspect.getfile(MitsubaSession));
+        self.file_resolver = Thread.getThread().getFileResolver();
+        for name in ["xml_files", "textures", "shapes"]:
+            self.__append_search_path(os.path.join(mitsuba_module_path, name));
+
+    def __append_search_path(self, path):
+        """ The file resolver is shared by every session of the thread, only
+        add path if it is not there yet.
+        """
+        path = os.path.normpath(path);
+        for i in range(self.file_resolver.getPathCount()):
+            if os.path.normpath(str(self.file_resolver.getPath(i))) == path:
+                return;
+        self.file_resolver.appendPath(path);
+
+    def __start_scheduler(self):
+        self.scheduler = Scheduler.getInstance();
+        if self.scheduler.isRunning():
+            self.scheduler.stop();
+        # Workers stay registered on the singleton scheduler, only add them
+        # the first time.
+        if self.scheduler.getWorkerCount() == 0:
+            for i in range(self.num_workers):
+                self.scheduler.registerWorker(
+                        LocalWorker(i, "worker_{}".format(i)));
+        self.scheduler.start();
+
+    def render(self):
+        """ Render the active view of the scene.
+        """
+        from .MitsubaRenderer import MitsubaRenderer
+        renderer = MitsubaRenderer(self.scene, self);
+        renderer.render();
+        # Report per view, frames of a sweep are released after rendering.
+        active_view = self.scene.active_view;
+        corner_fields = getattr(active_view, "corner_fields", None);
+        if corner_fields is not None:
+            corner_fields.log_stats(active_view.name);
+
+    def render_all(self):
+        """ Render every view of the scene.
+        """
+        for i in range(len(self.scene.views)):
+            self.scene.activate_view(i);
+            self.render();
+
+    def close(self):
+        if self.scheduler is not None and self.scheduler.isRunning():
+            self.scheduler.stop();
+        self.scheduler = None;
+        get_scratch_store().log_stats();
@@ -0,0 +1,53 @@
+import numpy as np
+
+def weld_corners(vertices, faces, normals=None, colors=None, uvs=None):
+    """ Convert corner fields into an indexed triangle mesh.
+
+    vertices is a (V, 3) array and faces a (F, 3) array of vertex indices.
+    normals, colors and uvs are corner fields (one row per face corner) or
+    None.  Corners with identical (position, normal, color, uv) tuples are
+    merged into a single vertex.
+
+    Returns (vertices, faces, normals, colors, uvs) where the attributes have
+    one row per output vertex.
+    """
+    corners = faces.ravel(order="C");
+    fields = [field for field in [normals, colors, uvs] if field is not None];
+    fields = [np.asarray(field).reshape((len(corners), -1)) for field in fields];
+
+    # Fast path: every attribute is already a function of the vertex index.
+    per_vertex_fields = [];
+    for field in fields:
+        per_vertex = np.zeros((len(vertices), field.shape[1]),
+                dtype=field.dtype);
+        per_vertex[corners] = field;
+        if not np.array_equal(per_vertex[corners], field):
+            break;
+        per_vertex_fields.append(per_vertex);
+    else:
+        return (vertices, faces) + _unpack_fields(
+                per_vertex_fields, normals, colors, uvs);
+
+    # General path: weld corners with identical packed rows.
+    rows = np.hstack([vertices[corners]] + fields).astype(float);
+    rows = np.ascontiguousarray(rows);
+    keys = rows.view(np.dtype((np.void, rows.dtype.itemsize * rows.shape[1])));
+    __, first, inverse = np.unique(keys.ravel(), return_index=True,
+            return_inverse=True);
+    rows = rows[first];
+    faces = inverse.reshape(faces.shape, order="C");
+
+    offset = vertices.shape[1];
+    welded_vertices = rows[:, :offset];
+    welded_fields = [];
+    for field in fields:
+        num_cols = field.shape[1];
+        welded_fields.append(rows[:, offset:offset+num_cols]);
+        offset += num_cols;
+    return (welded_vertices, faces) + _unpack_fields(
+            welded_fields, normals, colors, uvs);
+
+def _unpack_fields(fields, normals, colors, uvs):
+    fields = list(fields);
+    return tuple(None if field is None else fields.pop(0)
+            for field in [normals, colors, uvs]);
@@ -1,50 +1,184 @@
+from io import BytesIO
+from itertools import islice
+from multiprocessing.pool import ThreadPool
+import numpy as np
 import struct
 import zlib
 
-def serialize_mesh(mesh, normals=None, colors=None, uvs=None):
+FILE_FORMAT_HEADER = int('041c', 16);
+FILE_FORMAT_VERSION = int('0004', 16);
+DEFAULT_COMPRESSION_LEVEL = zlib.Z_DEFAULT_COMPRESSION;
+
+def serialize_mesh(mesh, normals=None, colors=None, uvs=None,
+        single_precision=False, compression_level=DEFAULT_COMPRESSION_LEVEL):
+    """ Serialize mesh into Mitsuba's .serialized format.
+
+    Each data block is written directly from a contiguous little-endian
+    buffer.  With single_precision, floating point data is stored as float32
+    instead of float64, which halves the file size.
+    """
     assert(mesh.dim == 3);
     assert(mesh.vertex_per_face == 3);
 
+    fout = BytesIO();
+    save_mesh(fout, mesh.vertices, mesh.faces, normals, colors, uvs,
+            single_precision=single_precision,
+            compression_level=compression_level);
+    return fout.getvalue();
+
+def save_mesh(fout, vertices, faces, normals=None, colors=None, uvs=None,
+        single_precision=False, compression_level=DEFAULT_COMPRESSION_LEVEL,
+        max_faces_per_shape=None, num_threads=1):
+    """ Stream a triangle mesh into file object fout in .serialized format.
+
+    Meshes with more than max_faces_per_shape faces are split into several
+    shapes stored in the same file, and the shapes are compressed by
+    num_threads threads.  Shape i can be loaded in Mitsuba by setting
+    "shapeIndex" to i.  compression_level is passed to zlib, 0 disables
+    compression.
+
+    Returns the number of shapes written.
+    """
+    assert(faces.shape[1] == 3);
+    shapes = split_mesh(vertices, faces, normals, colors, uvs,
+            max_faces_per_shape);
+    compress = lambda shape: compress_shape(shape, single_precision,
+            compression_level);
+
+    offsets = [];
+    offset = 0;
+    if num_threads > 1 and max_faces_per_shape is not None and \
+            len(faces) > max_faces_per_shape:
+        pool = ThreadPool(num_threads);
+        try:
+            # Split and compress one batch of shapes at a time so that at
+            # most num_threads shapes are held in memory.
+            while True:
+                batch = list(islice(shapes, num_threads));
+                if len(batch) == 0: break;
+                for chunks in pool.map(compress, batch):
+                    offsets.append(offset);
+                    for chunk in chunks:
+                        fout.write(chunk);
+                        offset += len(chunk);
+        finally:
+            pool.close();
+            pool.join();
+    else:
+        for shape in shapes:
+            offsets.append(offset);
+            offset += write_shape(fout.write, shape, single_precision,
+                    compression_level);
+
+    footer = struct.pack("<{}QI".format(len(offsets)),
+            *(offsets + [len(offsets)]));
+    fout.write(footer);
+    return len(offsets);
+
+def split_mesh(vertices, faces, normals=None, colors=None, uvs=None,
+        max_faces_per_shape=None):
+    """ Generate (vertices, faces, normals, colors, uvs) tuples with at most
+    max_faces_per_shape faces each.  Shapes are created one at a time as
+    they are consumed.  Per-vertex attributes are only kept if they have one
+    entry per vertex.
+    """
+    num_vertices = len(vertices);
+    if normals is not None and len(normals) != num_vertices:
+        normals = None;
+    if colors is not None and len(colors) != num_vertices:
+        colors = None;
+    if uvs is not None and len(uvs) != num_vertices:
+        uvs = None;
+
+    num_faces = len(faces);
+    if max_faces_per_shape is None or num_faces <= max_faces_per_shape:
+        yield (vertices, faces, normals, colors, uvs);
+        return;
+
+    for i in range(0, num_faces, max_faces_per_shape):
+        chunk = faces[i:i+max_faces_per_shape];
+        used, chunk = np.unique(chunk.ravel(), return_inverse=True);
+        chunk = chunk.reshape((-1, 3));
+        yield (vertices[used], chunk,
+                None if normals is None else normals[used],
+                None if colors is None else colors[used],
+                None if uvs is None else uvs[used]);
+
+def compress_shape(shape, single_precision=False,
+        compression_level=DEFAULT_COMPRESSION_LEVEL):
+    """ Return the serialized shape as a list of byte strings.
+    """
+    chunks = [];
+    write_shape(chunks.append, shape, single_precision, compression_level);
+    return chunks;
+
+def write_shape(write, shape, single_precision=False,
+        compression_level=DEFAULT_COMPRESSION_LEVEL):
+    """ Write a single shape using the write callback.  The payload is
+    compressed block by block, so it is never concatenated in memory.
+
+    Returns the number of bytes written.
+    """
+    vertices, faces, normals, colors, uvs = shape;
     name = b"Generated by PyMesh";
-    header1 = int('041c', 16);
-    header2 = int('0004', 16);
-    header = struct.pack("<HH", header1, header2);
-    data_flags = 1<<13; # Double precision.
-
-    vertices = mesh.vertices;
-    vertex_data = b''.join([struct.pack("<ddd", v[0], v[1], v[2])
-        for v in mesh.vertices ]);
-    face_data = b''.join([struct.pack('<III', f[0], f[1], f[2])
-        for f in mesh.faces]);
-
-    if normals is not None and len(normals) == mesh.num_vertices:
-        data_flags |= 1;
-        normal_data = b''.join([struct.pack('<ddd', n[0], n[1], n[2])
-            for n in normals]);
+    if single_precision:
+        data_flags = 1<<12; # Single precision.
+        float_type = "<f4";
     else:
-        normal_data = b'';
+        data_flags = 1<<13; # Double precision.
+        float_type = "<f8";
 
-    if colors is not None and len(colors) == mesh.num_vertices:
-        data_flags |= 8;
-        color_data = b''.join([struct.pack('<ddd', c[0], c[1], c[2])
-            for c in colors]);
+    num_vertices = len(vertices);
+    if num_vertices <= 0xFFFFFFFF:
+        index_type = "<u4";
     else:
-        color_data = b'';
+        index_type = "<u8";
 
-    if uvs is not None and len(uvs) == mesh.num_vertices:
+    blocks = [to_buffer(vertices, float_type, 3)];
+    if normals is not None:
+        data_flags |= 1;
+        blocks.append(to_buffer(normals, float_type, 3));
+    if uvs is not None:
         data_flags |= 2;
-        uv_data = b''.join([struct.pack('<dd', uv[0], uv[1])
-            for uv in uvs])
-    else:
-        uv_data = b'';
+        blocks.append(to_buffer(uvs, float_type, 2));
+    if colors is not None:
+        data_flags |= 8;
+        blocks.append(to_buffer(colors, float_type, 3));
+    blocks.append(to_buffer(faces, index_type, 3));
 
     mesh_header = struct.pack("<I{}sQQ".format(len(name)+1), data_flags,
-            name, mesh.num_faces * 3, mesh.num_faces);
+            name, num_vertices, len(faces));
+    blocks.insert(0, mesh_header);
+
+    header = struct.pack("<HH", FILE_FORMAT_HEADER, FILE_FORMAT_VERSION);
+    write(header);
+    num_bytes = len(header);
+
+    compressor = zlib.compressobj(compression_level);
+    for block in blocks:
+        data = compressor.compress(block);
+        if len(data) > 0:
+            write(data);
+            num_bytes += len(data);
+    data = compressor.flush();
+    write(data);
+    num_bytes += len(data);
+    return num_bytes;
 
-    mesh_data = mesh_header + vertex_data + \
-            normal_data + uv_data + color_data + face_data;
-    mesh_data = zlib.compress(mesh_data);
-    footer = struct.pack("<QI", 0, 1);
+def to_buffer(data, dtype, num_columns):
+    """ Return a memoryview over data laid out as a C-contiguous array of the
+    given little-endian dtype.  Only the first num_columns columns are kept.
+    No copy is made if data already has the right layout.
+    """
+    data = np.asarray(data);
+    data = data.reshape((len(data), -1))[:, :num_columns];
+    data = np.ascontiguousarray(data, dtype=dtype);
+    return memoryview(data).cast("B");
 
-    data = header + mesh_data + footer;
-    return data;
+def count_shapes(filename):
+    """ Return the number of shapes stored in a .serialized file.
+    """
+    with open(filename, 'rb') as fin:
+        fin.seek(-4, 2);
+        num_shapes, = struct.unpack("<I", fin.read(4));
+    return num_shapes;
@@ -16,7 +16,8 @@ except:
 
 from pyrender.renderer.AbstractRenderer import AbstractRenderer
 from pyrender.color.Color import Color, color_table
-from pyrender.primitives.Primitive import Cylinder, Cone, Sphere
+from pyrender.renderer.culling import get_normalize_matrix, get_view_matrix
+from pyrender.primitives.PrimitiveBatch import PrimitiveBatch
 from pyrender.scene.Scene import Scene
 from pyrender.misc.quaternion import Quaternion
 
@@ -252,7 +253,14 @@ class OpenGLRenderer(AbstractRenderer):
         need_duplicate = self.__flat_shading;
 
         self.__vertices = view.vertices[view.faces.ravel(order="C")];
-        self.__vertex_colors = view.vertex_colors;
+        color_field = view.color_field;
+        if color_field.is_uniform:
+            # Set with glColor, no color buffer needed.
+            self.__uniform_color = color_field.uniform_color;
+            self.__vertex_colors = None;
+        else:
+            self.__uniform_color = None;
+            self.__vertex_colors = color_field.to_corners();
         self.__faces = view.faces;
 
         if self.__flat_shading:
@@ -468,6 +476,11 @@ class OpenGLRenderer(AbstractRenderer):
             glEnable(GL_COLOR_MATERIAL)
             glColorMaterial(GL_FRONT_AND_BACK, GL_DIFFUSE)
             glMaterialfv(GL_FRONT_AND_BACK, GL_AMBIENT, [0.0, 0.0, 0.0, 1.0]);
+        elif self.__uniform_color is not None:
+            glEnable(GL_COLOR_MATERIAL)
+            glColorMaterial(GL_FRONT_AND_BACK, GL_DIFFUSE)
+            glMaterialfv(GL_FRONT_AND_BACK, GL_AMBIENT, [0.0, 0.0, 0.0, 1.0]);
+            glColor4d(*self.__uniform_color);
         else:
             glDisable(GL_COLOR_MATERIAL)
             glColor(*self.DEFAULT_FG_COLOR);
@@ -518,74 +531,56 @@ class OpenGLRenderer(AbstractRenderer):
         glColorMaterial(GL_FRONT_AND_BACK, GL_DIFFUSE)
         glMaterialfv(GL_FRONT_AND_BACK, GL_AMBIENT, [0.0, 0.0, 0.0, 1.0]);
 
-        self.__draw_sphere();
-        self.__draw_cylinders();
-        self.__draw_cone();
+        primitives = self.cull_primitives(self.scene.active_view.primitives,
+                self.__get_model_matrix(), *glGetIntegerv(GL_VIEWPORT)[2:4]);
+        centers, _, radii, colors = primitives.select(PrimitiveBatch.SPHERE);
+        self.__draw_spheres(centers, radii, colors);
+        p0, p1, radii, colors = primitives.select(PrimitiveBatch.CYLINDER);
+        self.__draw_tubes(p0, p1, radii, radii, colors);
+        p0, p1, radii, colors = primitives.select(PrimitiveBatch.CONE);
+        self.__draw_tubes(p0, p1, radii, np.zeros_like(radii), colors);
 
         glPopAttrib();
         glPopClientAttrib();
         self.__timer.tok("draw primitives");
 
-    def __draw_sphere(self):
-        glMatrixMode(GL_MODELVIEW);
-
-        quadric = gluNewQuadric();
-        gluQuadricNormals(quadric, GLU_SMOOTH);
-        for shape in self.scene.active_view.primitives:
-            if not isinstance(shape, Sphere): continue;
-            glPushMatrix();
-            glTranslated(*shape.center);
-
-            glColor3d(*shape.color[:3]);
-            gluSphere(quadric, shape.radius, 8, 16);
-
-            glPopMatrix();
-        gluDeleteQuadric(quadric);
-
-    def __draw_cylinders(self):
-        z_dir = np.array([0.0, 0.0, 1.0]);
+    def __draw_spheres(self, centers, radii, colors):
         glMatrixMode(GL_MODELVIEW);
 
         quadric = gluNewQuadric();
         gluQuadricNormals(quadric, GLU_SMOOTH);
-        for shape in self.scene.active_view.primitives:
-            if not isinstance(shape, Cylinder): continue;
+        for center, radius, color in zip(centers, radii, colors):
             glPushMatrix();
+            glTranslated(*center);
 
-            v = shape.end_points[1] - shape.end_points[0];
-            height = norm(v);
-            rotation = Quaternion.fromData(z_dir, v);
-
-            glTranslated(*shape.end_points[0]);
-            mat = self.__convert_to_homogeneous_matrix(rotation.to_matrix());
-            glMultMatrixd(mat);
-
-            glColor3d(*shape.color[:3]);
-            gluCylinder(quadric, shape.radius, shape.radius, height, 8, 1);
+            glColor3d(*color[:3]);
+            gluSphere(quadric, radius, 8, 16);
 
             glPopMatrix();
         gluDeleteQuadric(quadric);
 
-    def __draw_cone(self):
+    def __draw_tubes(self, p0, p1, base_radii, top_radii, colors):
+        """ Draw cylinders and cones from p0 to p1.
+        """
         z_dir = np.array([0.0, 0.0, 1.0]);
         glMatrixMode(GL_MODELVIEW);
 
         quadric = gluNewQuadric();
         gluQuadricNormals(quadric, GLU_SMOOTH);
-        for shape in self.scene.active_view.primitives:
-            if not isinstance(shape, Cone): continue;
+        directions = p1 - p0;
+        heights = norm(directions, axis=1);
+        for i in range(len(p0)):
             glPushMatrix();
 
-            v = shape.end_points[1] - shape.end_points[0];
-            height = norm(v);
-            rotation = Quaternion.fromData(z_dir, v);
+            rotation = Quaternion.fromData(z_dir, directions[i]);
 
-            glTranslated(*shape.end_points[0]);
+            glTranslated(*p0[i]);
             mat = self.__convert_to_homogeneous_matrix(rotation.to_matrix());
             glMultMatrixd(mat);
 
-            glColor3d(*shape.color[:3]);
-            gluCylinder(quadric, shape.radius, 0.0, height, 8, 1);
+            glColor3d(*colors[i][:3]);
+            gluCylinder(quadric, base_radii[i], top_radii[i], heights[i],
+                    8, 1);
 
             glPopMatrix();
         gluDeleteQuadric(quadric);
@@ -708,6 +703,16 @@ class OpenGLRenderer(AbstractRenderer):
             self.__frames = 0;
             self.__prev_tic = cur_tic;
 
+    def __get_model_matrix(self):
+        """ Model to world matrix set up by __push_modelview_matrix().
+        """
+        active_view = self.scene.active_view;
+        trackball_transform = np.eye(4);
+        trackball_transform[:3, :3] = self.__trackball.get_rotation_matrix();
+        trackball_transform[:3, 3] = self.__translation;
+        return np.dot(trackball_transform, np.dot(
+            get_normalize_matrix(active_view), get_view_matrix(active_view)));
+
     def __convert_to_homogeneous_matrix(self, matrix):
         M = np.ravel(matrix, order="F");
         assert(len(M) == 9);
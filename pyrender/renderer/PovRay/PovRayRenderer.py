@@ -6,7 +6,8 @@ import os.path
 from subprocess import check_call
 
 from pyrender.renderer.AbstractRenderer import AbstractRenderer
-from pyrender.primitives.Primitive import Cylinder, Cone, Sphere
+from pyrender.renderer.culling import get_normalize_matrix, get_view_matrix
+from pyrender.primitives.PrimitiveBatch import PrimitiveBatch
 
 class PovRayRenderer(AbstractRenderer):
     def __init__(self, scene):
@@ -112,37 +113,63 @@ class PovRayRenderer(AbstractRenderer):
     def __add_active_view(self):
         active_view = self.scene.active_view;
         if len(active_view.vertices) == 0: return;
-        view_setting = self.pov_template.get_def("add_view").render(
-                vertices = active_view.vertices,
-                triangles = active_view.faces,
-                colors = active_view.vertex_colors
-                );
+        color_field = active_view.color_field;
+        if color_field.is_uniform:
+            view_setting = self.pov_template.get_def("add_uniform_view").render(
+                    vertices = active_view.vertices,
+                    triangles = active_view.faces,
+                    color = color_field.uniform_color
+                    );
+        else:
+            colors, color_indices = self.__get_indexed_colors(color_field);
+            view_setting = self.pov_template.get_def("add_view").render(
+                    vertices = active_view.vertices,
+                    triangles = active_view.faces,
+                    colors = colors,
+                    color_indices = color_indices
+                    );
         self.povray_setting += view_setting;
 
+    def __get_indexed_colors(self, color_field):
+        """ Return the colors of color_field as a flat list and the index of
+        the color of each face corner.
+        """
+        faces = color_field.faces;
+        if color_field.domain == color_field.VERTEX:
+            indices = faces;
+        elif color_field.domain == color_field.FACE:
+            indices = np.repeat(np.arange(len(faces))[:, np.newaxis],
+                    faces.shape[1], axis=1);
+        else:
+            indices = np.arange(faces.size).reshape(faces.shape);
+        colors = color_field.values.reshape((-1, 4));
+        return colors, indices;
+
     def __add_primitives(self):
-        primitives = self.scene.active_view.primitives;
-        for shape in primitives:
-            if isinstance(shape, Cylinder):
-                cylinder_setting = \
-                        self.pov_template.get_def("add_cylinder").render(
-                                end_points = shape.end_points,
-                                radii = [shape.radius, shape.radius],
-                                color = shape.color);
-                self.povray_setting += cylinder_setting;
-            elif isinstance(shape, Cone):
-                cone_setting = \
-                        self.pov_template.get_def("add_cylinder").render(
-                                end_points = shape.end_points,
-                                radii = [shape.radius, 0.0],
-                                color = shape.color);
-                self.povray_setting += cone_setting;
-            elif isinstance(shape, Sphere):
-                sphere_setting =\
-                        self.pov_template.get_def("add_sphere").render(
-                                center = shape.center,
-                                radius = shape.radius,
-                                color = shape.color);
-                self.povray_setting += sphere_setting;
+        active_view = self.scene.active_view;
+        # Primitives are transformed by view_transform, normalize and
+        # glob_transform in that order.
+        model_matrix = np.dot(self.scene.global_transform,
+                np.dot(get_normalize_matrix(active_view),
+                    get_view_matrix(active_view)));
+        primitives = self.cull_primitives(active_view.primitives,
+                model_matrix, self.image_width, self.image_height);
+        p0, p1, radii, colors = primitives.select(PrimitiveBatch.CYLINDER);
+        self.povray_setting += \
+                self.pov_template.get_def("add_cylinders").render(
+                        p0 = p0, p1 = p1, r0 = radii, r1 = radii,
+                        colors = colors);
+
+        p0, p1, radii, colors = primitives.select(PrimitiveBatch.CONE);
+        self.povray_setting += \
+                self.pov_template.get_def("add_cylinders").render(
+                        p0 = p0, p1 = p1, r0 = radii,
+                        r1 = np.zeros_like(radii), colors = colors);
+
+        centers, _, radii, colors = primitives.select(PrimitiveBatch.SPHERE);
+        self.povray_setting += \
+                self.pov_template.get_def("add_spheres").render(
+                        centers = centers, radii = radii, colors = colors);
 
     def __add_others(self):
         active_view = self.scene.active_view;
@@ -55,17 +55,15 @@ mesh2 {
         % endfor
     }
     texture_list {
-        ${len(colors) * 3},
-        % for corner_colors in colors:
-            % for c in corner_colors:
-                texture{pigment{rgbt<${"{}, {}, {}".format(*c[:3])},${1.0-c[3]}>}},
-            % endfor
+        ${len(colors)},
+        % for c in colors:
+            texture{pigment{rgbt<${"{}, {}, {}".format(*c[:3])},${1.0-c[3]}>}},
         % endfor
     }
     face_indices {
         ${len(triangles)}
-        % for i,t in enumerate(triangles):
-            ${"<{}, {}, {}>".format(*t)}, ${"{}, {}, {},".format(i*3, i*3+1, i*3+2)}
+        % for t, c in zip(triangles, color_indices):
+            ${"<{}, {}, {}>".format(*t)}, ${"{}, {}, {},".format(*c)}
         % endfor
     }
 
@@ -75,34 +73,60 @@ mesh2 {
 }
 </%def>
 
-<%def name="add_cylinder()">
+<%def name="add_uniform_view()">
+mesh2 {
+    vertex_vectors {
+        ${len(vertices)},
+        % for v in vertices:
+            ${"<{}, {}, {}>,".format(*v)}
+        % endfor
+    }
+    face_indices {
+        ${len(triangles)}
+        % for t in triangles:
+            ${"<{}, {}, {}>,".format(*t)}
+        % endfor
+    }
+    texture{pigment{rgbt<${"{}, {}, {}".format(*color[:3])},${1.0-color[3]}>}}
+
+    transform view_transform
+    transform normalize
+    transform glob_transform
+}
+</%def>
+
+<%def name="add_cylinders()">
+% for i in range(len(r0)):
 cone {
-    ${"<{}, {}, {}>".format(*end_points[0])},
-    ${radii[0]},
-    ${"<{}, {}, {}>".format(*end_points[1])},
-    ${radii[1]}
+    ${"<{}, {}, {}>".format(*p0[i])},
+    ${r0[i]},
+    ${"<{}, {}, {}>".format(*p1[i])},
+    ${r1[i]}
 
     texture {
-        pigment { rgb ${"<{}, {}, {}>".format(*color[:3])} }
+        pigment { rgb ${"<{}, {}, {}>".format(*colors[i][:3])} }
     }
 
     transform view_transform
     transform normalize
     transform glob_transform
 }
+% endfor
 </%def>
 
-<%def name="add_sphere()">
+<%def name="add_spheres()">
+% for i in range(len(radii)):
 sphere {
-    ${"<{}, {}, {}>".format(*center)}, ${radius}
+    ${"<{}, {}, {}>".format(*centers[i])}, ${radii[i]}
     texture {
-        pigment { rgb ${"<{}, {}, {}>".format(*color[:3])} }
+        pigment { rgb ${"<{}, {}, {}>".format(*colors[i][:3])} }
     }
 
     transform view_transform
     transform normalize
     transform glob_transform
 }
+% endfor
 </%def>
 
 <%def name="add_quarter()">
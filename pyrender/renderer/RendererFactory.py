@@ -14,3 +14,8 @@ class RendererFactory():
         from .Mitsuba.MitsubaRenderer import MitsubaRenderer
         return MitsubaRenderer(scene);
 
+    @classmethod
+    def create_Mitsuba_session_from_scene(cls, scene):
+        from .Mitsuba.MitsubaSession import MitsubaSession
+        return MitsubaSession(scene);
+
@@ -0,0 +1,116 @@
+import numpy as np
+from numpy.linalg import norm, det
+from math import radians, tan
+
+from pyrender.primitives.PrimitiveBatch import as_primitive_batch
+
+def cull_primitives(primitives, camera, model_matrix, width, height,
+        crop_bbox=None, min_pixels=1.0, cull_outside=True):
+    """ Remove primitives that cannot show up in the image.
+
+    Primitives are projected through model_matrix (4x4, primitive space to
+    world space) and the perspective camera.  Primitives whose bounding
+    sphere lies outside of the view frustum, restricted to crop_bbox if
+    given, are dropped unless cull_outside is False.  Visible primitives
+    whose bounding sphere is smaller than min_pixels in diameter are merged:
+    only the one closest to the camera is kept per pixel.
+
+    Returns the culled batch, the number of primitives outside of the
+    frustum and the number of merged primitives.
+    """
+    primitives = as_primitive_batch(primitives);
+    num_primitives = len(primitives);
+    if num_primitives == 0:
+        return primitives, 0, 0;
+
+    # Bounding spheres in camera space.
+    model_matrix = np.asarray(model_matrix, dtype=float);
+    linear = model_matrix[:3, :3];
+    scale = abs(det(linear)) ** (1.0 / 3.0);
+    p0, p1 = primitives.p0, primitives.p1;
+    centers = np.dot(0.5 * (p0 + p1), linear.T) + model_matrix[:3, 3];
+    radii = scale * (primitives.radii + 0.5 * norm(p1 - p0, axis=1));
+
+    forward, right, up = get_camera_frame(camera);
+    offsets = centers - camera.location;
+    x = np.dot(offsets, right);
+    y = np.dot(offsets, up);
+    z = np.dot(offsets, forward);
+
+    # Image window as tangent ranges: x/z in [x0, x1] and y/z in [y0, y1].
+    tan_y = tan(radians(camera.fovy) * 0.5);
+    tan_x = tan_y * width / height;
+    if crop_bbox is None:
+        crop_bbox = [[0.0, 0.0], [1.0, 1.0]];
+    crop_bbox = np.array(crop_bbox, dtype=float);
+    if np.amax(crop_bbox) > 1.0:
+        # bbox is in pixels.
+        crop_bbox /= [width, height];
+    x0, x1 = (2.0 * crop_bbox[:, 0] - 1.0) * tan_x;
+    y1, y0 = (1.0 - 2.0 * crop_bbox[:, 1]) * tan_y;
+
+    # Signed distances to the frustum planes.  The side planes pass through
+    # the camera location.
+    visible = np.logical_and(z + radii >= camera.near_plane,
+            z - radii <= camera.far_plane);
+    visible &= (x - x0 * z) >= -radii * np.hypot(1.0, x0);
+    visible &= (x1 * z - x) >= -radii * np.hypot(1.0, x1);
+    visible &= (y - y0 * z) >= -radii * np.hypot(1.0, y0);
+    visible &= (y1 * z - y) >= -radii * np.hypot(1.0, y1);
+    num_outside = num_primitives - np.count_nonzero(visible);
+
+    # Primitives that fit into a pixel are merged per pixel.
+    pixel_size = 2.0 * tan_y / height;
+    depths = np.maximum(z - radii, 1e-12);
+    small = np.logical_and(visible, z > radii);
+    small[small] = 2.0 * radii[small] < \
+            min_pixels * pixel_size * depths[small];
+    if cull_outside:
+        keep = np.logical_and(visible, ~small);
+    else:
+        keep = ~small;
+        num_outside = 0;
+    small_ids = np.flatnonzero(small);
+    if len(small_ids) > 0:
+        pixel_x = np.floor((x[small_ids] / z[small_ids] / tan_x + 1.0) *
+                0.5 * width);
+        pixel_y = np.floor((1.0 - y[small_ids] / z[small_ids] / tan_y) *
+                0.5 * height);
+        pixel_keys = pixel_y * (width + 1) + pixel_x;
+        order = np.lexsort((z[small_ids], pixel_keys));
+        sorted_keys = pixel_keys[order];
+        first = np.ones(len(order), dtype=bool);
+        first[1:] = sorted_keys[1:] != sorted_keys[:-1];
+        keep[small_ids[order[first]]] = True;
+    num_merged = np.count_nonzero(small) - np.count_nonzero(keep & small);
+
+    if num_outside == 0 and num_merged == 0:
+        return primitives, 0, 0;
+    return primitives.subset(keep), num_outside, num_merged;
+
+def get_camera_frame(camera):
+    """ Orthonormal forward, right and up directions of the camera.
+    """
+    forward = np.asarray(camera.look_at_point, dtype=float) - \
+            np.asarray(camera.location, dtype=float);
+    forward /= norm(forward);
+    right = np.cross(forward, camera.up_direction);
+    right /= norm(right);
+    up = np.cross(right, forward);
+    return forward, right, up;
+
+def get_view_matrix(view):
+    """ 4x4 matrix of the transform stored in the view.
+    """
+    matrix = np.eye(4);
+    matrix[:3, :] = np.asarray(view.transform).reshape((3, 4), order="F");
+    return matrix;
+
+def get_normalize_matrix(view):
+    """ 4x4 matrix that moves the view center to the origin and scales the
+    view to fit.
+    """
+    matrix = np.eye(4) * view.scale;
+    matrix[3, 3] = 1.0;
+    matrix[:3, 3] = -view.scale * np.asarray(view.center, dtype=float);
+    return matrix;
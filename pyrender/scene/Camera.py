@@ -1,3 +1,4 @@
+from math import radians, tan
 import numpy as np
 from numpy.linalg import norm
 
@@ -44,6 +45,14 @@ class Camera(object):
         self.focal_length = norm(
                 self.location - self.look_at_point);
 
+    def get_pixel_size(self, image_height, depth=None):
+        """ World space size of one pixel at the given distance from the
+        camera.  depth defaults to the distance to the look at point.
+        """
+        if depth is None:
+            depth = self.focal_length;
+        return 2.0 * depth * tan(radians(self.fovy) * 0.5) / image_height;
+
     def zoom(self, factor):
         camera_vector = self.location - self.look_at_point;
         self.location = self.look_at_point + camera_vector*factor;
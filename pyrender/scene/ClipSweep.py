@@ -0,0 +1,118 @@
+import numpy as np
+
+from pyrender.misc.hashing import hash_content
+
+class ClipSweep(object):
+    """ Incremental clipping of a tet mesh by parallel half spaces.
+
+    Voxels are sorted once by their centroid along the plane normal, so the
+    voxels kept by the half space dot(p, normal) < offset are a prefix of
+    that order.  Each voxel face has a neighbor slot, the same face seen
+    from the adjacent voxel.  Moving the plane only updates the surface
+    flags of the voxels that entered or left the half space and of their
+    neighbors.
+    """
+    # Local faces of a tet, fixed to point outwards in __init_slots().
+    TET_FACES = np.array([[1, 2, 3], [0, 3, 2], [0, 1, 3], [0, 2, 1]]);
+
+    def __init__(self, vertices, voxels, normal, faces):
+        """ faces are the boundary faces of the unclipped mesh, clip() maps
+        the clipped surface back to them.
+        """
+        # Identifies the input mesh for caching clip results.
+        self.content_key = hash_content(vertices, voxels, faces);
+        voxels = np.asarray(voxels, dtype=int);
+        if voxels.ndim != 2 or voxels.shape[1] != 4:
+            raise NotImplementedError(
+                    "Clip sweep only supports tetrahedral meshes");
+        self.vertices = np.asarray(vertices, dtype=float);
+        self.voxels = voxels;
+        self.num_voxels = len(voxels);
+
+        centroids = np.mean(self.vertices[voxels], axis=1);
+        projections = np.dot(centroids, normal);
+        self.order = np.argsort(projections, kind="mergesort");
+        self.sorted_projections = projections[self.order];
+
+        self.__init_slots(centroids);
+        self.__init_face_ids(faces);
+
+        self.kept = np.zeros(self.num_voxels, dtype=bool);
+        self.num_kept = 0;
+        self.is_surface = np.zeros(len(self.slot_faces), dtype=bool);
+
+    def clip(self, offset):
+        """ Move the plane to offset.  Returns the kept voxels, the
+        surface faces and, for each surface face, the index of the
+        boundary face it comes from or -1 for faces on the cut.
+        """
+        num_kept = np.searchsorted(self.sorted_projections, offset,
+                side="left");
+        lo, hi = sorted([self.num_kept, num_kept]);
+        changed = self.order[lo:hi];
+        self.kept[changed] = num_kept > self.num_kept;
+        self.num_kept = num_kept;
+
+        slots = (changed[:, np.newaxis] * 4 + np.arange(4)).ravel();
+        neighbors = self.neighbor_slots[slots];
+        slots = np.concatenate([slots, neighbors[neighbors >= 0]]);
+        self.__update_surface(slots);
+
+        surface = np.flatnonzero(self.is_surface);
+        return self.voxels[self.kept], self.slot_faces[surface],\
+                self.slot_face_ids[surface];
+
+    def __update_surface(self, slots):
+        neighbors = self.neighbor_slots[slots];
+        exposed = np.ones(len(slots), dtype=bool);
+        interior = neighbors >= 0;
+        exposed[interior] = ~self.kept[neighbors[interior] // 4];
+        self.is_surface[slots] = np.logical_and(self.kept[slots // 4],
+                exposed);
+
+    def __init_slots(self, centroids):
+        """ Orient voxel faces outwards and pair up the slots sharing a face.
+        """
+        slot_faces = self.voxels[:, self.TET_FACES].reshape((-1, 3));
+        corners = self.vertices[slot_faces];
+        normals = np.cross(corners[:, 1] - corners[:, 0],
+                corners[:, 2] - corners[:, 0]);
+        outwards = np.mean(corners, axis=1) - \
+                np.repeat(centroids, 4, axis=0);
+        inverted = np.einsum("ij,ij->i", normals, outwards) < 0.0;
+        slot_faces[inverted] = slot_faces[inverted][:, ::-1];
+        self.slot_faces = slot_faces;
+
+        self.slot_keys = self.__encode(slot_faces);
+        order = np.argsort(self.slot_keys, kind="mergesort");
+        sorted_keys = self.slot_keys[order];
+        shared = np.flatnonzero(sorted_keys[1:] == sorted_keys[:-1]);
+        self.neighbor_slots = np.full(len(slot_faces), -1, dtype=int);
+        self.neighbor_slots[order[shared]] = order[shared + 1];
+        self.neighbor_slots[order[shared + 1]] = order[shared];
+
+    def __init_face_ids(self, faces):
+        """ Boundary slots take the vertex order of their boundary face.
+        """
+        self.slot_face_ids = np.full(len(self.slot_faces), -1, dtype=int);
+        faces = np.asarray(faces, dtype=int).reshape((-1, 3));
+        if len(faces) == 0: return;
+        face_keys = self.__encode(faces);
+        face_order = np.argsort(face_keys);
+        boundary = np.flatnonzero(self.neighbor_slots < 0);
+        index = np.searchsorted(face_keys[face_order],
+                self.slot_keys[boundary]);
+        index = np.minimum(index, len(faces) - 1);
+        matched = face_keys[face_order[index]] == self.slot_keys[boundary];
+        face_ids = face_order[index[matched]];
+        self.slot_face_ids[boundary[matched]] = face_ids;
+        self.slot_faces[boundary[matched]] = faces[face_ids];
+
+    def __encode(self, faces):
+        """ Orientation independent key per triangle.  The sorted vertex
+        indices are viewed as a single opaque value, which unlike a linear
+        index cannot overflow on large meshes.
+        """
+        faces = np.ascontiguousarray(np.sort(faces, axis=1), dtype=np.int64);
+        return faces.view(np.dtype((np.void, faces.itemsize * 3))).ravel();
+
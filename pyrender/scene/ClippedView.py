@@ -1,14 +1,18 @@
 import pymesh
 import numpy as np
 from numpy.linalg import norm
-import tempfile
-import hashlib
 import os.path
 
+from .ClipSweep import ClipSweep
+from .LazyViewSequence import LazyViewSequence
 from .View import View
 from .ViewDecorator import ViewDecorator
 from .MeshView import MeshView
-from pyrender.color.Color import get_color, Color
+from pyrender.color.Color import get_color
+from pyrender.misc.hashing import hash_content
+from pyrender.misc.indexed_field import IndexedField
+from pyrender.misc.mesh_attributes import get_derived_attribute
+from pyrender.misc.scratch import get_scratch_store
 
 class ClippedView(ViewDecorator):
     @classmethod
@@ -19,101 +23,107 @@ class ClippedView(ViewDecorator):
             "plane": +X,+Y,+Z,-X,-Y,-Z, or [nx, ny, nz, o]
                 s.t. the plane define is nx*x + ny*y + nz*z < o
             "cut_ratio": float between 0 and 1,
-            "interior_color": "color_name"
+            "cut_ratios": [float, ...], # optional, see below
+            "interior_color": "color_name",
+            "exterior_color": "color_name",
+            "name": base_file_name, # only used with cut_ratios
             "view": {
                 ...
             }
         }
+
+        If cut_ratios is given, a LazyViewSequence with one view per cut
+        ratio is returned instead, see sweep().  Scene creates the views one
+        at a time while rendering.
         """
         nested_view = View.create_from_setting(setting["view"]);
+        interior_color = setting.get("interior_color", "blue");
+        exterior_color = setting.get("exterior_color", "yellow");
+        if "cut_ratios" in setting:
+            nested_view.name = setting.get("name", nested_view.name);
+            cut_ratios = setting["cut_ratios"];
+            return LazyViewSequence(lambda: cls.sweep(nested_view,
+                setting["plane"], interior_color, exterior_color, cut_ratios),
+                len(cut_ratios));
+
         instance = ClippedView(nested_view, setting["plane"],
-                setting.get("interior_color", "blue"),
-                setting.get("exterior_color", "yellow"),
+                interior_color, exterior_color,
                 setting.get("cut_ratio", 0.5));
         return instance;
 
+    @classmethod
+    def sweep(cls, nested_view, plane, interior_color, exterior_color,
+            cut_ratios):
+        """ Lazily yield one ClippedView per cut ratio.  Tet meshes are
+        clipped incrementally from the previous frame, see ClipSweep, other
+        voxel meshes are clipped from scratch for every frame.  Frame i is
+        named <name>_<i>.<ext> after the nested view.
+        """
+        sweep = None;
+        voxels = nested_view.voxels;
+        if len(voxels) > 0 and voxels.shape[1] == 4:
+            normal, __ = cls.__get_half_space(plane, nested_view.bmin);
+            sweep = ClipSweep(nested_view.vertices, nested_view.voxels,
+                    normal, nested_view.faces);
+        basename, ext = os.path.splitext(nested_view.name);
+        for i, cut_ratio in enumerate(cut_ratios):
+            instance = cls(nested_view, plane, interior_color,
+                    exterior_color, cut_ratio, sweep);
+            instance.name = "{}_{:06}{}".format(basename, i, ext);
+            yield instance;
+
     def __init__(self, nested_view, plane, interior_color, exterior_color,
-            cut_ratio):
+            cut_ratio, sweep=None):
         super(ClippedView, self).__init__(nested_view);
         self.plane = plane;
         bbox_min = self.view.bmin;
         bbox_max = self.view.bmax;
         center = bbox_min * cut_ratio + bbox_max * (1.0 - cut_ratio);
-        if plane == "+X":
-            should_keep = lambda v: v[0] > center[0];
-        elif plane == "+Y":
-            should_keep = lambda v: v[1] > center[1];
-        elif plane == "+Z":
-            should_keep = lambda v: v[2] > center[2];
-        elif plane == "-X":
-            should_keep = lambda v: v[0] < center[0];
-        elif plane == "-Y":
-            should_keep = lambda v: v[1] < center[1];
-        elif plane == "-Z":
-            should_keep = lambda v: v[2] < center[2];
-        elif isinstance(plane, list) and len(plane) == 4:
-            n = np.array(plane[:3]);
-            n = n / norm(n);
-            should_keep = lambda v: np.dot(v-center, n) < plane[3];
-        else:
-            raise NotImplementedError("Unknown plane type: {}".format(plane));
+        normal, offset = self.__get_half_space(plane, center);
 
         if len(self.view.voxels) > 0:
-            mesh = pymesh.form_mesh(self.view.vertices, np.array([]),
-                    self.view.voxels);
-            mesh.add_attribute("voxel_centroid");
-            mesh.add_attribute("voxel_face_index");
-            voxel_face_id = mesh.get_voxel_attribute("voxel_face_index").astype(int);
-            centroids = mesh.get_voxel_attribute("voxel_centroid");
-            self.V_to_keep = [should_keep(v) for v in centroids];
-            voxels_to_keep = self.view.voxels[self.V_to_keep];
-            voxel_face_id = voxel_face_id[self.V_to_keep];
-            self.mesh = pymesh.form_mesh(self.view.vertices, np.zeros((0,3)), voxels_to_keep);
-            self.mesh.add_attribute("voxel_face_index");
-            new_voxel_face_id = self.mesh.get_voxel_attribute("voxel_face_index").astype(int);
-
-            old_vertex_colors = self.vertex_colors;
-            new_vertex_colors = np.zeros((self.mesh.num_faces, 3, 4));
-            cut_color = get_color(interior_color);
-            cut_color = np.array([cut_color.red, cut_color.green,
-                cut_color.blue, cut_color.alpha]);
-            is_interface = np.zeros(self.mesh.num_faces, dtype=bool);
-            for old_i,new_i in zip(voxel_face_id.ravel(), new_voxel_face_id.ravel()):
-                if new_i >= 0 and old_i >= 0:
-                    new_vertex_colors[new_i] = old_vertex_colors[old_i];
-                elif new_i >= 0:
-                    is_interface[new_i] = True;
-                    new_vertex_colors[new_i,:] = cut_color;
-
-            self.vertex_colors = new_vertex_colors;
-            self.interface = pymesh.form_mesh(self.mesh.vertices,
-                    self.mesh.faces[is_interface]);
-            self.boundary = pymesh.form_mesh(self.mesh.vertices,
-                    self.mesh.faces[np.logical_not(is_interface)]);
-            self.interface, __ = pymesh.remove_isolated_vertices(self.interface);
-            self.boundary, __ = pymesh.remove_isolated_vertices(self.boundary);
-            #self.vertex_colors = new_vertex_colors[is_interface];
-            tmp_dir = tempfile.gettempdir();
-            m = hashlib.md5();
-            m.update(self.mesh.vertices);
-            name = m.hexdigest();
-            bd_mesh_file = os.path.join(tmp_dir, "{}_bd.msh".format(name));
-            interface_mesh_file = os.path.join(tmp_dir, "{}_interface.msh".format(name));
-            pymesh.save_mesh(bd_mesh_file, self.boundary);
-            pymesh.save_mesh(interface_mesh_file, self.interface);
+            scratch_store = get_scratch_store();
+            cache_key = self.__get_cache_key(plane, cut_ratio, interior_color,
+                    exterior_color, sweep);
+            cache_file = scratch_store.lookup(cache_key, ".npz");
+            if cache_file is not None:
+                self.__load_clip_result(cache_file);
+            else:
+                if sweep is None:
+                    face_ids = self.__clip_voxels(normal, offset);
+                else:
+                    face_ids = self.__clip_voxels_incrementally(sweep, offset);
+
+                # Faces of the clipped mesh that were boundary faces before
+                # keep their colors, the others are on the cut and use
+                # interior_color.
+                is_interface = face_ids < 0;
+                new_vertex_colors = np.zeros((self.mesh.num_faces, 3, 4));
+                new_vertex_colors[~is_interface] = \
+                        self.vertex_colors[face_ids[~is_interface]];
+                new_vertex_colors[is_interface] = \
+                        get_color(interior_color).color;
+
+                self.vertex_colors = new_vertex_colors;
+                self.interface = pymesh.form_mesh(self.mesh.vertices,
+                        self.mesh.faces[is_interface]);
+                self.boundary = pymesh.form_mesh(self.mesh.vertices,
+                        self.mesh.faces[np.logical_not(is_interface)]);
+                self.interface, __ = pymesh.remove_isolated_vertices(self.interface);
+                self.boundary, __ = pymesh.remove_isolated_vertices(self.boundary);
+                scratch_store.store(cache_key, ".npz",
+                        self.__save_clip_result);
             self.subviews = [
-                    MeshView.create_from_setting({
+                    MeshView.create_from_mesh(self.boundary, {
                         "type": "mesh_only",
-                        "mesh": bd_mesh_file,
                         "color": exterior_color,
                         "wire_frame": nested_view.with_wire_frame,
                         "line_width": nested_view.line_width,
                         "line_color": nested_view.line_color,
                         "bbox": [self.bmin, self.bmax]
                         }),
-                    MeshView.create_from_setting({
+                    MeshView.create_from_mesh(self.interface, {
                         "type": "mesh_only",
-                        "mesh": interface_mesh_file,
                         "color": interior_color,
                         "wire_frame": nested_view.with_wire_frame,
                         "line_width": nested_view.line_width,
@@ -123,12 +133,94 @@ class ClippedView(ViewDecorator):
                     ];
         else:
             centroids = np.mean(self.view.vertices[self.view.faces], axis=1);
-            self.V_to_keep = [should_keep(v) for v in centroids];
+            self.V_to_keep = np.dot(centroids, normal) < offset;
             faces = self.view.faces[self.V_to_keep];
             self.mesh = pymesh.form_mesh(self.view.vertices, faces);
             self.vertex_colors = self.vertex_colors[self.V_to_keep];
 
-        self.mesh.add_attribute("face_normal");
+    def __clip_voxels(self, normal, offset):
+        mesh = pymesh.form_mesh(self.view.vertices, np.array([]),
+                self.view.voxels);
+        mesh.add_attribute("voxel_centroid");
+        mesh.add_attribute("voxel_face_index");
+        voxel_face_id = mesh.get_voxel_attribute("voxel_face_index").astype(int);
+        centroids = mesh.get_voxel_attribute("voxel_centroid");
+        self.V_to_keep = np.dot(centroids, normal) < offset;
+        voxels_to_keep = self.view.voxels[self.V_to_keep];
+        voxel_face_id = voxel_face_id[self.V_to_keep];
+        self.mesh = pymesh.form_mesh(self.view.vertices, np.zeros((0,3)), voxels_to_keep);
+        self.mesh.add_attribute("voxel_face_index");
+        new_voxel_face_id = self.mesh.get_voxel_attribute("voxel_face_index").astype(int);
+
+        old_ids = voxel_face_id.ravel();
+        new_ids = new_voxel_face_id.ravel();
+        on_surface = new_ids >= 0;
+        face_ids = np.full(self.mesh.num_faces, -1, dtype=int);
+        face_ids[new_ids[on_surface]] = old_ids[on_surface];
+        return face_ids;
+
+    def __clip_voxels_incrementally(self, sweep, offset):
+        voxels_to_keep, faces, face_ids = sweep.clip(offset);
+        self.V_to_keep = sweep.kept.copy();
+        self.mesh = pymesh.form_mesh(self.view.vertices, faces,
+                voxels_to_keep);
+        return face_ids;
+
+    def __get_cache_key(self, plane, cut_ratio, interior_color,
+            exterior_color, sweep):
+        if sweep is not None:
+            mesh_key = sweep.content_key;
+        else:
+            mesh_key = hash_content(self.view.vertices, self.view.voxels,
+                    self.view.faces);
+        if not isinstance(plane, list):
+            plane = str(plane);
+        else:
+            plane = [float(v) for v in plane];
+        return hash_content("clipped", mesh_key, self.vertex_colors, plane,
+                float(cut_ratio), interior_color, exterior_color);
+
+    def __save_clip_result(self, filename):
+        np.savez_compressed(filename,
+                kept = np.packbits(self.V_to_keep),
+                faces = self.mesh.faces,
+                vertex_colors = self.vertex_colors,
+                boundary_vertices = self.boundary.vertices,
+                boundary_faces = self.boundary.faces,
+                interface_vertices = self.interface.vertices,
+                interface_faces = self.interface.faces);
+
+    def __load_clip_result(self, filename):
+        with np.load(filename) as data:
+            num_voxels = len(self.view.voxels);
+            self.V_to_keep = np.unpackbits(data["kept"])[:num_voxels]\
+                    .astype(bool);
+            self.mesh = pymesh.form_mesh(self.view.vertices, data["faces"],
+                    self.view.voxels[self.V_to_keep]);
+            self.vertex_colors = data["vertex_colors"];
+            self.boundary = pymesh.form_mesh(data["boundary_vertices"],
+                    data["boundary_faces"]);
+            self.interface = pymesh.form_mesh(data["interface_vertices"],
+                    data["interface_faces"]);
+
+    @classmethod
+    def __get_half_space(cls, plane, center):
+        """ Return (n, d) such that points p with dot(p, n) < d are kept.
+        """
+        dim = len(center);
+        axes = {"X": 0, "Y": 1, "Z": 2};
+        if isinstance(plane, list) and len(plane) == 4:
+            n = np.array(plane[:3], dtype=float);
+            n = n / norm(n);
+            return n, plane[3] + np.dot(center, n);
+        elif len(plane) == 2 and plane[0] in "+-" and \
+                axes.get(plane[1], dim) < dim:
+            # "+X" keeps x > center[0], "-X" keeps x < center[0].
+            n = np.zeros(dim);
+            n[axes[plane[1]]] = -1.0 if plane[0] == "+" else 1.0;
+            return n, np.dot(center, n);
+        else:
+            raise NotImplementedError("Unknown plane type: {}".format(plane));
 
     @property
     def vertices(self):
@@ -142,10 +234,18 @@ class ClippedView(ViewDecorator):
     def voxels(self):
         return self.mesh.voxels;
 
+    @property
+    def face_normal_field(self):
+        normals = self.corner_fields.get("face_normal",
+                lambda: get_derived_attribute(self.mesh, "face_normal")\
+                        .reshape((self.mesh.num_faces, -1), order="C"));
+        return IndexedField.per_face(normals, self.mesh.faces);
+
     @property
     def face_normals(self):
-        normals = self.mesh.get_face_attribute("face_normal");
-        return np.repeat(normals, self.mesh.vertex_per_face, axis=0);
+        return self.corner_fields.get("face_normals",
+                lambda: self.face_normal_field.to_corners().reshape(
+                    (-1, self.mesh.dim)));
 
     @property
     def with_colors(self):
@@ -0,0 +1,59 @@
+import logging
+
+from pyrender.misc.indexed_field import IndexedField
+
+class CornerFieldCache(object):
+    """ Per-view cache of derived corner fields such as normals and colors.
+
+    Fields are arrays or IndexedFields.  They are computed on first access
+    and returned read-only afterwards,
+    callers that need to modify a field must copy it first.  Views call
+    invalidate() whenever an input of a field changes.
+    """
+    def __init__(self):
+        self.__fields = {};
+        self.hits = 0;
+        self.misses = 0;
+        self.invalidations = 0;
+
+    def get(self, name, compute):
+        """ Return field name, calling compute() to create it on a miss.
+        """
+        field = self.__fields.get(name);
+        if field is not None:
+            self.hits += 1;
+            return field;
+
+        self.misses += 1;
+        field = compute();
+        if isinstance(field, IndexedField):
+            # Values may share memory with an array owned by the view, only
+            # the view held by the field becomes read-only.
+            field.values = field.values.view();
+            field.values.flags.writeable = False;
+        else:
+            field.flags.writeable = False;
+        self.__fields[name] = field;
+        return field;
+
+    def invalidate(self, *names):
+        """ Drop the given fields, or all of them if no name is given.
+        """
+        if len(names) == 0:
+            names = list(self.__fields.keys());
+        for name in names:
+            if self.__fields.pop(name, None) is not None:
+                self.invalidations += 1;
+
+    @property
+    def stats(self):
+        return {
+                "hits": self.hits,
+                "misses": self.misses,
+                "invalidations": self.invalidations
+                };
+
+    def log_stats(self, view_name=""):
+        logger = logging.getLogger(__name__);
+        logger.info("Corner field cache {}: {} hits, {} misses, {} invalidations"\
+                .format(view_name, self.hits, self.misses, self.invalidations));
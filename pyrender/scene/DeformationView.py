@@ -43,12 +43,11 @@ class DeformationView(ViewDecorator):
                 norm(self.vector_field, axis=1));
 
     def compute_deformed_vertices(self):
-        vts = self.view.vertices;
         if self.deformation_magnitude is not None:
             factor = self.deformation_factor *\
                     self.deformation_magnitude /\
                     self.vector_field_max_magnitude;
         else:
             factor = self.deformation_factor;
-        vts += self.vector_field * factor;
-        self.vertices = vts;
+        # The nested vertices may be shared, write to a new array.
+        self.vertices = self.view.vertices + self.vector_field * factor;
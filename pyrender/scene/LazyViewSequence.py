@@ -0,0 +1,78 @@
+from collections import OrderedDict
+
+class LazyViewSequence(object):
+    """ Sequence of views created one at a time, such as the frames of
+    ClippedView.sweep().  create_views() returns an iterator over the
+    num_views views.  Only the last created view is kept alive, so views
+    should be visited in order, going back restarts the iterator.  Scene
+    holds the views as LazyView proxies.
+    """
+    def __init__(self, create_views, num_views):
+        self.__create_views = create_views;
+        self.__num_views = num_views;
+        self.__views = None;
+        self.__index = -1;
+        self.__view = None;
+
+    def __len__(self):
+        return self.__num_views;
+
+    @property
+    def proxies(self):
+        return [LazyView(self, i) for i in range(self.__num_views)];
+
+    def is_created(self, index):
+        return index == self.__index;
+
+    def get(self, index):
+        """ Return view index and whether it has just been created.
+        """
+        if index == self.__index:
+            return self.__view, False;
+        if index < 0 or index >= self.__num_views:
+            raise IndexError("View index {} out of range".format(index));
+        if self.__views is None or index < self.__index:
+            self.__views = iter(self.__create_views());
+            self.__index = -1;
+        # Release the previous view before creating the next one.
+        self.__view = None;
+        while self.__index < index:
+            self.__view = next(self.__views);
+            self.__index += 1;
+        return self.__view, True;
+
+class LazyView(object):
+    """ Stand-in for one view of a LazyViewSequence.  Attribute access is
+    forwarded to the view, which is created on demand.  Attributes assigned
+    through the proxy and the last adapt_to_camera() call are replayed
+    whenever the view is created.
+    """
+    def __init__(self, sequence, index):
+        # Bypass __setattr__, which records view settings.
+        self.__dict__.update({
+            "_LazyView__sequence": sequence,
+            "_LazyView__index": index,
+            "_LazyView__settings": OrderedDict(),
+            "_LazyView__camera": None });
+
+    def __getattr__(self, name):
+        return getattr(self.get_view(), name);
+
+    def __setattr__(self, name, value):
+        self.__settings[name] = value;
+        if self.__sequence.is_created(self.__index):
+            setattr(self.get_view(), name, value);
+
+    def adapt_to_camera(self, camera, global_transform=None):
+        self.__dict__["_LazyView__camera"] = (camera, global_transform);
+        if self.__sequence.is_created(self.__index):
+            self.get_view().adapt_to_camera(camera, global_transform);
+
+    def get_view(self):
+        view, created = self.__sequence.get(self.__index);
+        if created:
+            for name, value in self.__settings.items():
+                setattr(view, name, value);
+            if self.__camera is not None:
+                view.adapt_to_camera(*self.__camera);
+        return view;
@@ -2,10 +2,15 @@ import numpy as np
 from numpy.linalg import norm
 import math
 from pyrender.color.Color import get_color, Color
-from pyrender.color.ColorMap import ColorMap
-from pyrender.primitives.Primitive import Cylinder, Cone, Sphere
+from pyrender.color.ColorField import ColorField
+from pyrender.color.ColorMap import get_color_map
+from pyrender.misc.indexed_field import IndexedField
+from pyrender.misc.mesh_attributes import get_derived_attribute
+from pyrender.misc.mesh_cache import load_mesh, get_mesh_cache
+from pyrender.primitives.PrimitiveBatch import PrimitiveBatch
 import pymesh
 import random
+from .CornerFieldCache import CornerFieldCache
 from .View import View
 
 class MeshView(View):
@@ -23,8 +28,14 @@ class MeshView(View):
             "bbox": [[min_x, min_y, min_z], [max_x, max_y, max_z]]
         }
         """
-        mesh_file = setting["mesh"];
-        instance = MeshView(mesh_file);
+        return cls.create_from_mesh(load_mesh(setting["mesh"]), setting);
+
+    @classmethod
+    def create_from_mesh(cls, mesh, setting):
+        """ Same as create_from_setting() except the mesh is given directly
+        and setting["mesh"] is not needed.
+        """
+        instance = MeshView(mesh);
         instance.color_name = setting.get("color", None);
         instance.line_width = setting.get("line_width", instance.line_width);
         instance.line_color = setting.get("line_color", "black");
@@ -36,16 +47,23 @@ class MeshView(View):
         instance.with_wire_frame = setting.get("wire_frame", False);
         return instance;
 
-    def __init__(self, mesh_file):
+    def __init__(self, mesh):
+        """ mesh is either a mesh file name or a pymesh.Mesh object.  Mesh
+        files are loaded through the process-wide mesh cache.
+        """
+        # Created first since View.__init__ sets alpha.
+        self.corner_fields = CornerFieldCache();
         super(MeshView, self).__init__();
-        self.mesh = pymesh.load_mesh(mesh_file);
+        self.color_name = None;
+        if not isinstance(mesh, pymesh.Mesh):
+            mesh = load_mesh(mesh);
+        self.mesh = mesh;
+        self.__edge_mesh = None;
+        self.__edges = None;
         self.__init_mesh();
 
     def __init_mesh(self):
-        if not self.mesh.has_attribute("vertex_normal"):
-            self.mesh.add_attribute("vertex_normal");
-        if not self.mesh.has_attribute("face_normal"):
-            self.mesh.add_attribute("face_normal");
+        # Normals are computed on first use, see vertex_normal_field.
         if self.mesh.num_vertices > 0:
             bmin, bmax = self.mesh.bbox;
             self.bmin = bmin;
@@ -62,49 +80,103 @@ class MeshView(View):
         if self.mesh.num_faces <= 0:
             return;
 
-        self.primitives = [];
+        self.primitives = PrimitiveBatch();
         d = norm(self.bmax - self.bmin) / math.sqrt(self.mesh.dim);
         radius = d * self.line_width;
         assert(radius > 0);
-        vertices, edges = pymesh.mesh_to_graph(self.mesh);
-        lengths = norm(vertices[edges[:,0],:] - vertices[edges[:,1],:], axis=1);
         color = get_color(self.line_color);
-        for v in vertices:
-            ball = Sphere(v, radius);
-            ball.color = color;
-            self.primitives.append(ball);
+        self.primitives.add_wires(self.mesh.vertices, self.__get_edges(),
+                radius, color, min_length=0.5 * radius);
 
-        for e,l in zip(edges, lengths):
-            if l <= 0.5 * radius : continue;
-            cylinder = Cylinder(vertices[e[0]], vertices[e[1]], radius);
-            cylinder.color = color;
-            self.primitives.append(cylinder);
+    def __get_edges(self):
+        """ Unique edges of the mesh.  The edge graph only depends on the
+        topology, so it is computed once per mesh and reused when the wire
+        frame is regenerated.
+        """
+        if self.__edge_mesh is not self.mesh:
+            self.__edges = pymesh.mesh_to_graph(self.mesh)[1];
+            self.__edge_mesh = self.mesh;
+        return self.__edges;
+
+    def writable_mesh(self):
+        """ Return a mesh owned by this view.  A mesh shared through the mesh
+        cache is copied, with its attributes, and replaces self.mesh.
+        """
+        mesh = self.mesh;
+        if not get_mesh_cache().is_shared(mesh):
+            return mesh;
+        if mesh.num_voxels > 0:
+            copy = pymesh.form_mesh(mesh.vertices.copy(), mesh.faces.copy(),
+                    mesh.voxels.copy());
+        else:
+            copy = pymesh.form_mesh(mesh.vertices.copy(), mesh.faces.copy());
+        for name in mesh.attribute_names:
+            if not copy.has_attribute(name):
+                copy.add_attribute(name);
+            copy.set_attribute(name, mesh.get_attribute(name).copy());
+        self.mesh = copy;
+        return copy;
 
     @property
     def vertices(self):
-        return self.mesh.vertices;
+        """ Read-only, the mesh may be shared with other views.  Use
+        writable_mesh() to modify it.
+        """
+        return self.__read_only(self.mesh.vertices);
 
     @property
     def faces(self):
-        return self.mesh.faces;
+        return self.__read_only(self.mesh.faces);
 
     @property
     def voxels(self):
-        return self.mesh.voxels;
+        return self.__read_only(self.mesh.voxels);
+
+    def __read_only(self, array):
+        array = array.view();
+        array.flags.writeable = False;
+        return array;
+
+    @property
+    def mesh(self):
+        return self.__mesh;
+
+    @mesh.setter
+    def mesh(self, val):
+        self.__mesh = val;
+        self.corner_fields.invalidate();
+
+    @property
+    def vertex_normal_field(self):
+        normals = self.corner_fields.get("vertex_normal",
+                lambda: get_derived_attribute(self.mesh, "vertex_normal")\
+                        .reshape((self.mesh.num_vertices, -1), order="C"));
+        return IndexedField.per_vertex(normals, self.mesh.faces);
+
+    @property
+    def face_normal_field(self):
+        normals = self.corner_fields.get("face_normal",
+                lambda: get_derived_attribute(self.mesh, "face_normal")\
+                        .reshape((self.mesh.num_faces, -1), order="C"));
+        return IndexedField.per_face(normals, self.mesh.faces);
 
     @property
     def vertex_normals(self):
         """ Return corner field.  One vector per face corner.
         """
-        normals = self.mesh.get_vertex_attribute("vertex_normal");
-        return normals[self.mesh.faces.ravel(order="C")];
+        return self.corner_fields.get("vertex_normals",
+                lambda: self.__expand(self.vertex_normal_field));
 
     @property
     def face_normals(self):
         """ Return corner field.  One vector per face corner.
         """
-        normals = self.mesh.get_face_attribute("face_normal");
-        return np.repeat(normals, self.mesh.vertex_per_face, axis=0);
+        return self.corner_fields.get("face_normals",
+                lambda: self.__expand(self.face_normal_field));
+
+    def __expand(self, field):
+        corners = field.to_corners();
+        return corners.reshape((-1, corners.shape[-1]), order="C");
 
     @property
     def use_smooth_normal(self):
@@ -114,18 +186,44 @@ class MeshView(View):
     def vertex_colors(self):
         """ Return corner field.  One vector per face corner.
         """
+        return self.corner_fields.get("vertex_colors",
+                lambda: self.color_field.to_corners());
+
+    @property
+    def color_field(self):
+        return ColorField.uniform(self.corner_fields.get("uniform_color",
+            self.__compute_uniform_color), self.mesh.faces);
+
+    def __compute_uniform_color(self):
         if self.color_name == "random":
-            c = ColorMap("RdYlBu").get_color(
+            c = get_color_map("RdYlBu").get_color(
                     random.choice([0.1, 0.3, 0.5, 0.7, 0.9]));
         elif self.color_name is not None:
             c = get_color(self.color_name);
         else:
             c = get_color("nylon_white");
 
-        c.color[-1] = self.alpha;
-        colors = np.array([[c.color] * self.mesh.vertex_per_face] *
-                self.mesh.num_faces);
-        return colors;
+        color = np.array(c.color, dtype=float);
+        color[-1] = self.alpha;
+        return color;
+
+    @property
+    def color_name(self):
+        return self.__color_name;
+
+    @color_name.setter
+    def color_name(self, val):
+        self.__color_name = val;
+        self.corner_fields.invalidate("uniform_color", "vertex_colors");
+
+    @property
+    def alpha(self):
+        return self.__alpha;
+
+    @alpha.setter
+    def alpha(self, val):
+        self.__alpha = val;
+        self.corner_fields.invalidate("uniform_color", "vertex_colors");
 
     @property
     def with_colors(self):
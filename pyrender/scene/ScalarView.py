@@ -3,10 +3,18 @@ from numpy.linalg import norm
 import random
 from .View import View
 from .ViewDecorator import ViewDecorator
-from pyrender.color.ColorMap import ColorMap
+from pyrender.color.ColorField import ColorField
+from pyrender.color.ColorMap import get_color_map
+from pyrender.misc.indexed_field import IndexedField
+from pyrender.misc.mesh_attributes import get_derived_attribute
 import pymesh
 
 class ScalarView(ViewDecorator):
+    # Entries of the color map table used for scalar fields.  Sampling the
+    # map this finely is visually indistinguishable from exact interpolation
+    # and much faster on large fields.
+    COLOR_MAP_RESOLUTION = 4096;
+
     @classmethod
     def create_from_setting(cls, setting):
         """ syntax:
@@ -37,30 +45,53 @@ class ScalarView(ViewDecorator):
     def __init__(self, nested_view, scalar_field_name):
         super(ScalarView, self).__init__(nested_view);
         self.scalar_field_name = scalar_field_name;
+        self.__discrete_keys = None;
+        self.__color_field = None;
 
     def update_vertex_color(self):
         if len(self.mesh.vertices) == 0:
             return;
         self.__load_scalar_field();
+        self.refresh_colors();
+
+    def refresh_colors(self):
+        """ Recompute vertex colors from the loaded scalar field.
+
+        Call this after changing bounds, color_map, discrete or alpha.  The
+        scalar field is neither reloaded nor renormalized.
+        """
+        self.__apply_bounds();
+        shape = self.scalar_field.shape + (4,);
+        colors = None;
+        if self.__color_field is not None:
+            colors = self.__color_field.values;
+        if colors is None or colors.shape != shape or \
+                not colors.flags.writeable:
+            colors = np.empty(shape);
 
-        self.vertex_colors = [];
         if self.discrete:
-            unique_values = np.unique(self.scalar_field);
-            keys = np.linspace(0, 1, len(unique_values));
-            random.shuffle(keys);
-            value_to_color = {
-                    v:self.color_map.get_color(k).color
-                    for v,k in zip(unique_values, keys)};
-            for face_values in self.scalar_field:
-                colors = [value_to_color[v] for v in face_values];
-                self.vertex_colors.append(colors);
+            unique_values, value_index = np.unique(self.scalar_field.ravel(),
+                    return_inverse=True);
+            keys = self.__get_discrete_keys(len(unique_values));
+            palette = self.color_map.get_colors(keys);
+            colors.reshape((-1, 4))[:] = palette[value_index.ravel()];
         else:
-            for face_values in self.scalar_field:
-                colors = [self.color_map.get_color(v).color
-                        for v in face_values];
-                self.vertex_colors.append(colors);
-        self.vertex_colors = np.array(self.vertex_colors);
-        self.vertex_colors[:,:,-1] = self.alpha;
+            self.color_map.get_colors(self.scalar_field, out=colors);
+        colors[..., -1] = self.alpha;
+        self.__color_field = ColorField(self.__field.domain, colors,
+                self.mesh.faces);
+        self.corner_fields.invalidate("vertex_colors");
+
+    def __get_discrete_keys(self, num_values):
+        """ Shuffled color map keys for discrete fields.  The shuffle is kept
+        so that refreshing colors does not change the palette.
+        """
+        keys = self.__discrete_keys;
+        if keys is None or len(keys) != num_values:
+            keys = np.linspace(0, 1, num_values);
+            random.shuffle(keys);
+            self.__discrete_keys = keys;
+        return keys;
 
     def __load_scalar_field(self):
         if not self.mesh.has_attribute(self.scalar_field_name):
@@ -70,39 +101,48 @@ class ScalarView(ViewDecorator):
 
         if self.normalize:
             field = self.__normalize_scalar_field(field);
-        field = self.__convert_to_corner_field(field);
-
-        min_val = np.amin(field) if self.bounds[0] is None else self.bounds[0];
-        max_val = np.amax(field) if self.bounds[1] is None else self.bounds[1];
+        self.__field = self.__convert_to_native_field(field);
+
+    def __apply_bounds(self):
+        field = self.__field.values;
+        min_val, max_val = self.bounds;
+        if min_val is None or max_val is None:
+            # Interior and isolated vertices do not show up in the image.
+            values = field;
+            if self.__field.domain == IndexedField.VERTEX and \
+                    self.mesh.num_faces > 0:
+                values = field[self.corner_fields.get("referenced_vertices",
+                    lambda: np.unique(self.mesh.faces))];
+            if min_val is None: min_val = np.amin(values);
+            if max_val is None: max_val = np.amax(values);
 
         if max_val > min_val:
             field = (field - min_val) / (max_val - min_val);
             np.clip(field, 0.0, 1.0, field);
         else:
             field = np.zeros_like(field);
+        self.scalar_field = field;
 
-        self.scalar_field = field.reshape((-1, self.mesh.vertex_per_face));
-        assert(self.scalar_field.shape[0] == self.mesh.num_faces);
-
-    def __convert_to_corner_field(self, field):
+    def __convert_to_native_field(self, field):
+        """ Keep vertex and face fields as they are, voxel fields are mapped
+        to the boundary faces.
+        """
         field_size = len(field);
         num_vertices = self.mesh.num_vertices;
         num_faces = self.mesh.num_faces;
         num_voxels = self.mesh.num_voxels;
 
         if field_size == num_vertices:
-            vertex_indices = self.mesh.faces;
-            field = field[vertex_indices];
+            return IndexedField.per_vertex(field, self.mesh.faces);
         elif field_size == num_faces:
-            field = np.repeat(field, self.mesh.vertex_per_face);
+            return IndexedField.per_face(field, self.mesh.faces);
         elif field_size == num_voxels:
             field = pymesh.convert_to_face_attribute_from_name(self.mesh,
                     self.scalar_field_name);
-            field = np.repeat(field, self.mesh.vertex_per_face);
+            return IndexedField.per_face(field.ravel(), self.mesh.faces);
         else:
             raise RuntimeError("Attribute {} is not a valid scalar field"\
                     .format(self.scalar_field_name));
-        return field;
 
     def __normalize_scalar_field(self, field):
         field_size = len(field);
@@ -123,23 +163,20 @@ class ScalarView(ViewDecorator):
         else:
             element_volume_field_name = "vertex_area";
 
-        if not self.mesh.has_attribute(element_volume_field_name):
-            self.mesh.add_attribute(element_volume_field_name);
-        weights = self.mesh.get_attribute(element_volume_field_name).ravel();
+        weights = get_derived_attribute(self.mesh,
+                element_volume_field_name).ravel();
         return self.__normalize_field_with_weight(field, weights);
 
     def __normalize_face_field(self, field):
         face_area_field_name = "face_area";
-        if not self.mesh.has_attribute(face_area_field_name):
-            self.mesh.add_attribute(face_area_field_name);
-        weights = self.mesh.get_attribute(face_area_field_name).ravel();
+        weights = get_derived_attribute(self.mesh,
+                face_area_field_name).ravel();
         return self.__normalize_field_with_weight(field, weights);
 
     def __normalize_voxel_field(self, field):
         voxel_volume_field_name = "voxel_volume";
-        if not self.mesh.has_attribute(voxel_volume_field_name):
-            self.mesh.add_attribute(voxel_volume_field_name);
-        weights = self.mesh.get_attribute(voxel_volume_field_name).ravel();
+        weights = get_derived_attribute(self.mesh,
+                voxel_volume_field_name).ravel();
         return self.__normalize_field_with_weight(field, weights);
 
     def __normalize_field_with_weight(self, field, weights):
@@ -159,7 +196,30 @@ class ScalarView(ViewDecorator):
 
     @color_map.setter
     def color_map(self, val):
-        self.__color_map = ColorMap(val);
+        self.__color_map = get_color_map(val, self.COLOR_MAP_RESOLUTION);
+
+    @property
+    def color_field(self):
+        if self.__color_field is None:
+            return super(ScalarView, self).color_field;
+        else:
+            return self.__color_field;
+
+    @property
+    def vertex_colors(self):
+        """ Return corner field.  Colors are kept on the domain of the scalar
+        field and only expanded here, renderers should use color_field.
+        """
+        if self.__color_field is None:
+            return super(ScalarView, self).vertex_colors;
+        else:
+            return self.corner_fields.get("vertex_colors",
+                    self.__color_field.to_corners);
+
+    @vertex_colors.setter
+    def vertex_colors(self, value):
+        self.__color_field = ColorField.per_corner(value, self.faces);
+        self.corner_fields.invalidate("vertex_colors");
 
     @property
     def with_colors(self):
@@ -7,6 +7,7 @@ import os.path
 import sys
 
 from .Camera import Camera
+from .LazyViewSequence import LazyViewSequence
 from .Light import Light
 from .View import View
 
@@ -94,6 +95,7 @@ class Scene(object):
         if len(self.cameras) == 0:
             raise RuntimeError("At least one camera is required.");
         self.__active_camera_idx = camera_idx;
+        self.adapt_views_to_camera();
 
     def activate_view(self, view_idx=0):
         if len(self.views) == 0:
@@ -141,10 +143,22 @@ class Scene(object):
         for view in views:
             if isinstance(view, list):
                 self.views += view;
+            elif isinstance(view, LazyViewSequence):
+                self.views += view.proxies;
             else:
                 self.views.append(view);
         self.activate_view();
         self.__compute_global_transform();
+        self.adapt_views_to_camera();
+
+    def adapt_views_to_camera(self):
+        """ Let views regenerate resolution dependent primitives.  Call this
+        after changing the output size of views outside of the scene setting.
+        """
+        if not hasattr(self, "views"):
+            return;
+        for view in self.views:
+            view.adapt_to_camera(self.active_camera, self.global_transform);
 
     def __remove_relative_lights_path(self, setting):
         if not hasattr(self, "scene_file"):
@@ -2,9 +2,9 @@ import numpy as np
 
 from .View import View
 from .ViewDecorator import ViewDecorator
-from pyrender.primitives.Primitive import Sphere
-from pyrender.color.ColorMap import ColorMap
-#from pyrender.misc.cluster import cluster
+from pyrender.misc.mesh_attributes import get_derived_attribute
+from pyrender.color.ColorMap import get_color_map
+from pyrender.misc.cluster import Cluster
 
 class SphereView(ViewDecorator):
     @classmethod
@@ -16,6 +16,8 @@ class SphereView(ViewDecorator):
             "color_map": color_map,
             "radius_range": [min_radius, max_radius],
             "bounds": [min_val, max_val], # use None if not needed
+            "cluster_radius": scalar or "auto", # merge nearby spheres
+            "glyph_pixels": scalar, # cluster diameter in pixels for "auto"
             "view": {
                 ...
             }
@@ -26,23 +28,44 @@ class SphereView(ViewDecorator):
         instance.color_map = setting.get("color_map", "jet");
         instance.radius_range = setting["radius_range"];
         instance.bounds = setting.get("bounds", [None, None]);
-        instance.generate_primitives();
+        instance.glyph_pixels = setting.get("glyph_pixels",
+                instance.glyph_pixels);
+        cluster_radius = setting.get("cluster_radius", None);
+        if cluster_radius == "auto":
+            # Primitives are generated by adapt_to_camera().
+            instance.auto_cluster_radius = True;
+        else:
+            instance.cluster_radius = cluster_radius;
+            instance.generate_primitives();
         return instance;
 
     def __init__(self, nested_view, scalar_field_name):
         super(SphereView, self).__init__(nested_view);
         self.scalar_field_name = scalar_field_name;
+        self.auto_cluster_radius = False;
+        self.cluster_radius = None;
+        self.glyph_pixels = 10.0;
         self.__load_scalar_field();
         self.__load_base_points();
 
+    def adapt_primitive_size(self, camera, global_transform=None):
+        """ With an "auto" cluster radius, clusters span glyph_pixels pixels,
+        so the number of spheres is bounded by the output resolution.
+        """
+        if not self.auto_cluster_radius: return False;
+        cluster_radius = 0.5 * self.glyph_pixels * \
+                self.get_pixel_size(camera, global_transform);
+        if cluster_radius == self.cluster_radius: return False;
+        self.cluster_radius = cluster_radius;
+        return True;
+
     def generate_primitives(self):
         assert(len(self.scalar_field) == len(self.base_points));
         assert(self.radius_range[1] > self.radius_range[0]);
-
-        #self.__cluster_points();
+        self.reset_primitives();
 
         # hide actual mesh
-        color = self.vertex_colors;
+        color = np.array(self.vertex_colors);
         if len(color) > 0:
             color[:,:,-1] = 0.0;
         self.vertex_colors = color;
@@ -51,16 +74,18 @@ class SphereView(ViewDecorator):
         max_val = np.amax(self.scalar_field) if self.bounds[1] is None else self.bounds[1];
         radius_gap = self.radius_range[1] - self.radius_range[0];
         value_gap = max_val - min_val;
-        for value, base in zip(self.scalar_field, self.base_points):
-            if value_gap > 0:
-                ratio = (value - min_val) / value_gap;
-            else:
-                ratio = 0.0;
-            radius = self.radius_range[0] + ratio * radius_gap;
-            if radius > 1e-6:
-                ball = Sphere(base, radius);
-                ball.color = self.color_map.get_color(ratio).color;
-                self.primitives.append(ball);
+        if value_gap > 0:
+            ratios = (self.scalar_field - min_val) / value_gap;
+        else:
+            ratios = np.zeros(len(self.scalar_field));
+        base_points = self.base_points;
+        if self.cluster_radius is not None:
+            base_points, ratios = self.__cluster_points(ratios);
+        radii = self.radius_range[0] + ratios * radius_gap;
+        colors = self.color_map.get_colors(ratios);
+        visible = radii > 1e-6;
+        self.primitives.add_spheres(base_points[visible], radii[visible],
+                colors[visible]);
 
     def __load_scalar_field(self):
         if not self.mesh.has_attribute(self.scalar_field_name):
@@ -73,27 +98,27 @@ class SphereView(ViewDecorator):
         if num_entries == self.mesh.num_vertices:
             self.base_points = self.mesh.vertices;
         elif num_entries == self.mesh.num_faces:
-            if not self.mesh.has_attribute("face_centroid"):
-                self.mesh.add_attribute("face_centroid");
-            self.base_points = self.mesh.get_attribute("face_centroid")\
-                    .reshape((-1, 3), order="C");
+            self.base_points = get_derived_attribute(self.mesh,
+                    "face_centroid").reshape((-1, 3), order="C");
         elif num_entries == self.mesh.num_voxels:
-            if not self.mesh.has_attribute("voxel_centroid"):
-                self.mesh.add_attribute("voxel_centroid");
-            self.base_points = self.mesh.get_attribute("voxel_centroid")\
-                    .reshape((-1, 3), order="C");
+            self.base_points = get_derived_attribute(self.mesh,
+                    "voxel_centroid").reshape((-1, 3), order="C");
 
-    def __cluster_points(self):
-        cluster_radius = self.radius_range[1] * 2;
-        clusters = cluster(self.scalar_field, self.base_points,
-                cluster_radius);
-
-        self.base_points = np.array([
-            np.mean(self.base_points[indices], axis=0)
-            for indices in clusters]);
-        self.scalar_field = np.array([
-            np.mean(self.scalar_field[indices], axis=0)
-            for indices in clusters]);
+    def __cluster_points(self, ratios):
+        """ Merge base points within cluster_radius of each other.  Returns
+        the cluster centers and the mean ratio of each cluster.
+        """
+        cluster = Cluster(self.base_points);
+        cluster.run(self.cluster_radius);
+        labels = cluster.labels;
+        assigned = labels >= 0;
+        num_clusters = len(cluster.seed_points);
+        counts = np.bincount(labels[assigned], minlength=num_clusters);
+        sums = np.bincount(labels[assigned], weights=ratios[assigned],
+                minlength=num_clusters);
+        non_empty = counts > 0;
+        return cluster.seed_points[non_empty],\
+                sums[non_empty] / counts[non_empty];
 
     @property
     def color_map(self):
@@ -101,5 +126,5 @@ class SphereView(ViewDecorator):
 
     @color_map.setter
     def color_map(self, val):
-        self.__color_map = ColorMap(val);
+        self.__color_map = get_color_map(val);
 
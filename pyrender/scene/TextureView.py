@@ -1,10 +1,9 @@
 import numpy as np
-import numpy.linalg
 import pymesh
+import random
 
 from pyrender.color.Color import get_color, Color
-from pyrender.color.ColorMap import ColorMap
-from pyrender.primitives.Primitive import Cylinder, Cone, Sphere
+from pyrender.color.ColorMap import get_color_map
 
 from .View import View
 from .ViewDecorator import ViewDecorator
@@ -45,7 +44,7 @@ class TextureView(ViewDecorator):
         if self.boundary_color is None:
             color = get_color("black");
         elif self.boundary_color == "random":
-            color = ColorMap("RdYlBu").get_color(
+            color = get_color_map("RdYlBu").get_color(
                     random.choice([0.1, 0.3, 0.5, 0.7, 0.9]));
         else:
             color = get_color(self.boundary_color);
@@ -53,23 +52,12 @@ class TextureView(ViewDecorator):
         radius = self.boundary_radius / self.scale;
         cutted_mesh = pymesh.cut_mesh(self.mesh);
         bd_edges = cutted_mesh.boundary_edges;
-        vertices = cutted_mesh.vertices;
-        for e in bd_edges:
-            v0 = vertices[e[0]];
-            v1 = vertices[e[1]];
-            assert(np.all(np.isfinite(v0)));
-            assert(np.all(np.isfinite(v1)));
-            if numpy.linalg.norm(v0 - v1) <= radius:
-                continue;
-            cylinder = Cylinder(v0, v1, radius);
-            cylinder.color = color;
-            self.primitives.append(cylinder);
-
-        bd_vertices = np.unique(bd_edges.ravel());
-        for v in bd_vertices:
-            ball = Sphere(vertices[v,:], radius);
-            ball.color = color;
-            self.primitives.append(ball);
+        bd_vertices, bd_edges = np.unique(bd_edges.ravel(),
+                return_inverse=True);
+        vertices = cutted_mesh.vertices[bd_vertices];
+        assert(np.all(np.isfinite(vertices)));
+        self.primitives.add_wires(vertices, bd_edges.reshape((-1, 2)),
+                radius, color, min_length=radius);
 
     @property
     def with_texture_coordinates(self):
@@ -6,8 +6,6 @@ from .VectorView import VectorView
 from pyrender.color.ColorMap import ColorMap
 from pyrender.misc.cluster import Cluster
 
-import PyMesh
-
 class VectorClusterView(VectorView):
     @classmethod
     def create_from_setting(cls, setting):
@@ -18,7 +16,9 @@ class VectorClusterView(VectorView):
             "color_map": color_map,
             "radius": scalar,
             "stem_radius": scalar,
-            "cluster_radius": scalar,
+            "cluster_radius": scalar or "auto",
+            "glyph_pixels": scalar, # cluster diameter in pixels for "auto"
+            "cluster_processes": int, # processes used for clustering
             "magnitude_filter": percentage,
             "max_length": max_length,
             "head_based": bool,
@@ -32,18 +32,40 @@ class VectorClusterView(VectorView):
         instance.max_length = setting["max_length"];
         instance.radius = setting.get("radius", instance.max_length * 0.2);
         instance.stem_radius = setting.get("stem_radius", instance.radius * 0.5);
-        instance.cluster_radius = setting.get("cluster_radius", 
-                instance.radius * 1.5);
+        cluster_radius = setting.get("cluster_radius", instance.radius * 1.5);
+        instance.glyph_pixels = setting.get("glyph_pixels",
+                instance.glyph_pixels);
+        instance.cluster_processes = setting.get("cluster_processes", 1);
         instance.magnitude_filter = setting.get("magnitude_filter", 0.0);
         instance.color_map = setting.get("color_map", "jet");
         instance.head_based = setting.get("head_based", False);
-        instance.generate_primitives();
+        if cluster_radius == "auto":
+            # Primitives are generated by adapt_to_camera().
+            instance.auto_cluster_radius = True;
+        else:
+            instance.cluster_radius = cluster_radius;
+            instance.generate_primitives();
         return instance;
 
     def __init__(self, nested_view, vector_field_name):
         super(VectorClusterView, self).__init__(nested_view, vector_field_name);
+        self.auto_cluster_radius = False;
+        self.cluster_radius = None;
+        self.glyph_pixels = 10.0;
+
+    def adapt_primitive_size(self, camera, global_transform=None):
+        """ With an "auto" cluster radius, clusters span glyph_pixels pixels,
+        so the number of arrows is bounded by the output resolution.
+        """
+        if not self.auto_cluster_radius: return False;
+        cluster_radius = 0.5 * self.glyph_pixels * \
+                self.get_pixel_size(camera, global_transform);
+        if cluster_radius == self.cluster_radius: return False;
+        self.cluster_radius = cluster_radius;
+        return True;
 
     def generate_primitives(self):
+        self.reset_primitives();
         self.load_vector_field();
         self.load_base_points();
         self.load_base_point_normals();
@@ -64,7 +86,8 @@ class VectorClusterView(VectorView):
         cluster.use_normals(self.base_point_normals);
         cluster.normal_angle_threshold = pi / 3.0;
         cluster.use_vectors(self.vector_field);
+        cluster.num_processes = self.cluster_processes;
         cluster.run(self.cluster_radius);
 
-        self.base_points = np.array([seed[0] for seed in cluster.seeds]);
-        self.vector_field = np.array([seed[2] for seed in cluster.seeds]);
+        self.base_points = cluster.seed_points;
+        self.vector_field = cluster.seed_vectors;
@@ -2,8 +2,8 @@ import numpy as np
 from numpy.linalg import norm
 from .View import View
 from .ViewDecorator import ViewDecorator
-from pyrender.primitives.Primitive import Cylinder, Cone
-from pyrender.color.ColorMap import ColorMap
+from pyrender.misc.mesh_attributes import get_derived_attribute
+from pyrender.color.ColorMap import get_color_map
 
 class VectorView(ViewDecorator):
     @classmethod
@@ -37,46 +37,46 @@ class VectorView(ViewDecorator):
         self.vector_field_name = vector_field_name;
 
     def generate_primitives(self):
+        self.reset_primitives();
         self.load_vector_field();
         self.load_base_points();
         self.create_arrows();
 
     def create_arrows(self):
+        """ Add one arrow per vector.  Arrows shorter than the head radius
+        are drawn as a single cone, the others as a stem and a head.
+        """
         magnitudes = norm(self.vector_field, axis=1);
         scale = self.max_length / np.amax(magnitudes);
-        scaled_vectors = self.vector_field * scale;
         magnitudes *= scale;
 
-        for v,p,l in zip(scaled_vectors, self.base_points, magnitudes):
-            if l < 1e-6: continue;
-            arrow_scale = l / self.max_length;
-
-            c = self.color_map.get_color(l/self.max_length).color;
-            v = v / l;
-            if l < self.radius:
-                if self.head_based:
-                    arrow_head = Cone(p-v * l, p, l * arrow_scale);
-                else:
-                    arrow_head = Cone(p, p+v * l, l * arrow_scale);
-                arrow_head.color = c;
-                self.primitives.append(arrow_head);
-            else:
-                if self.head_based:
-                    p2 = p - v * self.radius;
-                    arrow_body = Cylinder(p2, p-v*l,
-                            self.stem_radius * arrow_scale);
-                    arrow_head = Cone(p2, p,
-                            self.radius * arrow_scale);
-                else:
-                    p2 = p + v*(l - self.radius);
-                    arrow_body = Cylinder(p, p2,
-                            self.stem_radius * arrow_scale);
-                    arrow_head = Cone(p2, p+v*l,
-                            self.radius * arrow_scale);
-                arrow_body.color = c;
-                arrow_head.color = c;
-                self.primitives.append(arrow_body);
-                self.primitives.append(arrow_head);
+        visible = magnitudes >= 1e-6;
+        lengths = magnitudes[visible];
+        directions = self.vector_field[visible] * (scale / lengths)[:, None];
+        base_points = self.base_points[visible];
+        arrow_scales = lengths / self.max_length;
+        colors = self.color_map.get_colors(arrow_scales);
+
+        if self.head_based:
+            tips = base_points;
+            tails = base_points - directions * lengths[:, None];
+        else:
+            tails = base_points;
+            tips = base_points + directions * lengths[:, None];
+
+        short = lengths < self.radius;
+        head_bases = np.where(short[:, None], tails,
+                tips - directions * self.radius);
+        head_radii = np.where(short, lengths, self.radius) * arrow_scales;
+
+        stem = ~short;
+        if self.head_based:
+            stem_p0, stem_p1 = head_bases[stem], tails[stem];
+        else:
+            stem_p0, stem_p1 = tails[stem], head_bases[stem];
+        self.primitives.add_cylinders(stem_p0, stem_p1,
+                self.stem_radius * arrow_scales[stem], colors[stem]);
+        self.primitives.add_cones(head_bases, tips, head_radii, colors);
 
     def load_vector_field(self):
         if not self.mesh.has_attribute(self.vector_field_name):
@@ -94,29 +94,21 @@ class VectorView(ViewDecorator):
         if len(self.vector_field) == self.mesh.num_vertices:
             self.base_points = self.mesh.vertices;
         elif len(self.vector_field) == self.mesh.num_faces:
-            if not self.mesh.has_attribute("face_centroid"):
-                self.mesh.add_attribute("face_centroid");
-            self.base_points = self.mesh.get_attribute("face_centroid")\
-                    .reshape((-1, 3));
+            self.base_points = get_derived_attribute(self.mesh,
+                    "face_centroid").reshape((-1, 3));
         elif len(self.vector_field) == self.mesh.num_voxels:
-            if not self.mesh.has_attribute("voxel_centroid"):
-                self.mesh.add_attribute("voxel_centroid");
-            self.base_points = self.mesh.get_attribute("voxel_centroid")\
-                    .reshape((-1, 3));
+            self.base_points = get_derived_attribute(self.mesh,
+                    "voxel_centroid").reshape((-1, 3));
         else:
             raise NotImplementedError("Unknown vector field type");
 
     def load_base_point_normals(self):
         if len(self.vector_field) == self.mesh.num_vertices:
-            if not self.mesh.has_attribute("vertex_normal"):
-                self.mesh.add_attribute("vertex_normal");
-            self.base_point_normals = self.mesh.get_vertex_attribute(
-                    "vertex_normal");
+            self.base_point_normals = get_derived_attribute(self.mesh,
+                    "vertex_normal").reshape((-1, 3));
         elif len(self.vector_field) == self.mesh.num_faces:
-            if not self.mesh.has_attribute("face_normal"):
-                self.mesh.add_attribute("face_normal")
-            self.base_point_normals = self.mesh.get_face_attribute(
-                    "face_normal");
+            self.base_point_normals = get_derived_attribute(self.mesh,
+                    "face_normal").reshape((-1, 3));
         elif len(self.vector_field) == self.mesh.num_voxels:
             raise NotImplementedError(
                     "base point normal of per voxel vector field is not supported");
@@ -129,5 +121,5 @@ class VectorView(ViewDecorator):
 
     @color_map.setter
     def color_map(self, val):
-        self.__color_map = ColorMap(val);
+        self.__color_map = get_color_map(val);
 
@@ -2,6 +2,10 @@ import os.path
 import numpy as np
 from numpy.linalg import norm
 
+from pyrender.color.ColorField import ColorField
+from pyrender.misc.indexed_field import IndexedField
+from pyrender.primitives.PrimitiveBatch import PrimitiveBatch
+
 class View(object):
     @classmethod
     def create_from_setting(cls, setting):
@@ -81,10 +85,31 @@ class View(object):
             0.0, 0.0, 0.0]); # translation vector
         self.transform = np.copy(self.default_transform);
         self.alpha = 1.0;
-        self.primitives = [];
+        self.primitives = PrimitiveBatch();
         self.subviews = [];
         self.line_width = 0.002;
 
+    def adapt_to_camera(self, camera, global_transform=None):
+        """ Called by Scene whenever the active camera, the output size or
+        the global transform changes.  Views with resolution dependent
+        primitives regenerate them here.  Calling it again with the same
+        arguments must not change anything.
+        """
+        for view in self.subviews:
+            view.adapt_to_camera(camera, global_transform);
+
+    def get_pixel_size(self, camera, global_transform=None):
+        """ Size of one output pixel in the coordinates of this view, measured
+        at the look at point of camera.  global_transform is the 4x4 scene
+        transform applied on top of the view transform.
+        """
+        transform_scale = abs(np.linalg.det(self.rotation)) ** (1.0 / 3.0);
+        if global_transform is not None:
+            transform_scale *= abs(np.linalg.det(
+                global_transform[:3, :3])) ** (1.0 / 3.0);
+        return camera.get_pixel_size(self.height) /\
+                (self.scale * transform_scale);
+
     def __validate_transform_field(self):
         if len(self.transform) != 12:
             raise RuntimeError("transform field is ill-formated.");
@@ -109,6 +134,17 @@ class View(object):
     def face_normals(self):
         raise NotImplementedError("Calling abstract method");
 
+    @property
+    def vertex_normal_field(self):
+        """ Vertex normals as an IndexedField.  Views that store normals per
+        vertex should override this to avoid corner arrays.
+        """
+        return IndexedField.per_corner(self.vertex_normals, self.faces);
+
+    @property
+    def face_normal_field(self):
+        return IndexedField.per_corner(self.face_normals, self.faces);
+
     @property
     def use_smooth_normal(self):
         raise NotImplementedError("Calling abstract method");
@@ -117,6 +153,13 @@ class View(object):
     def vertex_colors(self):
         raise NotImplementedError("Calling abstract method");
 
+    @property
+    def color_field(self):
+        """ Colors as a ColorField.  Views that know their colors are uniform
+        or per element should override this to avoid corner arrays.
+        """
+        return ColorField.per_corner(self.vertex_colors, self.faces);
+
     @property
     def with_colors(self):
         return False;
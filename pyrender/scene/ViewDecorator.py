@@ -1,10 +1,15 @@
 from copy import deepcopy
 import numpy as np
+from pyrender.color.ColorField import ColorField
+from pyrender.misc.indexed_field import IndexedField
+from pyrender.primitives.PrimitiveBatch import PrimitiveBatch
+from .CornerFieldCache import CornerFieldCache
 from .MeshView import MeshView
 
 class ViewDecorator(MeshView):
     def __init__(self, view):
         self.view = view;
+        self.corner_fields = CornerFieldCache();
 
         # Deep copy all view properties.
         #self.transform = deepcopy(self.view.transform);
@@ -15,8 +20,57 @@ class ViewDecorator(MeshView):
         """
         return getattr(self.view, name);
 
+    def adapt_to_camera(self, camera, global_transform=None):
+        """ Adapt the nested view first.  Primitives are regenerated when
+        the nested view replaced the primitives copied by reset_primitives()
+        or when adapt_primitive_size() asks for it.
+        """
+        self.view.adapt_to_camera(camera, global_transform);
+        resized = self.adapt_primitive_size(camera, global_transform);
+        if resized or self.nested_primitives_changed:
+            self.generate_primitives();
+
+    def adapt_primitive_size(self, camera, global_transform=None):
+        """ Decorators with resolution dependent primitives update their
+        size here and return True if the primitives must be regenerated.
+        """
+        return False;
+
+    def reset_primitives(self):
+        """ Start a new primitive batch holding the primitives of the nested
+        view.  Decorators that generate primitives call this first, so that
+        regenerating them does not add duplicates.
+        """
+        self.__nested_primitives = self.view.primitives;
+        self.primitives = PrimitiveBatch();
+        self.primitives.extend(self.__nested_primitives);
+
+    @property
+    def nested_primitives_changed(self):
+        """ Whether the nested view has a new primitive batch since the last
+        reset_primitives().
+        """
+        # Read from __dict__, a missing attribute would be forwarded to the
+        # nested view.
+        nested_primitives = self.__dict__.get(
+                "_ViewDecorator__nested_primitives", None);
+        return nested_primitives is not None and \
+                nested_primitives is not self.view.primitives;
+
     # The following overwrite the defined properties of MeshView class.
 
+    @property
+    def mesh(self):
+        if "_mesh" not in self.__dict__:
+            return self.view.mesh;
+        else:
+            return self._mesh;
+
+    @mesh.setter
+    def mesh(self, value):
+        self._mesh = value;
+        self.corner_fields.invalidate();
+
     @property
     def vertices(self):
         if not hasattr(self, "_vertices"):
@@ -38,6 +92,7 @@ class ViewDecorator(MeshView):
     @faces.setter
     def faces(self, value):
         self._faces = value;
+        self.corner_fields.invalidate();
 
     @property
     def voxels(self):
@@ -60,6 +115,7 @@ class ViewDecorator(MeshView):
     @vertex_normals.setter
     def vertex_normals(self, value):
         self._vertex_normals = value;
+        self.corner_fields.invalidate("vertex_normal_field");
 
     @property
     def face_normals(self):
@@ -71,6 +127,25 @@ class ViewDecorator(MeshView):
     @face_normals.setter
     def face_normals(self, value):
         self._face_normals = value;
+        self.corner_fields.invalidate("face_normal_field");
+
+    @property
+    def vertex_normal_field(self):
+        if not hasattr(self, "_vertex_normals"):
+            return self.view.vertex_normal_field;
+        else:
+            return self.corner_fields.get("vertex_normal_field",
+                    lambda: IndexedField.per_corner(self._vertex_normals,
+                        self.faces));
+
+    @property
+    def face_normal_field(self):
+        if not hasattr(self, "_face_normals"):
+            return self.view.face_normal_field;
+        else:
+            return self.corner_fields.get("face_normal_field",
+                    lambda: IndexedField.per_corner(self._face_normals,
+                        self.faces));
 
     @property
     def vertex_colors(self):
@@ -82,6 +157,16 @@ class ViewDecorator(MeshView):
     @vertex_colors.setter
     def vertex_colors(self, value):
         self._vertex_colors = value;
+        self.corner_fields.invalidate("color_field");
+
+    @property
+    def color_field(self):
+        if not hasattr(self, "_vertex_colors"):
+            return self.view.color_field;
+        else:
+            return self.corner_fields.get("color_field",
+                    lambda: ColorField.per_corner(self._vertex_colors,
+                        self.faces));
 
     @property
     def transform(self):
@@ -99,6 +184,8 @@ class ViewDecorator(MeshView):
             raise RuntimeError("Unknow transform field format: {}".format(val));
 
         assert(len(self.transform) == 12);
+        self.corner_fields.invalidate("vertex_normal_field",
+                "face_normal_field");
 
     @property
     def rotation(self):
@@ -165,6 +252,7 @@ class ViewDecorator(MeshView):
     @alpha.setter
     def alpha(self, val):
         self.view.alpha = val;
+        self.corner_fields.invalidate("color_field");
 
     @property
     def subviews(self):
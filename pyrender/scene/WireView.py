@@ -1,8 +1,8 @@
 import numpy as np
 from numpy.linalg import norm
+import random
 from pyrender.color.Color import get_color, Color
-from pyrender.color.ColorMap import ColorMap
-from pyrender.primitives.Primitive import Cylinder, Cone, Sphere
+from pyrender.color.ColorMap import get_color_map
 import pymesh
 
 from .View import View
@@ -19,8 +19,14 @@ class WireView(View):
             "bbox": [[min_x, min_y, min_z], [max_x, max_y, max_z]]
         }
         """
-        wire_file = setting["wire_network"];
-        instance = WireView(wire_file);
+        return cls.create_from_wire_network(setting["wire_network"], setting);
+
+    @classmethod
+    def create_from_wire_network(cls, wires, setting):
+        """ Same as create_from_setting() except the wire network is given
+        directly and setting["wire_network"] is not needed.
+        """
+        instance = WireView(wires);
         instance.color_name = setting.get("color", None);
         instance.radius = setting.get("radius", 0.1);
         if "bbox" in setting:
@@ -30,10 +36,15 @@ class WireView(View):
         instance.generate_primitives();
         return instance;
 
-    def __init__(self, wire_file):
+    def __init__(self, wires):
+        """ wires is either a wire file name or a pymesh WireNetwork.
+        """
         super(WireView, self).__init__();
-        self.wires = pymesh.wires.WireNetwork();
-        self.wires.load_from_file(wire_file);
+        if not isinstance(wires, pymesh.wires.WireNetwork):
+            wire_file = wires;
+            wires = pymesh.wires.WireNetwork();
+            wires.load_from_file(wire_file);
+        self.wires = wires;
         self.__init_wires();
 
     def __init_wires(self):
@@ -53,25 +64,13 @@ class WireView(View):
         if self.color_name is None:
             self.color = get_color("nylon_white");
         elif self.color_name == "random":
-            self.color = ColorMap("RdYlBu").get_color(
+            self.color = get_color_map("RdYlBu").get_color(
                     random.choice([0.1, 0.3, 0.5, 0.7, 0.9]));
         else:
             self.color = get_color(self.color_name);
 
-        self.wires.add_attribute("edge_length");
-        vertices = self.wires.vertices;
-        edges = self.wires.edges;
-        lengths = self.wires.get_attribute("edge_length");
-        for v in vertices:
-            ball = Sphere(v, self.radius);
-            ball.color = self.color;
-            self.primitives.append(ball);
-
-        for e,l in zip(edges, lengths):
-            if l <= 0.1 * self.radius : continue;
-            cylinder = Cylinder(vertices[e[0]], vertices[e[1]], self.radius);
-            cylinder.color = self.color;
-            self.primitives.append(cylinder);
+        self.primitives.add_wires(self.wires.vertices, self.wires.edges,
+                self.radius, self.color, min_length=0.1 * self.radius);
 
     @property
     def vertices(self):
@@ -18,9 +18,11 @@ def render_with_povray(scene):
     renderer.render();
 
 def render_with_mitsuba(scene):
+    """ Render all views of the scene with a single Mitsuba session.
+    """
     from pyrender.renderer.RendererFactory import RendererFactory
-    renderer = RendererFactory.create_Mitsuba_renderer_from_scene(scene);
-    renderer.render();
+    with RendererFactory.create_Mitsuba_session_from_scene(scene) as session:
+        session.render_all();
 
 def create_scene_from_arguments(args):
     assert(args.mesh is not None);
@@ -62,6 +64,8 @@ def update_scene_with_arguments(scene, args):
             front_dir = args.front_direction,
             facing_camera = args.facing_camera,
             head_on = args.head_on);
+    # Output size and orientation may have changed.
+    scene.adapt_views_to_camera();
     return scene;
 
 def parse_arguments():
@@ -123,6 +127,10 @@ def main():
         scene.output_dir = args.output;
         if not os.path.exists(args.output):
             os.makedirs(args.output);
+    if args.renderer == "mitsuba":
+        render_with_mitsuba(scene);
+        return;
+
     for i in range(len(scene.views)):
         scene.activate_view(i);
         assert(scene.active_view == scene.views[i]);
@@ -131,8 +139,6 @@ def main():
             render_with_opengl(scene);
         elif args.renderer == "povray":
             render_with_povray(scene);
-        elif args.renderer == "mitsuba":
-            render_with_mitsuba(scene);
 
 if __name__ == "__main__":
     main();
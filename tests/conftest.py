@@ -0,0 +1,10 @@
+import sys
+import types
+
+# The scene modules import pymesh at module level.  Tests only exercise
+# code that does not call into it, so an empty module is enough when pymesh
+# is not installed.
+try:
+    import pymesh
+except ImportError:
+    sys.modules["pymesh"] = types.ModuleType("pymesh");
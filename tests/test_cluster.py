@@ -0,0 +1,48 @@
+import numpy as np
+
+from pyrender.misc.cluster import Cluster
+
+def run_cluster(points, normals, vectors, num_processes=1,
+        max_pairs_per_chunk=None):
+    cluster = Cluster(points);
+    cluster.use_normals(normals);
+    cluster.use_vectors(vectors);
+    cluster.num_processes = num_processes;
+    if max_pairs_per_chunk is not None:
+        cluster.max_pairs_per_chunk = max_pairs_per_chunk;
+    cluster.run(0.1);
+    return cluster;
+
+def random_data(num_points, seed=0):
+    random = np.random.RandomState(seed);
+    points = random.rand(num_points, 3);
+    normals = random.randn(num_points, 3);
+    normals /= np.linalg.norm(normals, axis=1)[:, None];
+    vectors = random.randn(num_points, 3);
+    return points, normals, vectors;
+
+def test_empty():
+    cluster = run_cluster(*random_data(0));
+    assert(len(cluster.labels) == 0);
+    assert(cluster.seeds == []);
+    assert(cluster.clusters == []);
+
+def test_clusters_match_seeds():
+    cluster = run_cluster(*random_data(2000));
+    clusters = cluster.clusters;
+    assert(len(clusters) == len(cluster.seeds));
+    for i, indices in enumerate(clusters):
+        assert(np.all(cluster.labels[indices] == i));
+    assigned = np.sum(cluster.labels >= 0);
+    assert(sum(len(indices) for indices in clusters) == assigned);
+
+def test_same_result_with_pool_and_chunks():
+    data = random_data(2000);
+    expected = run_cluster(*data);
+    for num_processes, max_pairs_per_chunk in [(1, 7), (3, None), (3, 7)]:
+        cluster = run_cluster(*data, num_processes=num_processes,
+                max_pairs_per_chunk=max_pairs_per_chunk);
+        assert(np.array_equal(cluster.labels, expected.labels));
+        assert(np.allclose(cluster.seed_points, expected.seed_points));
+        assert(np.allclose(cluster.seed_normals, expected.seed_normals));
+        assert(np.allclose(cluster.seed_vectors, expected.seed_vectors));
@@ -0,0 +1,19 @@
+import numpy as np
+
+from pyrender.color.ColorMap import ColorMap
+
+def test_table_matches_interpolation():
+    values = np.linspace(-0.5, 1.5, 1001);
+    exact = ColorMap("jet").get_colors(values);
+    table = ColorMap("jet", 4096).get_colors(values);
+    assert(table.shape == (1001, 4));
+    assert(np.allclose(exact, table, atol=1e-3));
+
+def test_non_finite_values():
+    for resolution in [None, 4096]:
+        color_map = ColorMap("jet", resolution);
+        colors = color_map.get_colors([0.1, np.nan, np.inf, -np.inf]);
+        assert(np.all(np.isfinite(colors[0])));
+        assert(np.all(np.isnan(colors[1])));
+        assert(np.allclose(colors[2], color_map.get_colors([1.0])[0]));
+        assert(np.allclose(colors[3], color_map.get_colors([0.0])[0]));
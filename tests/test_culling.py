@@ -0,0 +1,85 @@
+import numpy as np
+
+from pyrender.primitives.PrimitiveBatch import PrimitiveBatch
+from pyrender.renderer.culling import cull_primitives
+from pyrender.scene.Camera import Camera
+
+def create_camera():
+    camera = Camera();
+    camera.location = [0.0, 0.0, 5.0];
+    camera.look_at_point = [0.0, 0.0, 0.0];
+    camera.up_direction = [0.0, 1.0, 0.0];
+    camera.update();
+    return camera;
+
+def create_spheres(centers, radius):
+    batch = PrimitiveBatch();
+    centers = np.array(centers, dtype=float);
+    batch.add_spheres(centers, np.full(len(centers), radius));
+    return batch;
+
+def test_outside_of_frustum():
+    spheres = create_spheres([[0.0, 0.0, 0.0], [100.0, 0.0, 0.0],
+        [0.0, 0.0, 10.0]], 0.1);
+    culled, num_outside, num_merged = cull_primitives(spheres,
+            create_camera(), np.eye(4), 100, 100);
+    assert(num_outside == 2);
+    assert(num_merged == 0);
+    assert(len(culled) == 1);
+    assert(np.allclose(culled.p0, [[0.0, 0.0, 0.0]]));
+
+def test_crop_bbox():
+    spheres = create_spheres([[-0.5, 0.0, 0.0], [0.5, 0.0, 0.0]], 0.1);
+    # Left half of the image, in relative and in pixel coordinates.
+    for crop_bbox in [[[0.0, 0.0], [0.5, 1.0]], [[0, 0], [50, 100]]]:
+        culled, num_outside, num_merged = cull_primitives(spheres,
+                create_camera(), np.eye(4), 100, 100, crop_bbox);
+        assert(num_outside == 1);
+        assert(np.allclose(culled.p0, [[-0.5, 0.0, 0.0]]));
+
+def test_merge_sub_pixel_primitives():
+    spheres = create_spheres([[0.0, 0.0, 0.0], [0.0, 0.0, 1.0],
+        [0.0, 0.5, 0.0]], 1e-5);
+    culled, num_outside, num_merged = cull_primitives(spheres,
+            create_camera(), np.eye(4), 100, 100);
+    assert(num_outside == 0);
+    assert(num_merged == 1);
+    # The primitive closer to the camera is kept.
+    assert(np.allclose(culled.p0, [[0.0, 0.0, 1.0], [0.0, 0.5, 0.0]]));
+
+def test_keep_outside_of_frustum():
+    # Tiny primitives outside of the image are not merged either.
+    spheres = create_spheres([[0.0, 0.0, 0.0], [0.0, 0.0, 1.0],
+        [100.0, 0.0, 0.0], [100.0, 0.0, 1e-6]], 1e-5);
+    culled, num_outside, num_merged = cull_primitives(spheres,
+            create_camera(), np.eye(4), 100, 100, cull_outside=False);
+    assert(num_outside == 0);
+    assert(num_merged == 1);
+    assert(np.allclose(culled.p0, [[0.0, 0.0, 1.0], [100.0, 0.0, 0.0],
+        [100.0, 0.0, 1e-6]]));
+
+def test_min_pixels_zero_keeps_everything():
+    spheres = create_spheres([[0.0, 0.0, 0.0], [0.0, 0.0, 1.0]], 1e-5);
+    culled, num_outside, num_merged = cull_primitives(spheres,
+            create_camera(), np.eye(4), 100, 100, min_pixels=0.0);
+    assert(num_merged == 0);
+    assert(len(culled) == 2);
+
+def test_subset():
+    batch = PrimitiveBatch();
+    batch.add_spheres(np.random.rand(3, 3), np.random.rand(3));
+    batch.add_cylinders(np.random.rand(2, 3), np.random.rand(2, 3),
+            np.random.rand(2));
+    mask = np.array([True, False, True, True, False]);
+    for selection in [mask, np.flatnonzero(mask)]:
+        subset = batch.subset(selection);
+        assert(len(subset) == 3);
+        assert(np.array_equal(subset.types, batch.types[mask]));
+        assert(np.array_equal(subset.p0, batch.p0[mask]));
+        assert(np.array_equal(subset.p1, batch.p1[mask]));
+        assert(np.array_equal(subset.radii, batch.radii[mask]));
+        assert(np.array_equal(subset.colors, batch.colors[mask]));
+
+    full = batch.subset(np.arange(len(batch)));
+    assert(np.array_equal(full.p0, batch.p0));
+    assert(np.array_equal(full.colors, batch.colors));
@@ -0,0 +1,61 @@
+import numpy as np
+import pytest
+
+from pyrender.color.ColorField import ColorField
+from pyrender.misc.indexed_field import IndexedField
+
+FACES = np.array([[0, 1, 2], [0, 2, 3], [3, 2, 4]]);
+NUM_VERTICES = 5;
+
+def test_vertex_field():
+    scalars = np.arange(NUM_VERTICES, dtype=float);
+    field = IndexedField.per_vertex(scalars, FACES);
+    # Same as the former vertex case of ScalarView's corner conversion.
+    assert(np.array_equal(field.to_corners().ravel(), scalars[FACES].ravel()));
+    assert(np.array_equal(field.to_vertices(NUM_VERTICES), scalars));
+
+    normals = np.random.rand(NUM_VERTICES, 3);
+    field = IndexedField.per_vertex(normals, FACES);
+    assert(np.array_equal(field.to_corners().reshape((-1, 3)),
+        normals[FACES.ravel(order="C")]));
+
+def test_face_field():
+    scalars = np.arange(len(FACES), dtype=float);
+    field = IndexedField.per_face(scalars, FACES);
+    assert(np.array_equal(field.to_corners().ravel(),
+        np.repeat(scalars, FACES.shape[1])));
+    assert(field.to_vertices(NUM_VERTICES) is None);
+
+    normals = np.random.rand(len(FACES), 3);
+    field = IndexedField.per_face(normals, FACES);
+    assert(np.array_equal(field.to_corners().reshape((-1, 3)),
+        np.repeat(normals, FACES.shape[1], axis=0)));
+
+def test_uniform_field():
+    color = np.array([0.1, 0.2, 0.3, 1.0]);
+    field = ColorField.uniform(color, FACES);
+    expected = np.empty(FACES.shape + (4,));
+    expected[:,:] = color;
+    assert(field.is_uniform);
+    assert(np.array_equal(field.uniform_color, color));
+    assert(np.array_equal(field.to_corners(), expected));
+    assert(np.array_equal(field.to_vertices(NUM_VERTICES),
+        np.tile(color, (NUM_VERTICES, 1))));
+
+def test_corner_field():
+    colors = np.random.rand(FACES.size, 4);
+    field = ColorField.per_corner(colors, FACES);
+    assert(field.to_corners().shape == FACES.shape + (4,));
+    assert(np.array_equal(field.to_corners().reshape((-1, 4)), colors));
+    assert(field.to_vertices(NUM_VERTICES) is None);
+
+def test_map_keeps_domain_and_type():
+    field = ColorField.per_face(np.random.rand(len(FACES), 4), FACES);
+    mapped = field.map(lambda values: values * 0.5);
+    assert(isinstance(mapped, ColorField));
+    assert(mapped.domain == IndexedField.FACE);
+    assert(np.allclose(mapped.values, field.values * 0.5));
+
+def test_unknown_domain():
+    with pytest.raises(ValueError):
+        IndexedField("voxel", np.zeros(2), FACES);
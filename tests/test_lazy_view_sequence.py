@@ -0,0 +1,49 @@
+import pytest
+
+from pyrender.scene.LazyViewSequence import LazyViewSequence
+
+class FrameView(object):
+    def __init__(self, index):
+        self.index = index;
+        self.width = 800;
+        self.camera = None;
+
+    def adapt_to_camera(self, camera, global_transform=None):
+        self.camera = camera;
+
+def create_sequence(num_views, created):
+    def create_views():
+        for i in range(num_views):
+            created.append(i);
+            yield FrameView(i);
+    return LazyViewSequence(create_views, num_views);
+
+def test_views_are_created_on_demand():
+    created = [];
+    views = create_sequence(3, created).proxies;
+    assert(len(views) == 3);
+    assert(created == []);
+    for i, view in enumerate(views):
+        assert(view.index == i);
+        assert(view.index == i);
+    assert(created == [0, 1, 2]);
+
+    # Going back restarts the iteration.
+    assert(views[1].index == 1);
+    assert(created == [0, 1, 2, 0, 1]);
+    with pytest.raises(IndexError):
+        create_sequence(3, created).get(3);
+
+def test_settings_are_replayed():
+    views = create_sequence(2, []).proxies;
+    for view in views:
+        view.width = 100;
+        view.adapt_to_camera("camera");
+    assert(views[0].width == 100);
+    assert(views[0].camera == "camera");
+    assert(views[1].width == 100);
+    views[1].adapt_to_camera("other camera");
+    assert(views[1].camera == "other camera");
+    # View 0 is created again with the recorded settings.
+    assert(views[0].width == 100);
+    assert(views[0].camera == "camera");
@@ -0,0 +1,156 @@
+import os
+
+import numpy as np
+import pytest
+
+from pyrender.misc import mesh_cache
+from pyrender.misc.mesh_attributes import get_derived_attribute
+from pyrender.misc.mesh_cache import MeshCache
+
+class FakeMesh(object):
+    def __init__(self, num_vertices):
+        self.vertices = np.zeros((num_vertices, 3));
+        self.faces = np.zeros((0, 3), dtype=int);
+        self.voxels = np.zeros((0, 4), dtype=int);
+        self.attributes = {};
+
+    @property
+    def num_vertices(self):
+        return len(self.vertices);
+
+    @property
+    def num_voxels(self):
+        return len(self.voxels);
+
+    @property
+    def dim(self):
+        return self.vertices.shape[1];
+
+    @property
+    def bbox(self):
+        return np.amin(self.vertices, axis=0), np.amax(self.vertices, axis=0);
+
+    @property
+    def attribute_names(self):
+        return list(self.attributes.keys());
+
+    def has_attribute(self, name):
+        return name in self.attributes;
+
+    def add_attribute(self, name):
+        """ Every derived attribute is a vector per vertex.
+        """
+        self.attributes[name] = np.zeros(self.num_vertices * 3);
+
+    def get_attribute(self, name):
+        return self.attributes[name];
+
+    def set_attribute(self, name, values):
+        self.attributes[name] = values;
+
+def form_mesh(vertices, faces, voxels=None):
+    mesh = FakeMesh(0);
+    mesh.vertices = vertices;
+    mesh.faces = faces;
+    if voxels is not None:
+        mesh.voxels = voxels;
+    return mesh;
+
+@pytest.fixture
+def loads(monkeypatch):
+    """ Record the files loaded by pymesh.load_mesh.  Each mesh is 240 bytes.
+    """
+    loads = [];
+    def load_mesh(mesh_file):
+        loads.append(mesh_file);
+        return FakeMesh(10);
+    monkeypatch.setattr(mesh_cache.pymesh, "load_mesh", load_mesh,
+            raising=False);
+    return loads;
+
+@pytest.fixture
+def mesh_files(tmpdir):
+    files = [];
+    for name in ["a.obj", "b.obj", "c.obj"]:
+        mesh_file = tmpdir.join(name);
+        mesh_file.write("mesh");
+        files.append(str(mesh_file));
+    return files;
+
+def test_shared_mesh(loads, mesh_files):
+    cache = MeshCache();
+    mesh = cache.load(mesh_files[0]);
+    relative = os.path.relpath(mesh_files[0]);
+    assert(cache.load(relative) is mesh);
+    assert(len(loads) == 1);
+    assert(cache.is_shared(mesh));
+    assert(not cache.is_shared(FakeMesh(10)));
+    assert(cache.stats["hits"] == 1);
+
+def test_reload_modified_file(loads, mesh_files):
+    cache = MeshCache();
+    mesh = cache.load(mesh_files[0]);
+    stat = os.stat(mesh_files[0]);
+    os.utime(mesh_files[0], (stat.st_atime, stat.st_mtime + 10));
+    assert(cache.load(mesh_files[0]) is not mesh);
+    assert(len(loads) == 2);
+
+def test_lru_eviction(loads, mesh_files):
+    a, b, c = mesh_files;
+    cache = MeshCache(budget=500);
+    mesh_a = cache.load(a);
+    cache.load(b);
+    assert(cache.load(a) is mesh_a);
+    # b is the least recently used mesh.
+    cache.load(c);
+    assert(cache.stats["evictions"] == 1);
+    assert(cache.load(a) is mesh_a);
+    assert(len(loads) == 3);
+    cache.load(b);
+    assert(len(loads) == 4);
+    assert(cache.size <= 500);
+
+def test_attributes_count_towards_budget(loads, mesh_files):
+    a, b, c = mesh_files;
+    cache = MeshCache(budget=500);
+    mesh_a = cache.load(a);
+    mesh_a.attributes["vertex_normal"] = np.zeros(30);
+    cache.load(b);
+    assert(cache.stats["evictions"] == 1);
+    assert(not cache.is_shared(mesh_a));
+
+def test_derived_attributes_are_charged(loads, mesh_files, monkeypatch):
+    a, b, c = mesh_files;
+    cache = MeshCache(budget=500);
+    monkeypatch.setattr(mesh_cache, "_mesh_cache", cache);
+    cache.load(a);
+    mesh_b = cache.load(b);
+    normals = get_derived_attribute(mesh_b, "vertex_normal");
+    assert(len(normals) == 30);
+    assert(cache.stats["evictions"] == 1);
+    assert(cache.size == 480);
+    assert(cache.is_shared(mesh_b));
+    # Existing attributes are returned as is.
+    assert(get_derived_attribute(mesh_b, "vertex_normal") is normals);
+
+def test_writable_mesh_is_not_shared(loads, mesh_files, monkeypatch):
+    from pyrender.scene.MeshView import MeshView, pymesh
+    monkeypatch.setattr(mesh_cache, "_mesh_cache", MeshCache());
+    monkeypatch.setattr(pymesh, "Mesh", FakeMesh, raising=False);
+    monkeypatch.setattr(pymesh, "form_mesh", form_mesh, raising=False);
+    view = MeshView(mesh_files[0]);
+    other_view = MeshView(mesh_files[0]);
+    assert(view.mesh is other_view.mesh);
+    assert(len(loads) == 1);
+    get_derived_attribute(view.mesh, "vertex_normal");
+
+    mesh = view.writable_mesh();
+    assert(mesh is view.mesh);
+    assert(mesh is not other_view.mesh);
+    assert(view.writable_mesh() is mesh);
+    mesh.vertices[:] = 1.0;
+    mesh.get_attribute("vertex_normal")[:] = 1.0;
+    assert(np.all(other_view.vertices == 0.0));
+    assert(np.all(other_view.mesh.get_attribute("vertex_normal") == 0.0));
+    with pytest.raises(ValueError):
+        other_view.vertices[0] = 1.0;
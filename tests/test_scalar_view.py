@@ -0,0 +1,58 @@
+import numpy as np
+
+from pyrender.scene.ScalarView import ScalarView
+
+class ScalarMesh(object):
+    """ Two triangles and an isolated vertex.
+    """
+    def __init__(self, values):
+        self.vertices = np.random.rand(5, 3);
+        self.faces = np.array([[0, 1, 2], [0, 2, 3]]);
+        self.voxels = np.zeros((0, 4), dtype=int);
+        self.attributes = {"scalar": np.array(values, dtype=float)};
+
+    @property
+    def num_vertices(self):
+        return len(self.vertices);
+
+    @property
+    def num_faces(self):
+        return len(self.faces);
+
+    @property
+    def num_voxels(self):
+        return len(self.voxels);
+
+    def has_attribute(self, name):
+        return name in self.attributes;
+
+    def get_attribute(self, name):
+        return self.attributes[name];
+
+class NestedView(object):
+    background = "n";
+    alpha = 1.0;
+
+    def __init__(self, mesh):
+        self.mesh = mesh;
+        self.faces = mesh.faces;
+
+def create_scalar_view(values, bounds):
+    view = ScalarView(NestedView(ScalarMesh(values)), "scalar");
+    view.discrete = False;
+    view.normalize = False;
+    view.color_map = "jet";
+    view.bounds = bounds;
+    view.update_vertex_color();
+    return view;
+
+def test_default_bounds_ignore_unreferenced_vertices():
+    view = create_scalar_view([1.0, 2.0, 3.0, 5.0, 100.0], [None, None]);
+    assert(np.allclose(view.scalar_field, [0.0, 0.25, 0.5, 1.0, 1.0]));
+
+    view = create_scalar_view([1.0, 2.0, 3.0, 5.0, -100.0], [None, 3.0]);
+    assert(np.allclose(view.scalar_field, [0.0, 0.5, 1.0, 1.0, 0.0]));
+
+def test_given_bounds():
+    view = create_scalar_view([1.0, 2.0, 3.0, 5.0, 100.0], [0.0, 10.0]);
+    assert(np.allclose(view.scalar_field, [0.1, 0.2, 0.3, 0.5, 1.0]));
@@ -0,0 +1,72 @@
+import os
+
+import pytest
+
+from pyrender.misc.scratch import ScratchStore
+
+def write_entry(num_bytes, writes=None):
+    def writer(path):
+        if writes is not None:
+            writes.append(path);
+        with open(path, 'wb') as fout:
+            fout.write(b"x" * num_bytes);
+    return writer;
+
+@pytest.fixture
+def root(tmpdir):
+    return str(tmpdir.join("scratch"));
+
+def set_mtime(path, mtime):
+    os.utime(path, (mtime, mtime));
+
+def test_dedupe(root):
+    store = ScratchStore(root, budget=1000);
+    writes = [];
+    path = store.store("a", ".bin", write_entry(10, writes));
+    assert(store.store("a", ".bin", write_entry(10, writes)) == path);
+    assert(len(writes) == 1);
+    assert(store.lookup("a", ".bin") == path);
+    assert(store.lookup("b", ".bin") is None);
+    assert(store.stats == {"hits": 2, "misses": 1, "evictions": 0});
+    assert(store.size == 10);
+
+def test_lru_eviction(root):
+    store = ScratchStore(root, budget=250);
+    path_a = store.store("a", ".bin", write_entry(100));
+    path_b = store.store("b", ".bin", write_entry(100));
+    set_mtime(path_a, 1);
+    set_mtime(path_b, 2);
+    # Using a makes b the least recently used entry.
+    store.lookup("a", ".bin");
+    path_c = store.store("c", ".bin", write_entry(100));
+    assert(os.path.exists(path_a));
+    assert(not os.path.exists(path_b));
+    assert(os.path.exists(path_c));
+    assert(store.stats["evictions"] == 1);
+    assert(store.size == 200);
+
+def test_existing_entries_are_indexed(root):
+    store = ScratchStore(root, budget=1000);
+    store.store("a", ".bin", write_entry(100));
+    store = ScratchStore(root, budget=1000);
+    assert(store.size == 100);
+    assert(store.lookup("a", ".bin") is not None);
+
+def test_pinned_entries_survive(root):
+    store = ScratchStore(root, budget=150);
+    with store.pinned():
+        paths = [store.store(key, ".bin", write_entry(100))
+                for key in ["a", "b", "c"]];
+        assert(all(os.path.exists(path) for path in paths));
+    assert(store.size <= 150);
+    assert(store.stats["evictions"] == 2);
+
+def test_clear_only_removes_entries(root):
+    store = ScratchStore(root, budget=1000);
+    path = store.store("a", ".bin", write_entry(10));
+    tmp_path = os.path.join(root, "tmp_0_b.bin");
+    write_entry(10)(tmp_path);
+    store.clear();
+    assert(not os.path.exists(path));
+    assert(os.path.exists(tmp_path));
+    assert(store.size == 0);
@@ -0,0 +1,94 @@
+""" Compare the vectorized arrow layout of VectorView with the former loop
+over Primitive objects.  Run this file directly to benchmark both.
+"""
+import time
+
+import numpy as np
+
+from pyrender.primitives.Primitive import Cylinder, Cone
+from pyrender.primitives.PrimitiveBatch import PrimitiveBatch
+from pyrender.scene.VectorView import VectorView
+
+class NestedView(object):
+    background = "n";
+    primitives = PrimitiveBatch();
+
+def create_view(num_vectors, head_based, seed=0):
+    random = np.random.RandomState(seed);
+    view = VectorView(NestedView(), "vector_field");
+    view.vector_field = random.randn(num_vectors, 3);
+    # Some arrows shorter than the head and some of zero length.
+    view.vector_field[::7] *= 0.05;
+    view.vector_field[::11] = 0.0;
+    view.base_points = random.rand(num_vectors, 3);
+    view.max_length = 0.1;
+    view.radius = view.max_length * 0.2;
+    view.stem_radius = view.radius * 0.5;
+    view.color_map = "jet";
+    view.head_based = head_based;
+    view.primitives = PrimitiveBatch();
+    return view;
+
+def create_arrows_with_loop(view):
+    """ The arrow layout before vectorization.
+    """
+    primitives = PrimitiveBatch();
+    magnitudes = np.linalg.norm(view.vector_field, axis=1);
+    scale = view.max_length / np.amax(magnitudes);
+    scaled_vectors = view.vector_field * scale;
+    magnitudes *= scale;
+
+    for v,p,l in zip(scaled_vectors, view.base_points, magnitudes):
+        if l < 1e-6: continue;
+        arrow_scale = l / view.max_length;
+
+        c = view.color_map.get_color(l/view.max_length).color;
+        v = v / l;
+        if l < view.radius:
+            if view.head_based:
+                arrow_head = Cone(p-v * l, p, l * arrow_scale);
+            else:
+                arrow_head = Cone(p, p+v * l, l * arrow_scale);
+            arrow_head.color = c;
+            primitives.append(arrow_head);
+        else:
+            if view.head_based:
+                p2 = p - v * view.radius;
+                arrow_body = Cylinder(p2, p-v*l,
+                        view.stem_radius * arrow_scale);
+                arrow_head = Cone(p2, p,
+                        view.radius * arrow_scale);
+            else:
+                p2 = p + v*(l - view.radius);
+                arrow_body = Cylinder(p, p2,
+                        view.stem_radius * arrow_scale);
+                arrow_head = Cone(p2, p+v*l,
+                        view.radius * arrow_scale);
+            arrow_body.color = c;
+            arrow_head.color = c;
+            primitives.append(arrow_body);
+            primitives.append(arrow_head);
+    return primitives;
+
+def test_same_arrows_as_loop():
+    for head_based in [False, True]:
+        view = create_view(500, head_based);
+        view.create_arrows();
+        expected = create_arrows_with_loop(view);
+        assert(len(view.primitives) == len(expected));
+        for primitive_type in [PrimitiveBatch.CYLINDER, PrimitiveBatch.CONE]:
+            for a, b in zip(view.primitives.select(primitive_type),
+                    expected.select(primitive_type)):
+                assert(np.allclose(a, b));
+
+if __name__ == "__main__":
+    for num_vectors in [10000, 100000]:
+        view = create_view(num_vectors, False);
+        start = time.time();
+        create_arrows_with_loop(view);
+        loop_time = time.time() - start;
+        start = time.time();
+        view.create_arrows();
+        vectorized_time = time.time() - start;
+        print("{:>8} vectors: loop {:.3f} s, vectorized {:.3f} s".format(
+            num_vectors, loop_time, vectorized_time));
@@ -0,0 +1,75 @@
+import numpy as np
+
+from pyrender.primitives.PrimitiveBatch import PrimitiveBatch
+from pyrender.scene.ViewDecorator import ViewDecorator
+
+class AutoGlyphView(object):
+    """ Nested view whose primitives depend on the camera.
+    """
+    background = "n";
+
+    def __init__(self):
+        self.primitives = PrimitiveBatch();
+
+    def adapt_to_camera(self, camera, global_transform=None):
+        self.primitives = PrimitiveBatch();
+        self.primitives.add_spheres(np.zeros((1, 3)), np.array([camera]));
+
+class GlyphDecorator(ViewDecorator):
+    def __init__(self, nested_view):
+        super(GlyphDecorator, self).__init__(nested_view);
+        self.glyph_radius = 1.0;
+        self.num_generated = 0;
+
+    def generate_primitives(self):
+        self.reset_primitives();
+        self.primitives.add_spheres(np.ones((1, 3)),
+                np.array([self.glyph_radius]));
+        self.num_generated += 1;
+
+def test_nested_primitives_follow_camera():
+    view = GlyphDecorator(AutoGlyphView());
+    view.generate_primitives();
+    assert(len(view.primitives) == 1);
+
+    view.adapt_to_camera(0.5);
+    assert(len(view.primitives) == 2);
+    assert(np.allclose(sorted(view.primitives.radii), [0.5, 1.0]));
+
+    view.adapt_to_camera(0.25);
+    assert(np.allclose(sorted(view.primitives.radii), [0.25, 1.0]));
+    assert(view.num_generated == 3);
+
+def test_no_regeneration_without_changes():
+    nested_view = AutoGlyphView();
+    view = GlyphDecorator(nested_view);
+    view.generate_primitives();
+    assert(not view.nested_primitives_changed);
+    nested_view.adapt_to_camera(0.5);
+    assert(view.nested_primitives_changed);
+    view.generate_primitives();
+    assert(not view.nested_primitives_changed);
+
+def test_corner_fields_are_memoized():
+    nested_view = AutoGlyphView();
+    nested_view.faces = np.array([[0, 1, 2], [0, 2, 3]]);
+    view = GlyphDecorator(nested_view);
+    colors = np.random.rand(2, 3, 4);
+    view.vertex_colors = colors;
+    field = view.color_field;
+    assert(view.color_field is field);
+    assert(view.corner_fields.stats["hits"] == 1);
+    assert(np.array_equal(field.values, colors));
+    assert(not field.values.flags.writeable);
+    assert(colors.flags.writeable);
+
+    view.vertex_colors = np.random.rand(2, 3, 4);
+    assert(view.color_field is not field);
+    assert(np.array_equal(view.color_field.values, view.vertex_colors));
+
+    view.vertex_normals = np.random.rand(6, 3);
+    field = view.vertex_normal_field;
+    assert(view.vertex_normal_field is field);
+    assert(field.values.shape == (2, 3, 3));
+    view.faces = np.array([[0, 2, 1], [0, 3, 2]]);
+    assert(view.vertex_normal_field is not field);